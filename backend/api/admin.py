@@ -8,8 +8,29 @@ from .models import FitnessPlan, FitnessPlanUser, FitnessPlanExercise
 from .models import MealPlan, MealPlanUser, MealFood
 from .models import SubscriptionPlan
 from .models import CustomUser
+from .importers import IMPORTERS, detect_format
+from .exports import export_for_model, export_response
 
 from django import forms
+from django.contrib import messages
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+
+
+def export_action(format, compress=False):
+    """Admin action streaming the selected rows through the model's export in api/exports.py."""
+    def action(modeladmin, request, queryset):
+        export = export_for_model(modeladmin.model)
+        return export_response(request, export, export.select(), format, compress, queryset=queryset)
+    action.__name__ = f"export_{format}{'_gzip' if compress else ''}"
+    return admin.action(
+        description=f"Export selected rows as {format.upper()}{' (gzip)' if compress else ''}"
+    )(action)
+
+
+EXPORT_ACTIONS = [export_action('csv'), export_action('csv', compress=True), export_action('ndjson')]
 
 
 # Register your CustomUser with a custom admin interface
@@ -22,6 +43,7 @@ class CustomUserAdmin(UserAdmin):
     list_display = ['email', 'username', 'first_name', 'last_name', 'is_instructor', 'contact', 'specialization']
     search_fields = ['email', 'username']
     ordering = ['email']
+    actions = EXPORT_ACTIONS
 
     fieldsets = (
         (None, {'fields': ('email', 'username', 'password')}),
@@ -84,6 +106,7 @@ class ChallengeAdmin(admin.ModelAdmin):
 class ChallengeParticipantAdmin(admin.ModelAdmin):
     list_display = ('user', 'challenge', 'date_joined')
     search_fields = ('user__username', 'challenge__title')
+    actions = EXPORT_ACTIONS
 
 
 
@@ -155,13 +178,63 @@ class GoalsAdmin(admin.ModelAdmin):
 
 
 
+class CatalogueImportForm(forms.Form):
+    file = forms.FileField(help_text="A .csv, .ndjson or .jsonl file")
+    skip_existing = forms.BooleanField(required=False, help_text="Leave rows whose name already exists untouched")
+
+
+class CatalogueImportAdminMixin:
+    """Adds an "Import CSV / NDJSON" page to the change list, backed by api/importers.py."""
+    change_list_template = 'admin/api/catalogue_change_list.html'
+    importer = None
+
+    def get_urls(self):
+        opts = self.model._meta
+        return [
+            path('import/', self.admin_site.admin_view(self.import_view),
+                 name=f'{opts.app_label}_{opts.model_name}_import'),
+        ] + super().get_urls()
+
+    def import_view(self, request):
+        if not (self.has_add_permission(request) and self.has_change_permission(request)):
+            raise PermissionDenied
+        importer = IMPORTERS[self.importer]
+        form = CatalogueImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            upload = form.cleaned_data['file']
+            format = detect_format(upload.name)
+            if format is None:
+                form.add_error('file', "Upload a .csv, .ndjson or .jsonl file.")
+            else:
+                report = importer.run(upload.file, format, update_existing=not form.cleaned_data['skip_existing'])
+                self.message_user(request, report.summary(), messages.SUCCESS)
+                for line, errors in report.rejects:
+                    self.message_user(request, f"Line {line} rejected: {errors}", messages.WARNING)
+                if report.rejected > len(report.rejects):
+                    self.message_user(
+                        request, f"... and {report.rejected - len(report.rejects)} more rejected rows", messages.WARNING
+                    )
+                opts = self.model._meta
+                return redirect(reverse(f'admin:{opts.app_label}_{opts.model_name}_changelist'))
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': f"Import {self.model._meta.verbose_name_plural}",
+            'form': form,
+            'import_fields': importer.fields,
+        }
+        return TemplateResponse(request, 'admin/api/catalogue_import.html', context)
+
+
 @admin.register(Exercise)
-class ExerciseAdmin(admin.ModelAdmin):
+class ExerciseAdmin(CatalogueImportAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'muscle_group', 'difficulty', 'equipment', 'created_at')
     list_filter = ('muscle_group', 'difficulty', 'equipment', 'created_at')
     search_fields = ('name', 'description')
     ordering = ('-created_at',)
     readonly_fields = ('created_at',)
+    importer = 'exercises'
     
     fieldsets = (
         (None, {
@@ -178,9 +251,10 @@ class ExerciseAdmin(admin.ModelAdmin):
     
 
 @admin.register(Food)
-class FoodAdmin(admin.ModelAdmin):
+class FoodAdmin(CatalogueImportAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'carbs', 'protein', 'fat', 'calories_per_100g')
     list_filter = ('food_type',)
+    importer = 'foods'
 
     def calories_per_100g(self, obj):
         return round(obj.calories, 2)
@@ -317,6 +391,7 @@ class FitnessPlanUserAdmin(admin.ModelAdmin):
     search_fields = ('user__email', 'user__username', 'fitness_plan__name')
     date_hierarchy = 'joined_at'
     ordering = ('-joined_at',)
+    actions = EXPORT_ACTIONS
 
     def user_email(self, obj):
         return obj.user.email
@@ -337,6 +412,7 @@ class MealPlanUserAdmin(admin.ModelAdmin):
     search_fields = ('user__email', 'user__username', 'meal_plan__name')
     date_hierarchy = 'joined_at'
     ordering = ('-joined_at',)
+    actions = EXPORT_ACTIONS
 
     def user_email(self, obj):
         return obj.user.email
@@ -1,18 +1,26 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
 
 User = get_user_model()
 
-class EmailAuthBackend:
-    def authenticate(self, request, email=None, password=None, **kwargs):
-        try:
-            user = User.objects.get(email=email)
-            if user.check_password(password):
-                return user
-        except User.DoesNotExist:
-            return None
+class EmailAuthBackend(ModelBackend):
+    """
+    The only authentication backend: looks the user up once by email (the
+    USERNAME_FIELD, so the admin login works too) and hashes the password
+    exactly once. Unknown emails still run the hasher so response times do
+    not reveal which emails are registered.
+    """
 
-    def get_user(self, user_id):  # <- renamed to lowercase
+    def authenticate(self, request, email=None, password=None, username=None, **kwargs):
+        email = email or username or kwargs.get(User.USERNAME_FIELD)
+        if email is None or password is None:
+            return None
         try:
-            return User.objects.get(pk=user_id)
+            user = User._default_manager.get(email=email)
         except User.DoesNotExist:
+            User().set_password(password)
             return None
+        # check_password also re-hashes with PASSWORD_HASHERS[0] when it changed
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
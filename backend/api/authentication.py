@@ -0,0 +1,147 @@
+import binascii
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from knox.auth import TokenAuthentication
+from knox.crypto import hash_token
+from knox.models import AuthToken
+from knox.settings import knox_settings
+
+
+class TokenCache:
+    """
+    Bounded, thread-safe LRU of validated Knox tokens, keyed by token digest.
+
+    Entries live for AUTH_TOKEN_CACHE_TTL seconds at most (never past the
+    token's own expiry). The cache is per process: logout and user changes
+    evict entries in the process that handled them, and the TTL bounds how
+    long other processes can keep serving a revoked token.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._digests_by_user = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 60)
+
+    @property
+    def max_entries(self):
+        return getattr(settings, 'AUTH_TOKEN_CACHE_MAX_ENTRIES', 10000)
+
+    def get(self, digest):
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(digest)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def set(self, digest, user, auth_token):
+        if self.ttl <= 0:
+            return
+        lifetime = self.ttl
+        if auth_token.expiry is not None:
+            lifetime = min(lifetime, (auth_token.expiry - timezone.now()).total_seconds())
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._remove(digest)
+            self._entries[digest] = (time.monotonic() + lifetime, user, auth_token)
+            self._digests_by_user.setdefault(user.pk, set()).add(digest)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def evict(self, digest):
+        with self._lock:
+            self._remove(digest)
+
+    def evict_user(self, user_id):
+        with self._lock:
+            for digest in list(self._digests_by_user.get(user_id, ())):
+                self._remove(digest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._digests_by_user.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+    def _remove(self, digest):
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        user_id = entry[1].pk
+        digests = self._digests_by_user.get(user_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._digests_by_user[user_id]
+
+
+token_cache = TokenCache()
+
+
+def trim_user_tokens(user):
+    """
+    Delete the user's expired tokens and, beyond AUTH_TOKEN_LIMIT_PER_USER,
+    their oldest ones, so each login keeps the token table bounded.
+    """
+    limit = getattr(settings, 'AUTH_TOKEN_LIMIT_PER_USER', None)
+    stale = Q(expiry__lt=timezone.now())
+    if limit:
+        surplus = list(
+            AuthToken.objects.filter(user=user).order_by('-created').values_list('pk', flat=True)[limit:]
+        )
+        stale |= Q(pk__in=surplus)
+    AuthToken.objects.filter(stale, user=user).delete()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Knox token authentication that remembers validated tokens, so repeated
+    requests with the same token skip the token and user queries. Evicted by
+    the signals in api/signals.py on logout, logout-all and user changes.
+    """
+
+    def authenticate_credentials(self, token):
+        try:
+            digest = hash_token(token.decode('utf-8'))
+        except (TypeError, UnicodeError, binascii.Error):
+            return super().authenticate_credentials(token)
+
+        cached = token_cache.get(digest)
+        if cached is not None:
+            user, auth_token = cached
+            if knox_settings.AUTO_REFRESH and auth_token.expiry:
+                self.renew_token(auth_token)
+            # Hand out copies so a view mutating request.user cannot leak into the cache
+            return copy.copy(user), auth_token
+
+        user, auth_token = super().authenticate_credentials(token)
+        token_cache.set(digest, copy.copy(user), auth_token)
+        return user, auth_token
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import Challenge, EducationalContent, Exercise, FitnessPlan, FitnessPlanExercise, Food, MealFood, MealPlan
+
+# Catalogue response cache namespaces to invalidate when a model changes
+CACHE_NAMESPACES = {
+    Exercise: ['exercises', 'fitness-plans'],
+    Food: ['foods', 'meal-plans'],
+    FitnessPlan: ['fitness-plans'],
+    FitnessPlanExercise: ['fitness-plans'],
+    MealPlan: ['meal-plans'],
+    MealFood: ['meal-plans'],
+    Challenge: ['challenges'],
+    EducationalContent: ['content'],
+}
+
+
+def get_cache():
+    return caches[getattr(settings, 'CATALOGUE_CACHE_ALIAS', 'default')]
+
+
+def _version_key(namespace):
+    return f'catalogue:{namespace}:version'
+
+
+def _modified_key(namespace):
+    return f'catalogue:{namespace}:modified'
+
+
+def get_version(namespace):
+    cache = get_cache()
+    cache.add(_version_key(namespace), 1, timeout=None)
+    cache.add(_modified_key(namespace), int(time.time()), timeout=None)
+    return cache.get_many([_version_key(namespace), _modified_key(namespace)])
+
+
+def invalidate(*namespaces):
+    """Bump the version of the given namespaces so their cached responses are ignored."""
+    cache = get_cache()
+    now = int(time.time())
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            cache.add(_version_key(namespace), 1, timeout=None)
+        cache.set(_modified_key(namespace), now, timeout=None)
+
+
+class CachedResponseMixin:
+    """
+    Caches the list/retrieve responses of read-mostly viewsets.
+
+    Entries are keyed by namespace version, action, URL (path and query
+    params), host and renderer, so bumping the namespace version with
+    `invalidate()` retires every cached representation at once. Responses
+    carry an ETag and Last-Modified so clients can revalidate with 304s.
+    """
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cache_key(self, request, version):
+        parts = [
+            self.action,
+            request.get_host(),
+            request.get_full_path(),
+            request.accepted_renderer.format,
+        ]
+        digest = hashlib.md5('|'.join(parts).encode()).hexdigest()
+        return f'catalogue:{self.cache_namespace}:{version}:{digest}'
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        cache = get_cache()
+        state = get_version(self.cache_namespace)
+        version = state.get(_version_key(self.cache_namespace), 1)
+        last_modified = state.get(_modified_key(self.cache_namespace), int(time.time()))
+        key = self.get_cache_key(request, version)
+
+        entry = cache.get(key)
+        if entry is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            body = json.dumps(response.data, sort_keys=True, default=str)
+            entry = {
+                'data': response.data,
+                'etag': quote_etag(hashlib.md5(body.encode()).hexdigest()),
+                'last_modified': last_modified,
+            }
+            cache.set(key, entry, getattr(settings, 'CATALOGUE_CACHE_TIMEOUT', 300))
+
+        headers = {
+            'ETag': entry['etag'],
+            'Last-Modified': http_date(entry['last_modified']),
+            'Cache-Control': 'no-cache',
+        }
+        # Handles ETag lists, * and weak validators, and If-Modified-Since
+        response = get_conditional_response(request, etag=entry['etag'], last_modified=entry['last_modified'])
+        if response is not None:
+            for header, value in headers.items():
+                response[header] = value
+            return response
+        return Response(entry['data'], headers=headers)
@@ -0,0 +1,78 @@
+from asgiref.sync import async_to_sync
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from channels.layers import get_channel_layer
+from .serializers.chat import ChatMessageSerializer
+
+
+def user_group_name(user_id):
+    return f'chat_user_{user_id}'
+
+
+def _group_send(user_ids, event):
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    for user_id in set(user_ids):
+        async_to_sync(channel_layer.group_send)(user_group_name(user_id), event)
+
+
+def broadcast_message(message):
+    """Push a new ChatMessage to both participants."""
+    _group_send([message.sender_id, message.recipient_id], {
+        'type': 'chat.message',
+        'message': ChatMessageSerializer(message).data,
+    })
+
+
+def broadcast_read(sender_id, reader_id, message_ids=(), up_to=None):
+    """
+    Tell both participants that `reader_id` has read the given messages, or
+    every message from `sender_id` up to the id `up_to` (all of them when
+    neither is given).
+    """
+    _group_send([sender_id, reader_id], {
+        'type': 'chat.read',
+        'sender': sender_id,
+        'reader': reader_id,
+        'message_ids': list(message_ids),
+        'up_to': up_to,
+    })
+
+
+class ChatConsumer(AsyncJsonWebsocketConsumer):
+    """
+    One long-lived connection per client. New messages and read receipts of
+    every conversation the user takes part in are pushed as JSON events:
+
+        {"type": "message", "message": {...}}
+        {"type": "read", "reader": <user id>, "message_ids": [...], "up_to": <id or null>}
+    """
+
+    async def connect(self):
+        user = self.scope.get('user')
+        if user is None or not user.is_authenticated:
+            await self.close(code=4401)
+            return
+        self.group_name = user_group_name(user.id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        if content.get('type') == 'ping':
+            await self.send_json({'type': 'pong'})
+
+    async def chat_message(self, event):
+        await self.send_json({'type': 'message', 'message': event['message']})
+
+    async def chat_read(self, event):
+        await self.send_json({
+            'type': 'read',
+            'sender': event['sender'],
+            'reader': event['reader'],
+            'message_ids': event['message_ids'],
+            'up_to': event['up_to'],
+        })
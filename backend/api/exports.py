@@ -0,0 +1,213 @@
+"""
+Streaming CSV/NDJSON exports of users, plan memberships, challenge progress,
+chat volume and the analytics rollups.
+
+Rows are read in keyset batches (`WHERE key > last ORDER BY key LIMIT n`)
+rather than with QuerySet.iterator(): MySQL drivers buffer the whole result
+of an iterated query on the client, while a keyset batch is a cheap indexed
+query whatever the table size. Rows are encoded and optionally gzipped as
+they are read, so an export takes constant memory however many rows it has.
+"""
+import csv
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
+from django.http import StreamingHttpResponse
+from django.db.models.functions import TruncDate
+
+from .models import ChallengeParticipant, ChatMessage, CustomUser, DailyMetric, FitnessPlanUser, MealPlanUser
+from .models.progress import decode_progress
+from .streaming import buffered, streaming_content
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Column:
+    """An export column: `source` is the values_list() lookup it is read from, `transform` post-processes it."""
+
+    def __init__(self, name, source=None, transform=None):
+        self.name = name
+        self.source = source or name
+        self.transform = transform
+
+
+class Export:
+    def __init__(self, name, description, get_queryset, columns, key='pk', model=None):
+        self.name = name
+        self.description = description
+        self.get_queryset = get_queryset
+        self.columns = columns
+        self.key = key
+        self.model = model
+
+    def select(self, names=None):
+        """The columns named in `names` (all by default), in that order. Raises ValueError for unknown names."""
+        if not names:
+            return list(self.columns)
+        by_name = {column.name: column for column in self.columns}
+        unknown = [name for name in names if name not in by_name]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}. Available: {', '.join(by_name)}.")
+        return [by_name[name] for name in names]
+
+    def rows(self, columns, queryset=None, batch_size=2000):
+        """Yields each row as a list of column values, fetching `batch_size` rows per query."""
+        queryset = (self.get_queryset() if queryset is None else queryset).order_by(self.key)
+        sources = list(dict.fromkeys([self.key] + [column.source for column in columns]))
+        positions = [sources.index(column.source) for column in columns]
+        last = None
+        while True:
+            batch = queryset if last is None else queryset.filter(**{f'{self.key}__gt': last})
+            batch = list(batch.values_list(*sources)[:batch_size])
+            for values in batch:
+                yield [
+                    column.transform(values[position]) if column.transform else values[position]
+                    for column, position in zip(columns, positions)
+                ]
+            if len(batch) < batch_size:
+                return
+            last = batch[-1][0]
+
+    def stream(self, columns, format='csv', compress=False, queryset=None):
+        """The encoded export as an iterator of chunks: str, or bytes when `compress`ed."""
+        render = render_csv if format == 'csv' else render_ndjson
+        chunks = buffered(render(columns, self.rows(columns, queryset)))
+        return gzipped(chunks) if compress else chunks
+
+    def filename(self, format='csv', compress=False):
+        return f"{self.name}.{format}{'.gz' if compress else ''}"
+
+
+class _Echo:
+    """File-like object whose write() returns the line csv.writer produced instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    return ' '.join(map(str, value)) if isinstance(value, list) else value
+
+
+def render_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([column.name for column in columns])
+    for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+def render_ndjson(columns, rows):
+    names = [column.name for column in columns]
+    for row in rows:
+        yield json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def gzipped(chunks):
+    """Gzip-compresses a stream of str chunks on the fly."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _ticked_days(bitmap):
+    return (bitmap or '').count('1')
+
+
+def _progress_columns():
+    return [
+        Column('progress', 'progress_bitmap', decode_progress),
+        Column('ticked_days', 'progress_bitmap', _ticked_days),
+    ]
+
+
+def _chat_volume():
+    return (
+        ChatMessage.objects.order_by()
+        .annotate(day=TruncDate('timestamp'))
+        .values('day')
+        .annotate(messages=Count('id'), senders=Count('sender', distinct=True), recipients=Count('recipient', distinct=True))
+    )
+
+
+EXPORTS = {export.name: export for export in [
+    Export(
+        'users', "All user accounts.",
+        lambda: CustomUser.objects.all(),
+        [
+            Column('id'), Column('username'), Column('email'), Column('first_name'), Column('last_name'),
+            Column('is_instructor'), Column('specialization'), Column('age'), Column('height'), Column('weight'),
+            Column('goal', 'goal__goal_type'), Column('subscription', 'subscription__plan'),
+            Column('subscription_active', 'subscription__is_active'),
+            Column('is_active'), Column('date_joined'), Column('last_login'),
+        ],
+        model=CustomUser,
+    ),
+    Export(
+        'fitness_plan_users', "Fitness plan memberships with their decoded progress.",
+        lambda: FitnessPlanUser.objects.all(),
+        [
+            Column('id'), Column('user_id'), Column('user_email', 'user__email'),
+            Column('fitness_plan_id'), Column('fitness_plan', 'fitness_plan__name'),
+            Column('duration_weeks', 'fitness_plan__duration_weeks'), Column('joined_at'),
+            *_progress_columns(),
+        ],
+        model=FitnessPlanUser,
+    ),
+    Export(
+        'meal_plan_users', "Meal plan memberships.",
+        lambda: MealPlanUser.objects.all(),
+        [
+            Column('id'), Column('user_id'), Column('user_email', 'user__email'),
+            Column('meal_plan_id'), Column('meal_plan', 'meal_plan__name'), Column('joined_at'),
+        ],
+        model=MealPlanUser,
+    ),
+    Export(
+        'challenge_participants', "Challenge participants with their decoded progress.",
+        lambda: ChallengeParticipant.objects.all(),
+        [
+            Column('id', 'pk'), Column('user_id'), Column('user_email', 'user__email'),
+            Column('challenge_id'), Column('challenge', 'challenge__title'),
+            Column('start_date', 'challenge__start_date'), Column('end_date', 'challenge__end_date'),
+            Column('date_joined'),
+            *_progress_columns(),
+        ],
+        model=ChallengeParticipant,
+    ),
+    Export(
+        'chat_volume', "Chat messages per day, with the number of distinct senders and recipients.",
+        _chat_volume,
+        [Column('day'), Column('messages'), Column('senders'), Column('recipients')],
+        key='day',
+    ),
+    Export(
+        'daily_metrics', "The daily analytics rollups.",
+        lambda: DailyMetric.objects.all(),
+        [Column('date'), Column('metric'), Column('count')],
+    ),
+]}
+
+
+def export_response(request, export, columns, format='csv', compress=False, queryset=None):
+    """A download streaming `export` as it is read, in constant memory."""
+    response = StreamingHttpResponse(
+        streaming_content(request, export.stream(columns, format, compress, queryset)),
+        content_type='application/gzip' if compress else f'{FORMATS[format]}; charset=utf-8',
+    )
+    response['Content-Disposition'] = f'attachment; filename="{export.filename(format, compress)}"'
+    response['Cache-Control'] = 'no-store'
+    # Keep a buffering proxy (nginx) from holding the stream back
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def export_for_model(model):
+    return next(export for export in EXPORTS.values() if export.model is model)
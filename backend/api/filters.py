@@ -0,0 +1,26 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+class ChoiceFilterBackend(BaseFilterBackend):
+    """
+    Filters on choice fields listed in the view's `choice_filter_fields`,
+    e.g. `?muscle_group=chest,back&difficulty=beginner`. Several values can be
+    given separated by commas; unknown values are rejected with a 400.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for field_name in getattr(view, 'choice_filter_fields', []):
+            raw = request.query_params.get(field_name)
+            if not raw:
+                continue
+            values = [value.strip() for value in raw.split(',') if value.strip()]
+            choices = {key for key, _ in queryset.model._meta.get_field(field_name).choices}
+            invalid = [value for value in values if value not in choices]
+            if invalid:
+                raise ValidationError({
+                    field_name: f"Invalid choice(s): {', '.join(invalid)}. "
+                                f"Valid choices are: {', '.join(sorted(choices))}."
+                })
+            queryset = queryset.filter(**{f'{field_name}__in': values})
+        return queryset
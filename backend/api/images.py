@@ -0,0 +1,122 @@
+"""
+Responsive image variants.
+
+Each uploaded image listed in IMAGE_FIELDS is re-encoded to WebP at every
+width in IMAGE_VARIANT_WIDTHS (never upscaled) and saved to the same
+storage as the original. The variant names and dimensions are kept in the
+model's `<field>_variants` JSON field, so serializers render a srcset map
+without opening the files or touching storage.
+"""
+import logging
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .models import Challenge, CustomUser, EducationalContent, Exercise, FitnessPlan, Food, MealPlan
+
+logger = logging.getLogger(__name__)
+
+# Image field of each model that gets responsive variants
+IMAGE_FIELDS = {
+    Challenge: 'image',
+    MealPlan: 'image',
+    FitnessPlan: 'picture',
+    Exercise: 'image',
+    Food: 'image',
+    EducationalContent: 'thumbnail',
+    CustomUser: 'profile_picture',
+}
+
+VARIANT_FORMAT = 'webp'
+
+
+def variant_widths():
+    return sorted(getattr(settings, 'IMAGE_VARIANT_WIDTHS', (160, 320, 640, 1280)))
+
+
+def variants_field(field_name):
+    return f'{field_name}_variants'
+
+
+def is_stale(file, variants):
+    """True when `variants` were not built from the image currently stored in `file`."""
+    return (variants or {}).get('source') != (file.name if file else None)
+
+
+def build_variants(file):
+    """
+    Encodes `file` at each configured width and saves the results to its
+    storage. Returns the metadata stored in `<field>_variants`:
+    {'source': name, 'width': w, 'height': h, 'variants': [{'name', 'width', 'height'}, ...]}.
+    An image that cannot be decoded gets no variants rather than an error.
+    """
+    metadata = {'source': file.name, 'variants': []}
+    try:
+        with file.storage.open(file.name, 'rb') as source:
+            image = ImageOps.exif_transpose(Image.open(source))
+            image.load()
+    except (OSError, ValueError) as exc:
+        logger.warning("Cannot build image variants of %s: %s", file.name, exc)
+        return metadata
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+    metadata.update(width=image.width, height=image.height)
+
+    # Always produce at least one variant so small originals still get a WebP copy
+    widths = [width for width in variant_widths() if width < image.width] or [image.width]
+    directory, filename = posixpath.split(file.name)
+    stem = posixpath.splitext(filename)[0]
+    quality = getattr(settings, 'IMAGE_VARIANT_QUALITY', 80)
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        buffer = BytesIO()
+        image.resize((width, height), Image.LANCZOS).save(buffer, VARIANT_FORMAT, quality=quality, method=4)
+        name = file.storage.save(
+            posixpath.join(directory, 'variants', f'{stem}-{width}w.{VARIANT_FORMAT}'),
+            ContentFile(buffer.getvalue())
+        )
+        metadata['variants'].append({'name': name, 'width': width, 'height': height})
+    return metadata
+
+
+def delete_variants(storage, variants):
+    for variant in (variants or {}).get('variants', []):
+        storage.delete(variant['name'])
+
+
+def refresh_variants(instance, field_name, force=False):
+    """
+    Rebuilds the variants of `instance`'s image if it changed since they were
+    built (or always with `force`), removing the outdated files. Saved with a
+    queryset update so no save signals fire again. Returns True when the
+    variants were rebuilt.
+    """
+    file = getattr(instance, field_name)
+    attname = variants_field(field_name)
+    previous = getattr(instance, attname)
+    if not (force or is_stale(file, previous)):
+        return False
+    variants = build_variants(file) if file else {}
+    delete_variants(file.storage, previous)
+    type(instance)._default_manager.filter(pk=instance.pk).update(**{attname: variants})
+    setattr(instance, attname, variants)
+    return True
+
+
+def image_srcset(file, variants, request=None):
+    """
+    Renders stored variants as a srcset-style map, e.g.
+    {'160w': 'https://.../a-160w.webp', '320w': '...'}, or None without an image.
+    Variants built from an older upload are ignored until they are rebuilt.
+    """
+    if not file or is_stale(file, variants):
+        return None
+    srcset = {}
+    for variant in variants['variants']:
+        url = file.storage.url(variant['name'])
+        srcset[f"{variant['width']}w"] = request.build_absolute_uri(url) if request is not None else url
+    return srcset
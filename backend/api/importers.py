@@ -0,0 +1,215 @@
+"""
+Streaming bulk import of catalogue rows (foods, exercises) from CSV or
+NDJSON. Files are read one row at a time and written in batches, upserting
+on the unique `name`, so datasets of any size load in constant memory.
+"""
+import csv
+import io
+import json
+import time
+
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+
+from . import cache
+from .cache import CACHE_NAMESPACES
+from .models import Exercise, Food, MealFood
+from .models.meal import schedule_nutrition_rebuild
+
+FORMATS = ('csv', 'ndjson')
+
+
+def detect_format(filename):
+    """'csv' or 'ndjson' from a file name, or None when the extension is unknown."""
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension == 'csv':
+        return 'csv'
+    if extension in ('ndjson', 'jsonl'):
+        return 'ndjson'
+    return None
+
+
+def read_rows(stream, format):
+    """
+    Yields (line number, row dict) from a binary stream. Lines that are not
+    valid NDJSON objects are yielded with a ValidationError instead of a dict.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='' if format == 'csv' else None)
+    if format == 'csv':
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_number, ValidationError(f"Invalid JSON: {exc}")
+            continue
+        if not isinstance(row, dict):
+            yield line_number, ValidationError("Each line must be a JSON object.")
+            continue
+        yield line_number, row
+
+
+class ImportReport:
+    """
+    Counts of an import run. The first `max_rejects` rejected rows are kept
+    for display; with `reject_log` (a text stream) every reject is also
+    written to it as an NDJSON line.
+    """
+
+    def __init__(self, max_rejects=20, reject_log=None):
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.rejected = 0
+        self.rejects = []
+        self.max_rejects = max_rejects
+        self.reject_log = reject_log
+        self.started = time.monotonic()
+
+    def reject(self, line, errors):
+        self.rejected += 1
+        if len(self.rejects) < self.max_rejects:
+            self.rejects.append((line, errors))
+        if self.reject_log is not None:
+            self.reject_log.write(json.dumps({'line': line, 'errors': errors}) + '\n')
+
+    @property
+    def rows(self):
+        return self.created + self.updated + self.skipped + self.rejected
+
+    @property
+    def seconds(self):
+        return time.monotonic() - self.started
+
+    def summary(self):
+        rate = self.rows / self.seconds if self.seconds else 0
+        return (
+            f"{self.rows} rows in {self.seconds:.1f}s ({rate:,.0f} rows/s): "
+            f"{self.created} created, {self.updated} updated, {self.skipped} skipped, {self.rejected} rejected"
+        )
+
+
+class CatalogueImporter:
+    """
+    Imports rows of `model` keyed by its unique `name`. Each column in
+    `fields` is validated with the model field's own clean(), so choices,
+    max lengths and validators match the admin; choice columns accept the
+    stored value or its label, case-insensitively.
+    """
+
+    def __init__(self, model, fields, cache_namespaces=()):
+        self.model = model
+        self.fields = fields
+        self.cache_namespaces = cache_namespaces
+        self.choice_values = {}
+        for name in fields:
+            field = model._meta.get_field(name)
+            if field.choices:
+                self.choice_values[name] = {
+                    text.lower(): value
+                    for value, label in field.flatchoices
+                    for text in (str(value), str(label))
+                }
+
+    def clean(self, row):
+        """The model field values of a raw row, or a ValidationError with per-column messages."""
+        values, errors = {}, {}
+        for name in self.fields:
+            field = self.model._meta.get_field(name)
+            raw = row.get(name)
+            if isinstance(raw, str):
+                raw = raw.strip()
+            if raw in (None, ''):
+                if field.has_default():
+                    values[name] = field.get_default()
+                elif field.null:
+                    values[name] = None
+                else:
+                    errors[name] = ["This field is required."]
+                continue
+            elif name in self.choice_values:
+                raw = self.choice_values[name].get(str(raw).lower(), raw)
+            try:
+                values[name] = field.clean(raw, None)
+            except ValidationError as exc:
+                errors[name] = exc.messages
+        if errors:
+            raise ValidationError(errors)
+        return values
+
+    def run(self, stream, format, update_existing=True, batch_size=1000, dry_run=False, report=None, on_batch=None):
+        """Imports every row of `stream`, calling `on_batch(report)` after each written batch."""
+        report = report or ImportReport()
+        batch = {}
+        for line, row in read_rows(stream, format):
+            try:
+                if isinstance(row, ValidationError):
+                    raise row
+                values = self.clean(row)
+            except ValidationError as exc:
+                report.reject(line, exc.message_dict if hasattr(exc, 'error_dict') else {'row': exc.messages})
+                continue
+            if values['name'] in batch:
+                # Later rows win; count the earlier one as superseded
+                report.skipped += 1
+            batch[values['name']] = values
+            if len(batch) >= batch_size:
+                self.write(batch, update_existing, dry_run, report)
+                batch = {}
+                if on_batch:
+                    on_batch(report)
+        if batch:
+            self.write(batch, update_existing, dry_run, report)
+        if not dry_run and (report.created or report.updated):
+            cache.invalidate(*self.cache_namespaces)
+        return report
+
+    def write(self, batch, update_existing, dry_run, report):
+        existing = set(self.model.objects.filter(name__in=batch).values_list('name', flat=True))
+        if not update_existing:
+            report.skipped += len(existing)
+            batch = {name: values for name, values in batch.items() if name not in existing}
+        report.created += len(batch) - len(existing & batch.keys())
+        report.updated += len(existing & batch.keys())
+        if dry_run or not batch:
+            return
+
+        objects = [self.model(**values) for values in batch.values()]
+        with transaction.atomic():
+            if update_existing and existing:
+                options = {'update_conflicts': True, 'update_fields': [name for name in self.fields if name != 'name']}
+                if connection.features.supports_update_conflicts_with_target:
+                    options['unique_fields'] = ['name']
+                self.model.objects.bulk_create(objects, **options)
+            else:
+                # Rows created concurrently since the lookup above are left alone
+                self.model.objects.bulk_create(objects, ignore_conflicts=True)
+            self.after_write([name for name in batch if name in existing])
+
+    def after_write(self, updated_names):
+        """Hook for work bulk_create skips because no save signals are sent."""
+
+
+class FoodImporter(CatalogueImporter):
+    def after_write(self, updated_names):
+        if updated_names:
+            schedule_nutrition_rebuild(
+                MealFood.objects.filter(food__name__in=updated_names).values_list('meal_plan_id', flat=True).distinct()
+            )
+
+
+IMPORTERS = {
+    'foods': FoodImporter(
+        Food, ['name', 'description', 'carbs', 'protein', 'fat', 'food_type'],
+        cache_namespaces=CACHE_NAMESPACES[Food],
+    ),
+    'exercises': CatalogueImporter(
+        Exercise, ['name', 'description', 'calories_burned', 'muscle_group', 'difficulty', 'equipment'],
+        cache_namespaces=CACHE_NAMESPACES[Exercise],
+    ),
+}
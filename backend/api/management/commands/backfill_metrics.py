@@ -0,0 +1,23 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import DailyMetric
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the daily analytics rollups from the raw user and join "
+        "tables and the subscription events. Without --start/--end the whole history is rebuilt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=date.fromisoformat, help="First day to rebuild (YYYY-MM-DD)")
+        parser.add_argument('--end', type=date.fromisoformat, help="Last day to rebuild (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        start, end = options['start'], options['end']
+        if start and end and start > end:
+            raise CommandError("--start must be on or before --end.")
+        rows = DailyMetric.objects.rebuild(start, end)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily metric rows"))
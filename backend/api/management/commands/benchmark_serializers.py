@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from ...models import FitnessPlan, MealPlan
+from ...serializers import (
+    FitnessPlanSerializer, FitnessPlanReadSerializer,
+    MealPlanSerializer, MealPlanReadSerializer,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures list serialization throughput (objects/sec) of the nested "
+        "fitness and meal plan serializers against their read-only fast paths, "
+        "using the plans already in the database. Nothing is written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help="Serialization passes per serializer")
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        request = Request(APIRequestFactory().get('/'))
+        context = {'request': request}
+
+        suites = [
+            ('fitness plans', FitnessPlan.objects.prefetch_related('exercises__exercise'),
+             FitnessPlanSerializer, FitnessPlanReadSerializer, 'exercises'),
+            ('meal plans', MealPlan.objects.with_totals().with_meal_foods(),
+             MealPlanSerializer, MealPlanReadSerializer, 'meal_foods'),
+        ]
+        for label, queryset, legacy, fast, nested in suites:
+            plans = list(queryset)
+            if not plans:
+                self.stdout.write(f"{label}: no rows to serialize, skipped")
+                continue
+            objects = len(plans) + sum(len(getattr(plan, nested).all()) for plan in plans)
+            if legacy(plans, many=True, context=context).data != fast(plans, many=True, context=context).data:
+                self.stderr.write(self.style.WARNING(f"{label}: fast path output differs from {legacy.__name__}"))
+
+            before = self.throughput(legacy, plans, context, repeat, objects)
+            after = self.throughput(fast, plans, context, repeat, objects)
+            self.stdout.write(
+                f"{label}: {len(plans)} plans / {objects} objects, "
+                f"{legacy.__name__} {before:,.0f} obj/s, "
+                f"{fast.__name__} {after:,.0f} obj/s ({after / before:.1f}x)"
+            )
+
+    def throughput(self, serializer_class, plans, context, repeat, objects):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            serializer_class(plans, many=True, context=context).data
+        return objects * repeat / (time.perf_counter() - started)
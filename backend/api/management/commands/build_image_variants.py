@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from ... import cache
+from ...cache import CACHE_NAMESPACES
+from ...images import IMAGE_FIELDS, refresh_variants
+
+MODELS = {model._meta.model_name: model for model in IMAGE_FIELDS}
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds the responsive WebP variants of uploaded images that have none "
+        "or whose image changed. New uploads get theirs when they are saved; "
+        "run this once after deploying and after changing IMAGE_VARIANT_WIDTHS "
+        "(with --force)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', action='append', choices=sorted(MODELS),
+            help="Only process this model (repeatable); defaults to all of them"
+        )
+        parser.add_argument('--force', action='store_true', help="Rebuild variants that are up to date too")
+
+    def handle(self, *args, **options):
+        models = [MODELS[name] for name in options['model']] if options['model'] else list(IMAGE_FIELDS)
+        for model in models:
+            field_name = IMAGE_FIELDS[model]
+            rebuilt = 0
+            rows = model._default_manager.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+            for instance in rows.order_by('pk').iterator():
+                rebuilt += refresh_variants(instance, field_name, force=options['force'])
+            if rebuilt and model in CACHE_NAMESPACES:
+                cache.invalidate(*CACHE_NAMESPACES[model])
+            self.stdout.write(f"{model._meta.verbose_name_plural}: rebuilt {rebuilt} image variant sets")
+        self.stdout.write(self.style.SUCCESS("Image variants are up to date"))
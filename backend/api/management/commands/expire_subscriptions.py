@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...sweeper import sweep_expired_subscriptions
+
+
+class Command(BaseCommand):
+    help = (
+        "Deactivates subscriptions past their end date in batches, releasing "
+        "their instructors and recording activity events."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Subscriptions expired per UPDATE")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        expired = sweep_expired_subscriptions(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Expired {expired} subscriptions"))
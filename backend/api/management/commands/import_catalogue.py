@@ -0,0 +1,60 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...importers import FORMATS, IMPORTERS, ImportReport, detect_format
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams foods or exercises from a CSV or NDJSON file (or - for stdin) "
+        "into the catalogue, validating each row against the model and "
+        "upserting on the unique name in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('catalogue', choices=sorted(IMPORTERS))
+        parser.add_argument('path', help="CSV or NDJSON file, or - to read stdin")
+        parser.add_argument('--format', choices=FORMATS, help="Defaults to the file extension")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows written per statement")
+        parser.add_argument('--skip-existing', action='store_true', help="Leave rows whose name exists untouched")
+        parser.add_argument('--rejects', help="Write every rejected row's line and errors to this NDJSON file")
+        parser.add_argument('--dry-run', action='store_true', help="Validate and count without writing")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        path = options['path']
+        format = options['format'] or (None if path == '-' else detect_format(path))
+        if format is None:
+            raise CommandError("Cannot tell the file format; pass --format csv or --format ndjson.")
+
+        reject_log = open(options['rejects'], 'w', encoding='utf-8') if options['rejects'] else None
+        try:
+            report = ImportReport(reject_log=reject_log)
+            if path == '-':
+                stream = sys.stdin.buffer
+            else:
+                try:
+                    stream = open(path, 'rb')
+                except OSError as exc:
+                    raise CommandError(f"Cannot open {path}: {exc}")
+            with stream:
+                IMPORTERS[options['catalogue']].run(
+                    stream, format,
+                    update_existing=not options['skip_existing'],
+                    batch_size=options['batch_size'],
+                    dry_run=options['dry_run'],
+                    report=report,
+                    on_batch=lambda report: self.stdout.write(report.summary()),
+                )
+        finally:
+            if reject_log is not None:
+                reject_log.close()
+
+        for line, errors in report.rejects:
+            self.stderr.write(f"line {line}: {errors}")
+        if report.rejected > len(report.rejects):
+            self.stderr.write(f"... and {report.rejected - len(report.rejects)} more rejected rows")
+        prefix = "Dry run: " if options['dry_run'] else ""
+        self.stdout.write(self.style.SUCCESS(prefix + report.summary()))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...retention import POLICIES
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes expired tokens and aged rows according to the retention "
+        "policies in api/retention.py, in bounded batches. Safe to run from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--policy', action='append', dest='policies', choices=sorted(POLICIES),
+            help="Only run the given policy (repeatable). Defaults to all."
+        )
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows deleted per statement")
+        parser.add_argument('--pause', type=float, default=0, help="Seconds to sleep between batches")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many rows would be deleted")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        for name in options['policies'] or sorted(POLICIES):
+            policy = POLICIES[name]
+            count = policy.purge(
+                batch_size=options['batch_size'],
+                pause=options['pause'],
+                dry_run=options['dry_run'],
+            )
+            verb = "would delete" if options['dry_run'] else "deleted"
+            self.stdout.write(f"{name}: {verb} {count} rows ({policy.description})")
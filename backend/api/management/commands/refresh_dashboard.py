@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...models import DashboardSnapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the admin dashboard snapshot. Run periodically (e.g. from "
+        "cron) to pick up changes that bypass signals, such as content view counts."
+    )
+
+    def handle(self, *args, **options):
+        snapshot = DashboardSnapshot.objects.refresh()
+        self.stdout.write(self.style.SUCCESS(f"Dashboard snapshot refreshed at {snapshot.computed_at.isoformat()}"))
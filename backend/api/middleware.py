@@ -0,0 +1,42 @@
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework import exceptions
+
+from .authentication import CachedTokenAuthentication
+
+
+@database_sync_to_async
+def get_user_for_token(token):
+    try:
+        user, _ = CachedTokenAuthentication().authenticate_credentials(token.encode())
+    except exceptions.AuthenticationFailed:
+        return AnonymousUser()
+    return user
+
+
+class KnoxTokenAuthMiddleware(BaseMiddleware):
+    """
+    Authenticate websocket connections with the same Knox tokens as the REST
+    API. Browsers cannot set headers on websockets, so the token is read from
+    the `token` query parameter, falling back to a `Token <key>` header.
+    """
+
+    async def __call__(self, scope, receive, send):
+        scope = dict(scope)
+        token = self.get_token(scope)
+        scope['user'] = await get_user_for_token(token) if token else AnonymousUser()
+        return await super().__call__(scope, receive, send)
+
+    def get_token(self, scope):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        if query.get('token'):
+            return query['token'][0]
+        for name, value in scope.get('headers', []):
+            if name == b'authorization':
+                parts = value.decode().split()
+                if len(parts) == 2 and parts[0].lower() == 'token':
+                    return parts[1]
+        return None
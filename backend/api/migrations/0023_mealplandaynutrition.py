@@ -0,0 +1,58 @@
+# Generated by Django 5.2 on 2026-10-18 17:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, FloatField, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_day_nutrition(apps, schema_editor):
+    MealFood = apps.get_model('api', 'MealFood')
+    MealPlanDayNutrition = apps.get_model('api', 'MealPlanDayNutrition')
+
+    def per_row(expression):
+        return Sum(expression * F('quantity_grams') / Value(100.0), output_field=FloatField())
+
+    carbs = Coalesce(F('food__carbs'), Value(0.0))
+    protein = Coalesce(F('food__protein'), Value(0.0))
+    fat = Coalesce(F('food__fat'), Value(0.0))
+    totals = MealFood.objects.order_by().values('meal_plan_id', 'day', 'meal_time').annotate(
+        calories=per_row(carbs * Value(4.0) + protein * Value(4.0) + fat * Value(9.0)),
+        carbs=per_row(carbs),
+        protein=per_row(protein),
+        fat=per_row(fat),
+    )
+    MealPlanDayNutrition.objects.bulk_create(
+        [MealPlanDayNutrition(**row) for row in totals.iterator()],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_rename_read_chatmessage_is_read_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MealPlanDayNutrition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.PositiveIntegerField()),
+                ('meal_time', models.CharField(choices=[('breakfast', 'Breakfast'), ('morning_snack', 'Morning Snack'), ('lunch', 'Lunch'), ('afternoon_snack', 'Afternoon Snack'), ('dinner', 'Dinner'), ('evening_snack', 'Evening Snack')], max_length=20)),
+                ('calories', models.FloatField(default=0)),
+                ('carbs', models.FloatField(default=0)),
+                ('protein', models.FloatField(default=0)),
+                ('fat', models.FloatField(default=0)),
+                ('meal_plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='day_nutrition', to='api.mealplan')),
+            ],
+            options={
+                'verbose_name': 'Meal Plan Day Nutrition',
+                'verbose_name_plural': 'Meal Plan Day Nutrition',
+                'ordering': ['day', 'meal_time'],
+                'unique_together': {('meal_plan', 'day', 'meal_time')},
+            },
+        ),
+        migrations.RunPython(backfill_day_nutrition, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 17:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_mealplandaynutrition'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['sender', 'recipient', 'timestamp'], name='chat_conversation_idx'),
+        ),
+    ]
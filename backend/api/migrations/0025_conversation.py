@@ -0,0 +1,67 @@
+# Generated by Django 5.2 on 2026-10-18 17:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Q
+
+
+def backfill_conversations(apps, schema_editor):
+    ChatMessage = apps.get_model('api', 'ChatMessage')
+    Conversation = apps.get_model('api', 'Conversation')
+
+    directed = ChatMessage.objects.order_by().values('sender_id', 'recipient_id').annotate(
+        last_id=Max('id'),
+        unread=Count('id', filter=Q(is_read=False)),
+    )
+    conversations = {}
+    for row in directed:
+        for owner_id, counterpart_id in (
+            (row['sender_id'], row['recipient_id']),
+            (row['recipient_id'], row['sender_id']),
+        ):
+            entry = conversations.setdefault((owner_id, counterpart_id), {'last_id': 0, 'unread': 0})
+            entry['last_id'] = max(entry['last_id'], row['last_id'])
+            if owner_id == row['recipient_id']:
+                entry['unread'] += row['unread']
+
+    timestamps = dict(ChatMessage.objects.filter(
+        id__in={entry['last_id'] for entry in conversations.values()}
+    ).values_list('id', 'timestamp'))
+    Conversation.objects.bulk_create([
+        Conversation(
+            owner_id=owner_id,
+            counterpart_id=counterpart_id,
+            last_message_id=entry['last_id'],
+            last_message_at=timestamps[entry['last_id']],
+            unread_count=entry['unread'],
+        )
+        for (owner_id, counterpart_id), entry in conversations.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_chatmessage_conversation_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_message_at', models.DateTimeField()),
+                ('unread_count', models.PositiveIntegerField(default=0)),
+                ('counterpart', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('last_message', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='api.chatmessage')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-last_message_at'],
+                'indexes': [models.Index(fields=['owner', '-last_message_at'], name='conversation_inbox_idx')],
+                'unique_together': {('owner', 'counterpart')},
+            },
+        ),
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
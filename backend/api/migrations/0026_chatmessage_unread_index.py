@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 17:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_conversation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['recipient', 'sender', 'is_read'], name='chat_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2 on 2026-10-18 17:50
+
+from django.db import migrations, models
+
+
+def progress_to_bitmap(apps, schema_editor):
+    for model_name in ('ChallengeParticipant', 'FitnessPlanUser'):
+        model = apps.get_model('api', model_name)
+        rows = []
+        for row in model.objects.exclude(progress=[]).only('pk', 'progress').iterator():
+            days = {day for day in row.progress if isinstance(day, int) and day > 0}
+            if days:
+                row.progress_bitmap = ''.join(
+                    '1' if day in days else '0' for day in range(1, max(days) + 1)
+                )
+                rows.append(row)
+        model.objects.bulk_update(rows, ['progress_bitmap'], batch_size=500)
+
+
+def bitmap_to_progress(apps, schema_editor):
+    for model_name in ('ChallengeParticipant', 'FitnessPlanUser'):
+        model = apps.get_model('api', model_name)
+        rows = []
+        for row in model.objects.exclude(progress_bitmap='').only('pk', 'progress_bitmap').iterator():
+            row.progress = [index + 1 for index, bit in enumerate(row.progress_bitmap) if bit == '1']
+            rows.append(row)
+        model.objects.bulk_update(rows, ['progress'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_chatmessage_unread_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challengeparticipant',
+            name='progress_bitmap',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='fitnessplanuser',
+            name='progress_bitmap',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(progress_to_bitmap, bitmap_to_progress),
+        migrations.RemoveField(
+            model_name='challengeparticipant',
+            name='progress',
+        ),
+        migrations.RemoveField(
+            model_name='fitnessplanuser',
+            name='progress',
+        ),
+    ]
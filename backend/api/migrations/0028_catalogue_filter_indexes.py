@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-18 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_progress_bitmap'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exercise',
+            index=models.Index(fields=['muscle_group', 'difficulty', 'equipment'], name='exercise_filter_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exercise',
+            index=models.Index(fields=['difficulty', 'equipment'], name='exercise_difficulty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='food',
+            index=models.Index(fields=['food_type', 'name'], name='food_type_idx'),
+        ),
+    ]
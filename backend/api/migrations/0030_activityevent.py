@@ -0,0 +1,78 @@
+# Generated by Django 5.2 on 2026-10-18 17:54
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from datetime import datetime, time
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_activity_events(apps, schema_editor):
+    ActivityEvent = apps.get_model('api', 'ActivityEvent')
+    CustomUser = apps.get_model('api', 'CustomUser')
+    FitnessPlanUser = apps.get_model('api', 'FitnessPlanUser')
+    MealPlanUser = apps.get_model('api', 'MealPlanUser')
+    ChallengeParticipant = apps.get_model('api', 'ChallengeParticipant')
+    SubscriptionPlan = apps.get_model('api', 'SubscriptionPlan')
+
+    def events():
+        for user in CustomUser.objects.iterator():
+            yield ActivityEvent(
+                event_type='register', user_id=user.id, created_at=user.date_joined,
+                description=f"New user registered: {user.email}",
+            )
+        for join in FitnessPlanUser.objects.select_related('user', 'fitness_plan').iterator():
+            yield ActivityEvent(
+                event_type='join_fitness_plan', user_id=join.user_id, target_id=join.fitness_plan_id,
+                created_at=join.joined_at,
+                description=f"{join.user.email} joined fitness plan: {join.fitness_plan.name}",
+            )
+        for join in MealPlanUser.objects.select_related('user', 'meal_plan').iterator():
+            yield ActivityEvent(
+                event_type='join_meal_plan', user_id=join.user_id, target_id=join.meal_plan_id,
+                created_at=join.joined_at,
+                description=f"{join.user.email} joined meal plan: {join.meal_plan.name}",
+            )
+        for join in ChallengeParticipant.objects.select_related('user', 'challenge').iterator():
+            yield ActivityEvent(
+                event_type='join_challenge', user_id=join.user_id, target_id=join.challenge_id,
+                created_at=timezone.make_aware(datetime.combine(join.date_joined, time.min)),
+                description=f"{join.user.email} joined challenge: {join.challenge.title}",
+            )
+        for subscription in SubscriptionPlan.objects.filter(is_active=True).select_related('user').iterator():
+            yield ActivityEvent(
+                event_type='subscribe', user_id=subscription.user_id, target_id=subscription.id,
+                created_at=subscription.start_date,
+                description=f"{subscription.user.email} subscribed to {subscription.get_plan_display()}",
+            )
+
+    ActivityEvent.objects.bulk_create(events(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0029_dashboardsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('register', 'Registered'), ('join_fitness_plan', 'Joined Fitness Plan'), ('join_meal_plan', 'Joined Meal Plan'), ('join_challenge', 'Joined Challenge'), ('tick_fitness_plan', 'Ticked Fitness Plan Day'), ('tick_challenge', 'Ticked Challenge Day'), ('subscribe', 'Subscribed')], max_length=30)),
+                ('description', models.CharField(max_length=255)),
+                ('target_id', models.PositiveIntegerField(blank=True, help_text='Id of the plan, challenge or subscription involved', null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Activity Event',
+                'verbose_name_plural': 'Activity Events',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['-created_at', '-id'], name='activity_feed_idx'), models.Index(fields=['event_type', '-created_at', '-id'], name='activity_type_feed_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_activity_events, migrations.RunPython.noop),
+    ]
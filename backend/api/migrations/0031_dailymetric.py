@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0030_activityevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMetric',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('signups', 'Signups'), ('fitness_plan_joins', 'Fitness Plan Joins'), ('meal_plan_joins', 'Meal Plan Joins'), ('challenge_joins', 'Challenge Joins'), ('subscriptions', 'Subscriptions')], max_length=30)),
+                ('date', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Metric',
+                'verbose_name_plural': 'Daily Metrics',
+                'ordering': ['metric', 'date'],
+                'unique_together': {('metric', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-18 17:59
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_instructor_loads(apps, schema_editor):
+    CustomUser = apps.get_model('api', 'CustomUser')
+    SubscriptionPlan = apps.get_model('api', 'SubscriptionPlan')
+    loads = {}
+    active = SubscriptionPlan.objects.filter(is_active=True).order_by()
+    for field in ('trainer', 'nutritionist'):
+        for row in active.filter(**{f'{field}__isnull': False}).values(field).annotate(total=Count('id')):
+            loads[row[field]] = loads.get(row[field], 0) + row['total']
+    for instructor_id, total in loads.items():
+        CustomUser.objects.filter(pk=instructor_id).update(active_client_count=total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0031_dailymetric'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='active_client_count',
+            field=models.PositiveIntegerField(default=0, help_text='Active subscriptions assigned to this instructor, maintained by signals'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['is_instructor', 'specialization', 'active_client_count'], name='instructor_load_idx'),
+        ),
+        migrations.RunPython(backfill_instructor_loads, migrations.RunPython.noop),
+    ]
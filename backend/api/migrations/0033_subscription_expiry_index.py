@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0032_instructor_load'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activityevent',
+            name='event_type',
+            field=models.CharField(choices=[('register', 'Registered'), ('join_fitness_plan', 'Joined Fitness Plan'), ('join_meal_plan', 'Joined Meal Plan'), ('join_challenge', 'Joined Challenge'), ('tick_fitness_plan', 'Ticked Fitness Plan Day'), ('tick_challenge', 'Ticked Challenge Day'), ('subscribe', 'Subscribed'), ('subscription_expired', 'Subscription Expired')], max_length=30),
+        ),
+        migrations.AddIndex(
+            model_name='subscriptionplan',
+            index=models.Index(fields=['is_active', 'end_date'], name='subscription_expiry_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-18 18:01
+
+import api.models.user
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0033_subscription_expiry_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='customuser',
+            managers=[
+                ('objects', api.models.user.CustomUserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0036_storedfile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dashboardsnapshot',
+            name='changed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
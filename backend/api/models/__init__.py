@@ -5,9 +5,13 @@ from .goal import Goal
 from .exercise import Exercise
 from .food import Food
 from .fitness import FitnessPlan, FitnessPlanUser, FitnessPlanExercise
-from .meal import MealPlan, MealPlanUser, MealFood
+from .meal import MealPlan, MealPlanUser, MealFood, MealPlanDayNutrition
 from .subscription import SubscriptionPlan
-from .chat import ChatMessage
+from .chat import ChatMessage, Conversation
+from .activity import ActivityEvent
+from .dashboard import DashboardSnapshot
+from .analytics import DailyMetric
+from .media import StoredFile
 
 
 __all__ = [
@@ -18,7 +22,11 @@ __all__ = [
     'Exercise',
     'Food',
     'FitnessPlan', 'FitnessPlanUser', 'FitnessPlanExercise',
-    'MealPlan', 'MealPlanUser', 'MealFood',
+    'MealPlan', 'MealPlanUser', 'MealFood', 'MealPlanDayNutrition',
     'SubscriptionPlan',
-    'ChatMessage',
+    'ChatMessage', 'Conversation',
+    'ActivityEvent',
+    'DashboardSnapshot',
+    'DailyMetric',
+    'StoredFile',
 ]
\ No newline at end of file
@@ -0,0 +1,61 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from ..models.user import CustomUser
+
+
+class ActivityEvent(models.Model):
+    """
+    Append-only log of user activity (registrations, joins, ticks,
+    subscriptions), written by signals. Backs the admin activity feed, which
+    reads it newest first through the (created_at, id) indexes.
+    """
+    REGISTER = 'register'
+    JOIN_FITNESS_PLAN = 'join_fitness_plan'
+    JOIN_MEAL_PLAN = 'join_meal_plan'
+    JOIN_CHALLENGE = 'join_challenge'
+    TICK_FITNESS_PLAN = 'tick_fitness_plan'
+    TICK_CHALLENGE = 'tick_challenge'
+    SUBSCRIBE = 'subscribe'
+    SUBSCRIPTION_EXPIRED = 'subscription_expired'
+
+    EVENT_TYPES = [
+        (REGISTER, 'Registered'),
+        (JOIN_FITNESS_PLAN, 'Joined Fitness Plan'),
+        (JOIN_MEAL_PLAN, 'Joined Meal Plan'),
+        (JOIN_CHALLENGE, 'Joined Challenge'),
+        (TICK_FITNESS_PLAN, 'Ticked Fitness Plan Day'),
+        (TICK_CHALLENGE, 'Ticked Challenge Day'),
+        (SUBSCRIBE, 'Subscribed'),
+        (SUBSCRIPTION_EXPIRED, 'Subscription Expired'),
+    ]
+
+    event_type = models.CharField(max_length=30, choices=EVENT_TYPES)
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='activity_events')
+    description = models.CharField(max_length=255)
+    target_id = models.PositiveIntegerField(null=True, blank=True, help_text="Id of the plan, challenge or subscription involved")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='activity_feed_idx'),
+            models.Index(fields=['event_type', '-created_at', '-id'], name='activity_type_feed_idx'),
+        ]
+        verbose_name = 'Activity Event'
+        verbose_name_plural = 'Activity Events'
+
+    def __str__(self):
+        return f"{self.get_event_type_display()}: {self.description}"
+
+    @classmethod
+    def retention_cutoff(cls):
+        """Events created before this may have been purged (see api/retention.py)."""
+        days = getattr(settings, 'DATA_RETENTION_DAYS', {}).get('activity_events', 365)
+        return timezone.now() - timedelta(days=days)
+
+    @classmethod
+    def retained_since(cls):
+        """First day whose events are all still stored."""
+        return timezone.localdate(cls.retention_cutoff()) + timedelta(days=1)
@@ -0,0 +1,118 @@
+from datetime import datetime, time, timedelta
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from ..models.user import CustomUser
+from ..models.fitness import FitnessPlanUser
+from ..models.meal import MealPlanUser
+from ..models.challenge import ChallengeParticipant
+from ..models.activity import ActivityEvent
+
+
+class DailyMetricQuerySet(models.QuerySet):
+    def increment(self, metric, date, by=1):
+        """Add `by` to the counter of `metric` on `date`, creating the row if needed."""
+        if self.filter(metric=metric, date=date).update(count=F('count') + by):
+            return
+        try:
+            with transaction.atomic():
+                self.create(metric=metric, date=date, count=by)
+        except IntegrityError:
+            # Another request created the row first
+            self.filter(metric=metric, date=date).update(count=F('count') + by)
+
+    def rebuild(self, start=None, end=None):
+        """
+        Recompute the rollups between `start` and `end` (inclusive dates,
+        open-ended when None) from the raw tables. Rollups sourced from
+        activity events are only rebuilt from the first day the retention
+        policy has kept whole; older counters are left as they are.
+        """
+        rows, stale = [], []
+        for metric, queryset, field_name, retained_since in DailyMetric.sources():
+            first = start
+            if retained_since is not None and (first is None or first < retained_since):
+                first = retained_since
+            if first is not None and end is not None and first > end:
+                continue
+            is_datetime = isinstance(queryset.model._meta.get_field(field_name), models.DateTimeField)
+            days = self.filter(metric=metric)
+            if first is not None:
+                lower = _day_start(first) if is_datetime else first
+                queryset = queryset.filter(**{f'{field_name}__gte': lower})
+                days = days.filter(date__gte=first)
+            if end is not None:
+                upper = end + timedelta(days=1)
+                queryset = queryset.filter(**{f'{field_name}__lt': _day_start(upper) if is_datetime else upper})
+                days = days.filter(date__lte=end)
+            day = TruncDate(field_name) if is_datetime else F(field_name)
+            per_day = queryset.annotate(day=day).order_by().values('day').annotate(total=Count('pk'))
+            rows.extend(DailyMetric(metric=metric, date=row['day'], count=row['total']) for row in per_day)
+            stale.append(days)
+
+        with transaction.atomic():
+            for days in stale:
+                days.delete()
+            self.bulk_create(rows, batch_size=500)
+        return len(rows)
+
+
+def _day_start(date):
+    return timezone.make_aware(datetime.combine(date, time.min))
+
+
+class DailyMetric(models.Model):
+    """
+    Per-day counters for the admin analytics charts. Incremented as activity
+    events are recorded and rebuilt from the raw tables by the
+    `backfill_metrics` management command.
+    """
+    SIGNUPS = 'signups'
+    FITNESS_PLAN_JOINS = 'fitness_plan_joins'
+    MEAL_PLAN_JOINS = 'meal_plan_joins'
+    CHALLENGE_JOINS = 'challenge_joins'
+    SUBSCRIPTIONS = 'subscriptions'
+
+    METRIC_CHOICES = [
+        (SIGNUPS, 'Signups'),
+        (FITNESS_PLAN_JOINS, 'Fitness Plan Joins'),
+        (MEAL_PLAN_JOINS, 'Meal Plan Joins'),
+        (CHALLENGE_JOINS, 'Challenge Joins'),
+        (SUBSCRIPTIONS, 'Subscriptions'),
+    ]
+
+    metric = models.CharField(max_length=30, choices=METRIC_CHOICES)
+    date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    objects = DailyMetricQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['metric', 'date']
+        unique_together = ('metric', 'date')
+        verbose_name = 'Daily Metric'
+        verbose_name_plural = 'Daily Metrics'
+
+    def __str__(self):
+        return f"{self.get_metric_display()} on {self.date}: {self.count}"
+
+    @classmethod
+    def sources(cls):
+        """
+        (metric, raw queryset, date field, first rebuildable day or None)
+        used to rebuild each rollup.
+        """
+        # Subscriptions are counted from the events the live counter counts:
+        # a SubscriptionPlan row keeps only its latest start date and state,
+        # so expired and renewed subscriptions would be lost from history
+        return [
+            (cls.SIGNUPS, CustomUser.objects.all(), 'date_joined', None),
+            (cls.FITNESS_PLAN_JOINS, FitnessPlanUser.objects.all(), 'joined_at', None),
+            (cls.MEAL_PLAN_JOINS, MealPlanUser.objects.all(), 'joined_at', None),
+            (cls.CHALLENGE_JOINS, ChallengeParticipant.objects.all(), 'date_joined', None),
+            (
+                cls.SUBSCRIPTIONS, ActivityEvent.objects.filter(event_type=ActivityEvent.SUBSCRIBE), 'created_at',
+                ActivityEvent.retained_since(),
+            ),
+        ]
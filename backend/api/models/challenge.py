@@ -12,12 +12,15 @@ from django.contrib.auth.models import Group, Permission
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from ..models.user import CustomUser
+from ..models.progress import DayProgressModel
+from ..models.media import AtomicSaveMixin
 
 
 
-class Challenge(models.Model):
+class Challenge(AtomicSaveMixin, models.Model):
     DIFFICULTY_CHOICES = [
         ('beginner', 'Beginner'),
         ('intermediate', 'Intermediate'),
@@ -54,6 +57,7 @@ class Challenge(models.Model):
                       blank=True,
                       help_text="Upload a header image for this challenge"
                    )
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     created_at   = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -61,12 +65,11 @@ class Challenge(models.Model):
 
 # models.py (No changes needed here for the model itself, except removing progress-related fields)
 
-class ChallengeParticipant(models.Model):
+class ChallengeParticipant(DayProgressModel):
     participate_id = models.AutoField(primary_key=True)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     challenge = models.ForeignKey(Challenge, on_delete=models.CASCADE)
     date_joined = models.DateField(auto_now_add=True)
-    progress = models.JSONField(default=list, blank=True)  # Stores ticked days, e.g., [1, 3, 5]
 
     class Meta:
         unique_together = ('user', 'challenge')  # Ensures a user can only join a challenge once
@@ -74,5 +77,14 @@ class ChallengeParticipant(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.challenge.title}"
 
+    @property
+    def progress_start(self):
+        """Day 1 is the challenge's start date."""
+        return self.challenge.start_date
+
+    @property
+    def progress_length(self):
+        return (self.challenge.end_date - self.challenge.start_date).days + 1
+
 
 
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import F, Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
 
 
@@ -13,6 +15,82 @@ class ChatMessage(models.Model):
 
     class Meta:
         ordering = ['timestamp']
+        indexes = [
+            models.Index(fields=['sender', 'recipient', 'timestamp'], name='chat_conversation_idx'),
+            models.Index(fields=['recipient', 'sender', 'is_read'], name='chat_unread_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.sender} to {self.recipient}: {self.message[:20]}..."
\ No newline at end of file
+        return f"{self.sender} to {self.recipient}: {self.message[:20]}..."
+
+    @classmethod
+    def mark_conversation_read(cls, reader, sender_id, up_to=None):
+        """
+        Mark the unread messages from `sender_id` to `reader` with an id up to
+        `up_to` (default: all of them) as read in a single UPDATE.
+        Returns the number of updated rows and the id bound that was used.
+        """
+        messages = cls.objects.filter(recipient=reader, sender_id=sender_id, is_read=False)
+        if up_to is not None:
+            messages = messages.filter(id__lte=up_to)
+        updated = messages.update(is_read=True)
+        if updated:
+            Conversation.objects.refresh_unread(reader.id, sender_id)
+        return updated, up_to
+
+
+class ConversationQuerySet(models.QuerySet):
+    def record_message(self, message):
+        """Move both participants' conversation rows to `message`."""
+        for owner_id, counterpart_id, unread in (
+            (message.sender_id, message.recipient_id, 0),
+            (message.recipient_id, message.sender_id, 1),
+        ):
+            values = {
+                'last_message': message,
+                'last_message_at': message.timestamp,
+            }
+            rows = self.filter(owner_id=owner_id, counterpart_id=counterpart_id)
+            if rows.update(unread_count=F('unread_count') + unread, **values):
+                continue
+            try:
+                with transaction.atomic():
+                    self.create(owner_id=owner_id, counterpart_id=counterpart_id, unread_count=unread, **values)
+            except IntegrityError:
+                # Created concurrently by another message of the same pair.
+                rows.update(unread_count=F('unread_count') + unread, **values)
+
+    def refresh_unread(self, owner_id, counterpart_id):
+        """Recount the messages `owner_id` has not read from `counterpart_id`."""
+        unread = ChatMessage.objects.filter(
+            sender_id=OuterRef('counterpart_id'),
+            recipient_id=OuterRef('owner_id'),
+            is_read=False
+        ).order_by().values('recipient_id').annotate(count=Count('id')).values('count')
+        return self.filter(owner_id=owner_id, counterpart_id=counterpart_id).update(
+            unread_count=Coalesce(Subquery(unread), Value(0))
+        )
+
+
+class Conversation(models.Model):
+    """
+    Denormalized inbox entry: one row per participant and counterpart, kept up
+    to date on every message insert so the inbox is a single indexed read.
+    """
+    owner = models.ForeignKey(CustomUser, related_name='conversations', on_delete=models.CASCADE)
+    counterpart = models.ForeignKey(CustomUser, related_name='+', on_delete=models.CASCADE)
+    last_message = models.ForeignKey(ChatMessage, related_name='+', null=True, on_delete=models.SET_NULL)
+    last_message_at = models.DateTimeField()
+    unread_count = models.PositiveIntegerField(default=0)
+
+    objects = ConversationQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-last_message_at']
+        unique_together = ('owner', 'counterpart')
+        indexes = [
+            models.Index(fields=['owner', '-last_message_at'], name='conversation_inbox_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.owner} with {self.counterpart}"
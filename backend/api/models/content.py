@@ -1,8 +1,9 @@
 from django.db import models
+from ..models.media import AtomicSaveMixin
 
 
 
-class EducationalContent(models.Model):
+class EducationalContent(AtomicSaveMixin, models.Model):
     CONTENT_TYPE_CHOICES = [
         ('video', 'Video'),
         ('blog', 'Blog'),
@@ -19,6 +20,7 @@ class EducationalContent(models.Model):
     upload_date = models.DateTimeField(auto_now_add=True)
 
     thumbnail = models.ImageField(upload_to='content_thumbnails/', blank=True, null=True)
+    thumbnail_variants = models.JSONField(default=dict, blank=True, editable=False)
     video_url = models.URLField(blank=True, null=True)
     blog_content = models.TextField(blank=True, null=True)
 
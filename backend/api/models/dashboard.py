@@ -0,0 +1,128 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import models
+from django.db.models import Count
+from django.utils import timezone
+from ..models.user import CustomUser
+from ..models.fitness import FitnessPlan
+from ..models.meal import MealPlan
+from ..models.challenge import Challenge
+from ..models.content import EducationalContent
+from ..models.activity import ActivityEvent
+
+ADMIN_DASHBOARD = 'admin'
+
+# react-icons names the admin dashboard renders next to each activity type
+ACTIVITY_ICONS = {
+    ActivityEvent.REGISTER: 'FaUserPlus',
+    ActivityEvent.JOIN_FITNESS_PLAN: 'FaCalendarAlt',
+    ActivityEvent.JOIN_MEAL_PLAN: 'FaUtensils',
+    ActivityEvent.JOIN_CHALLENGE: 'FaTrophy',
+    ActivityEvent.TICK_FITNESS_PLAN: 'FaCheckCircle',
+    ActivityEvent.TICK_CHALLENGE: 'FaCheckCircle',
+    ActivityEvent.SUBSCRIBE: 'FaCrown',
+    ActivityEvent.SUBSCRIPTION_EXPIRED: 'FaHourglassEnd',
+}
+
+
+def recent_activities(limit=10):
+    """
+    The latest activity of the past week, read live rather than kept in the
+    snapshot: it is one indexed query, and the snapshot is not marked stale
+    by every logged event.
+    """
+    week_ago = timezone.now() - timedelta(days=7)
+    return [
+        {
+            'description': event.description,
+            'timestamp': event.created_at.isoformat(),
+            'icon': ACTIVITY_ICONS.get(event.event_type, 'FaBell')
+        }
+        for event in ActivityEvent.objects.filter(created_at__gte=week_ago)[:limit]
+    ]
+
+
+def compute_admin_dashboard():
+    """Builds the admin dashboard metrics from the live tables."""
+    return {
+        'total_users': CustomUser.objects.count(),
+        'total_meal_plans': MealPlan.objects.count(),
+        'total_fitness_plans': FitnessPlan.objects.count(),
+        'total_challenges': Challenge.objects.count(),
+        'total_contents': EducationalContent.objects.count(),
+        'most_joined_fitness_plans': list(FitnessPlan.objects.annotate(
+            user_count=Count('users')
+        ).order_by('-user_count')[:3].values('name', 'user_count')),
+        'most_joined_meal_plans': list(MealPlan.objects.annotate(
+            user_count=Count('users')
+        ).order_by('-user_count')[:3].values('name', 'user_count')),
+        'most_joined_challenges': list(Challenge.objects.annotate(
+            participant_count=Count('challengeparticipant')
+        ).order_by('-participant_count')[:3].values('title', 'participant_count')),
+        'most_viewed_contents': list(EducationalContent.objects.order_by('-views')[:3].values('title', 'views')),
+    }
+
+
+SNAPSHOT_BUILDERS = {
+    ADMIN_DASHBOARD: compute_admin_dashboard,
+}
+
+
+def refresh_interval():
+    return getattr(settings, 'DASHBOARD_REFRESH_INTERVAL', 60)
+
+
+class DashboardSnapshotQuerySet(models.QuerySet):
+    def refresh(self, key=ADMIN_DASHBOARD):
+        """Recomputes and stores the snapshot for `key`."""
+        # Stamped before the queries run, so changes made meanwhile leave it stale
+        computed_at = timezone.now()
+        snapshot, _ = self.update_or_create(
+            key=key,
+            defaults={'data': SNAPSHOT_BUILDERS[key](), 'computed_at': computed_at}
+        )
+        return snapshot
+
+    def mark_stale(self, key=ADMIN_DASHBOARD):
+        """Records that the data behind `key` changed; one UPDATE, nothing is recomputed."""
+        return self.filter(key=key).update(changed_at=timezone.now())
+
+    def current(self, key=ADMIN_DASHBOARD, refresh=False):
+        """
+        Returns the stored snapshot, computing it if it is missing or `refresh`
+        is set, or if it is stale and older than DASHBOARD_REFRESH_INTERVAL
+        seconds, so however often the data changes it is recomputed at most
+        once per interval.
+        """
+        snapshot = None if refresh else self.filter(key=key).first()
+        if snapshot and snapshot.is_stale:
+            if timezone.now() - snapshot.computed_at >= timedelta(seconds=refresh_interval()):
+                snapshot = None
+        return snapshot or self.refresh(key)
+
+
+class DashboardSnapshot(models.Model):
+    """
+    Precomputed dashboard metrics, so the dashboard endpoints read one row
+    instead of aggregating the whole database on every hit. Signals only mark
+    it stale by setting `changed_at`; it is recomputed lazily when read (see
+    DashboardSnapshotQuerySet.current) or by the `refresh_dashboard`
+    management command.
+    """
+    key = models.CharField(max_length=50, unique=True)
+    data = models.JSONField(default=dict)
+    computed_at = models.DateTimeField()
+    changed_at = models.DateTimeField(null=True, blank=True)
+
+    objects = DashboardSnapshotQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = 'Dashboard Snapshot'
+        verbose_name_plural = 'Dashboard Snapshots'
+
+    def __str__(self):
+        return f"{self.key} ({self.computed_at:%Y-%m-%d %H:%M})"
+
+    @property
+    def is_stale(self):
+        return self.changed_at is not None and self.changed_at >= self.computed_at
@@ -1,6 +1,7 @@
 from django.db import models
+from ..models.media import AtomicSaveMixin
 
-class Exercise(models.Model):
+class Exercise(AtomicSaveMixin, models.Model):
     MUSCLE_GROUP = [
         ('fullbody', 'Full Body Exercise'),
         ('chest', 'Chest Exercise'),
@@ -26,6 +27,7 @@ class Exercise(models.Model):
     name = models.CharField(max_length=40, unique=True)
     description = models.TextField(max_length=500, null=True, blank=True)
     image = models.ImageField(upload_to='exercise_thumbnails/', blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     calories_burned = models.FloatField(help_text="Estimated calories burned per minute",null=True,blank=True)
     
     muscle_group= models.CharField(
@@ -49,6 +51,12 @@ class Exercise(models.Model):
         
     )
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['muscle_group', 'difficulty', 'equipment'], name='exercise_filter_idx'),
+            models.Index(fields=['difficulty', 'equipment'], name='exercise_difficulty_idx'),
+        ]
     
     def __str__(self):
         return self.name
\ No newline at end of file
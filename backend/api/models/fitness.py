@@ -1,12 +1,15 @@
 from django.db import models
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from ..models.user import CustomUser
 from ..models.exercise import Exercise
+from ..models.progress import DayProgressModel
+from ..models.media import AtomicSaveMixin
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
-class FitnessPlan(models.Model):
+class FitnessPlan(AtomicSaveMixin, models.Model):
     PLAN_TYPE = [
         ('weight_loss', 'Weight Loss'),
         ('muscle_gain', 'Muscle Gain'),
@@ -43,17 +46,17 @@ class FitnessPlan(models.Model):
         null=True,
         blank=True
     )
+    picture_variants = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return self.name
 
-class FitnessPlanUser(models.Model):
+class FitnessPlanUser(DayProgressModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='fitness_plan_users')
     fitness_plan = models.ForeignKey(FitnessPlan, on_delete=models.CASCADE, related_name='users')
     joined_at = models.DateTimeField(auto_now_add=True)
-    progress = models.JSONField(default=list, blank=True)  # Stores ticked days, e.g., [1, 2, 3]
 
     class Meta:
         unique_together = ('user', 'fitness_plan')  # Prevent duplicate joins
@@ -63,6 +66,15 @@ class FitnessPlanUser(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.fitness_plan.name}"
 
+    @property
+    def progress_start(self):
+        """Day 1 is the join date."""
+        return timezone.localdate(self.joined_at)
+
+    @property
+    def progress_length(self):
+        return self.fitness_plan.duration_weeks * 7
+
 class FitnessPlanExercise(models.Model):
     DAYS_OF_WEEK = [
         ('monday', 'Monday'),
@@ -1,6 +1,7 @@
 from django.db import models
+from ..models.media import AtomicSaveMixin
 
-class Food(models.Model):
+class Food(AtomicSaveMixin, models.Model):
     FOOD_TYPE_CHOICES = [
     ('fruit', 'Fruit'),
     ('vegetable', 'Vegetable'),
@@ -15,6 +16,7 @@ class Food(models.Model):
 
     name = models.CharField(max_length=40, unique=True)
     image = models.ImageField(upload_to='exercise_thumbnails/', blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField(max_length=500, null= True, blank= True)
     carbs = models.FloatField(help_text="Grams of carbs per 100g ",null=True,blank=True)
     protein = models.FloatField(help_text="Grams of carbs per 100g")
@@ -28,6 +30,11 @@ class Food(models.Model):
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['food_type', 'name'], name='food_type_idx'),
+        ]
     
     @property
     def calories(self):
@@ -1,8 +1,12 @@
-from django.db import models
+import threading
+from django.db import models, transaction
+from django.db.models import F, FloatField, Sum, Value
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator
 from ..models.user import CustomUser
 from ..models.food import Food
 from django.contrib.auth import get_user_model
+from ..models.media import AtomicSaveMixin
 # ... keep your MealPlan, MealPlanUser, MealFood models ...
 
 
@@ -15,7 +19,63 @@ from django.core.validators import MinValueValidator
 
 User = get_user_model()
 
-class MealPlan(models.Model):
+MACRO_FIELDS = ('calories', 'carbs', 'protein', 'fat')
+
+
+def _macro_expression(macro, prefix=''):
+    """Build the SQL expression for a macro of a MealFood row (per 100g * grams)."""
+    food = f'{prefix}food__'
+    grams = F(f'{prefix}quantity_grams')
+    if macro == 'calories':
+        per_100g = (
+            Coalesce(F(f'{food}carbs'), Value(0.0)) * Value(4.0)
+            + Coalesce(F(f'{food}protein'), Value(0.0)) * Value(4.0)
+            + Coalesce(F(f'{food}fat'), Value(0.0)) * Value(9.0)
+        )
+    else:
+        per_100g = Coalesce(F(f'{food}{macro}'), Value(0.0))
+    return models.ExpressionWrapper(per_100g * grams / Value(100.0), output_field=FloatField())
+
+
+class MealPlanQuerySet(models.QuerySet):
+    def with_totals(self):
+        """Annotate total_calories/carbs/protein/fat for the whole plan."""
+        return self.annotate(**{
+            f'total_{macro}': Coalesce(
+                Sum(_macro_expression(macro, prefix='meal_foods__')),
+                Value(0.0),
+                output_field=FloatField()
+            )
+            for macro in MACRO_FIELDS
+        })
+
+    def with_meal_foods(self):
+        """Prefetch meal foods with their food and per-row totals in two queries."""
+        return self.prefetch_related(
+            models.Prefetch(
+                'meal_foods',
+                queryset=MealFood.objects.select_related('food').with_totals()
+            )
+        )
+
+
+class MealFoodQuerySet(models.QuerySet):
+    def with_totals(self):
+        """Annotate calories/carbs/protein/fat for the quantity of each row."""
+        return self.annotate(**{
+            macro: _macro_expression(macro) for macro in MACRO_FIELDS
+        })
+
+    def daily_totals(self, by_meal_time=False):
+        """Group rows by plan and day (and meal time), summing each macro in the database."""
+        group_by = ['meal_plan_id', 'day'] + (['meal_time'] if by_meal_time else [])
+        return self.order_by().values(*group_by).annotate(**{
+            macro: Coalesce(Sum(_macro_expression(macro)), Value(0.0), output_field=FloatField())
+            for macro in MACRO_FIELDS
+        }).order_by(*group_by)
+
+
+class MealPlan(AtomicSaveMixin, models.Model):
     MEAL_PLAN_TYPE = [
         ('weight_loss', 'Weight Loss'),
         ('muscle_gain', 'Muscle Gain'),
@@ -45,12 +105,24 @@ class MealPlan(models.Model):
         blank=True,
         help_text="Image representing the meal plan"
     )
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = MealPlanQuerySet.as_manager()
     
     def __str__(self):
         return self.name
 
+    def nutrition_totals(self):
+        """Plan-wide macro totals, read from the annotation when available."""
+        if all(hasattr(self, f'total_{macro}') for macro in MACRO_FIELDS):
+            return {macro: getattr(self, f'total_{macro}') for macro in MACRO_FIELDS}
+        totals = self.meal_foods.aggregate(**{
+            macro: Sum(_macro_expression(macro)) for macro in MACRO_FIELDS
+        })
+        return {macro: totals[macro] or 0 for macro in MACRO_FIELDS}
+
 
 from django.db import models
 from django.contrib.auth import get_user_model
@@ -106,25 +178,104 @@ class MealFood(models.Model):
         help_text="Order of food in the meal"
     )
     
+    objects = MealFoodQuerySet.as_manager()
+
     class Meta:
         ordering = ['day', 'meal_time', 'order']
         unique_together = ['meal_plan', 'food', 'day', 'meal_time']
     
+    # The total_* properties prefer the values annotated by
+    # MealFoodQuerySet.with_totals() and only touch self.food as a fallback.
     @property
     def total_calories(self):
+        if hasattr(self, 'calories'):
+            return self.calories
         return (self.food.calories / 100) * self.quantity_grams
     
     @property
     def total_carbs(self):
+        if hasattr(self, 'carbs'):
+            return self.carbs
         return (self.food.carbs / 100) * self.quantity_grams if self.food.carbs else 0
     
     @property
     def total_protein(self):
+        if hasattr(self, 'protein'):
+            return self.protein
         return (self.food.protein / 100) * self.quantity_grams if self.food.protein else 0
     
     @property
     def total_fat(self):
+        if hasattr(self, 'fat'):
+            return self.fat
         return (self.food.fat / 100) * self.quantity_grams if self.food.fat else 0
     
     def __str__(self):
-        return f"{self.meal_plan.name} - Day {self.day} - {self.get_meal_time_display()} - {self.food.name}"
\ No newline at end of file
+        return f"{self.meal_plan.name} - Day {self.day} - {self.get_meal_time_display()} - {self.food.name}"
+
+
+class MealPlanDayNutritionQuerySet(models.QuerySet):
+    def rebuild(self, meal_plan_ids):
+        """Recompute the rollup rows of the given plans from their meal foods."""
+        meal_plan_ids = set(meal_plan_ids)
+        if not meal_plan_ids:
+            return 0
+        rows = [
+            MealPlanDayNutrition(**totals)
+            for totals in MealFood.objects.filter(
+                meal_plan_id__in=meal_plan_ids
+            ).daily_totals(by_meal_time=True)
+        ]
+        with transaction.atomic():
+            self.filter(meal_plan_id__in=meal_plan_ids).delete()
+            self.bulk_create(rows)
+        return len(rows)
+
+
+class MealPlanDayNutrition(models.Model):
+    """Materialized macro totals of a meal plan per day and meal time."""
+    meal_plan = models.ForeignKey(
+        MealPlan,
+        on_delete=models.CASCADE,
+        related_name='day_nutrition'
+    )
+    day = models.PositiveIntegerField()
+    meal_time = models.CharField(
+        max_length=20,
+        choices=MealFood.MEAL_TIME_CHOICES
+    )
+    calories = models.FloatField(default=0)
+    carbs = models.FloatField(default=0)
+    protein = models.FloatField(default=0)
+    fat = models.FloatField(default=0)
+
+    objects = MealPlanDayNutritionQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['day', 'meal_time']
+        unique_together = ['meal_plan', 'day', 'meal_time']
+        verbose_name = 'Meal Plan Day Nutrition'
+        verbose_name_plural = 'Meal Plan Day Nutrition'
+
+    def __str__(self):
+        return f"{self.meal_plan_id} - Day {self.day} - {self.get_meal_time_display()}"
+
+
+_pending = threading.local()
+
+
+def _flush_nutrition_rebuilds():
+    meal_plan_ids = getattr(_pending, 'meal_plan_ids', set())
+    _pending.meal_plan_ids = set()
+    MealPlanDayNutrition.objects.rebuild(meal_plan_ids)
+
+
+def schedule_nutrition_rebuild(meal_plan_ids):
+    """Rebuild the nutrition rollup of the given plans once the transaction commits.
+
+    Plans touched several times in the same transaction are rebuilt only once.
+    """
+    if not hasattr(_pending, 'meal_plan_ids'):
+        _pending.meal_plan_ids = set()
+    _pending.meal_plan_ids.update(meal_plan_ids)
+    transaction.on_commit(_flush_nutrition_rebuilds)
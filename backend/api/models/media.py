@@ -0,0 +1,77 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+
+class StoredFileQuerySet(models.QuerySet):
+    def acquire(self, name, size):
+        """Count one more reference to `name`. Returns True if it is a new file."""
+        if self.filter(name=name).update(references=F('references') + 1):
+            return False
+        try:
+            with transaction.atomic():
+                self.create(name=name, size=size, references=1)
+            return True
+        except IntegrityError:
+            # Stored concurrently by an identical upload.
+            self.filter(name=name).update(references=F('references') + 1)
+            return False
+
+    def release(self, name):
+        """
+        Drop one reference to `name`. Returns True when none remain and the
+        file can be removed; files stored before reference counting have no
+        row and are released by their only owner. The row stays locked until
+        the surrounding transaction ends, so remove the file inside it.
+        """
+        with transaction.atomic():
+            stored = self.select_for_update().filter(name=name).first()
+            if stored is None:
+                return True
+            if stored.references > 1:
+                self.filter(pk=stored.pk).update(references=F('references') - 1)
+                return False
+            stored.delete()
+            return True
+
+
+def _is_upload(value):
+    # A File assigned to the field, or a FieldFile not yet saved to storage
+    return value is not None and not isinstance(value, str) and not getattr(value, '_committed', False)
+
+
+class AtomicSaveMixin:
+    """
+    For models with uploaded files: saves a row with a new upload in a
+    transaction, so the StoredFile reference the upload takes (see
+    api/storage.py) commits with the row or is rolled back with it.
+    """
+
+    def save(self, *args, **kwargs):
+        if not any(
+            isinstance(field, models.FileField) and _is_upload(self.__dict__.get(field.attname))
+            for field in self._meta.concrete_fields
+        ):
+            return super().save(*args, **kwargs)
+        with transaction.atomic(using=kwargs.get('using')):
+            return super().save(*args, **kwargs)
+
+
+class StoredFile(models.Model):
+    """
+    A content-addressed media file (see api/storage.py) and the number of
+    file fields referencing it, so identical uploads share one file that is
+    removed once the last reference goes.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField()
+    references = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = StoredFileQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Stored File"
+        verbose_name_plural = "Stored Files"
+
+    def __str__(self):
+        return f"{self.name} ({self.references})"
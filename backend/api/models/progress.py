@@ -0,0 +1,88 @@
+from django.core import checks
+from django.db import models
+from django.db.models import F, TextField, Value
+from django.db.models.functions import Concat, Left, RPad, Substr
+from django.dispatch import Signal
+from django.utils import timezone
+
+# Sent with `instance` and `day` after a day is ticked; tick_day bypasses save()
+day_ticked = Signal()
+
+
+def decode_progress(bitmap):
+    """List of ticked day numbers in a progress bitmap, e.g. '1010100' -> [1, 3, 5]."""
+    return [index + 1 for index, bit in enumerate(bitmap or '') if bit == '1']
+
+
+class DayProgressQuerySet(models.QuerySet):
+    def tick_day(self, pk, day):
+        """
+        Set `day` in the progress bitmap of row `pk` with a single UPDATE, so
+        concurrent ticks of different days never overwrite each other.
+        """
+        bitmap = F('progress_bitmap')
+        parts = [Value('1'), Substr(bitmap, day + 1)]
+        if day > 1:
+            # Keep the days before `day`, padding with '0' if the bitmap is shorter.
+            parts.insert(0, RPad(Left(bitmap, day - 1), day - 1, Value('0')))
+        return self.filter(pk=pk).update(
+            progress_bitmap=Concat(*parts, output_field=TextField())
+        )
+
+
+class DayProgressModel(models.Model):
+    """
+    Tracks ticked days as a bitmap string: character n-1 is '1' when day n is
+    ticked. It takes one character per day, answers "is day n ticked" without a
+    scan and can be updated atomically in SQL (see DayProgressQuerySet).
+    """
+    progress_bitmap = models.TextField(default='', blank=True)
+
+    objects = DayProgressQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    @property
+    def progress(self):
+        """List of ticked day numbers, e.g. [1, 3, 5]."""
+        return decode_progress(self.progress_bitmap)
+
+    # Day 1 and the number of days tracked differ per subclass (the join date
+    # of a fitness plan, the start date of a challenge), so each concrete
+    # subclass sets these, usually as properties; check() reports a missing one.
+    progress_start = None
+    progress_length = None
+
+    @classmethod
+    def check(cls, **kwargs):
+        errors = super().check(**kwargs)
+        for name in ('progress_start', 'progress_length'):
+            if getattr(cls, name) is None:
+                errors.append(checks.Error(
+                    f"{cls.__name__} must define {name}.", obj=cls, id='api.E001',
+                ))
+        return errors
+
+    def elapsed_days(self, today=None):
+        """Number of days that could have been ticked by `today`, which adherence() divides by."""
+        today = today or timezone.localdate()
+        return max(0, min((today - self.progress_start).days + 1, self.progress_length))
+
+    def adherence(self, today=None):
+        """Ticked vs. elapsed days, e.g. {'ticked_days': 4, 'elapsed_days': 5, 'rate': 0.8}."""
+        elapsed = self.elapsed_days(today or timezone.localdate())
+        ticked = self.progress_bitmap[:elapsed].count('1')
+        return {
+            'ticked_days': ticked,
+            'elapsed_days': elapsed,
+            'rate': round(ticked / elapsed, 3) if elapsed else None,
+        }
+
+    def has_ticked(self, day):
+        return 0 < day <= len(self.progress_bitmap) and self.progress_bitmap[day - 1] == '1'
+
+    def tick_day(self, day):
+        type(self).objects.tick_day(self.pk, day)
+        self.refresh_from_db(fields=['progress_bitmap'])
+        day_ticked.send(sender=type(self), instance=self, day=day)
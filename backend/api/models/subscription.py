@@ -1,11 +1,106 @@
 from datetime import timedelta
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from collections import Counter
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from ..models.activity import ActivityEvent
 
 User = get_user_model()
 
+
+def pick_instructor(specialization):
+    """
+    Returns the active instructor with `specialization` that has the fewest
+    active clients and is below INSTRUCTOR_CLIENT_CAPACITY, or None.
+
+    The chosen row is locked until the surrounding transaction ends, so call
+    this inside the transaction that saves the subscription; the load counter
+    itself is updated by the SubscriptionPlan signals. A locking read returns
+    the latest committed count, so if a concurrent subscription filled the row
+    meanwhile the next candidate is tried.
+    """
+    capacity = getattr(settings, 'INSTRUCTOR_CLIENT_CAPACITY', {}).get(specialization)
+    candidates = User.objects.filter(is_instructor=True, specialization=specialization, is_active=True)
+    if capacity is not None:
+        candidates = candidates.filter(active_client_count__lt=capacity)
+    full = []
+    with transaction.atomic():
+        while True:
+            instructor = candidates.exclude(pk__in=full).select_for_update().order_by('active_client_count', 'id').first()
+            if instructor is None or capacity is None or instructor.active_client_count < capacity:
+                return instructor
+            full.append(instructor.pk)
+
+
+def adjust_instructor_loads(previous, current):
+    """
+    Moves load counters from the instructor ids in `previous` to those in
+    `current` (each the instructors an active subscription counted towards).
+    """
+    released = set(previous) - set(current)
+    added = set(current) - set(previous)
+    release_instructor_loads(Counter(released))
+    if added:
+        User.objects.filter(pk__in=added).update(active_client_count=F('active_client_count') + 1)
+
+
+def release_instructor_loads(released):
+    """
+    Decrements each instructor id in the `released` Counter by its count, in
+    one UPDATE that never takes a counter below zero.
+    """
+    if not released:
+        return
+    User.objects.filter(pk__in=released).update(active_client_count=Greatest(
+        Case(*[When(pk=pk, then=F('active_client_count') - count) for pk, count in released.items()]),
+        Value(0)
+    ))
+
+
+class SubscriptionPlanQuerySet(models.QuerySet):
+    def expire_due(self, now=None, batch_size=1000):
+        """
+        Deactivates subscriptions whose end_date has passed, batch by batch
+        with set-based UPDATEs instead of per-object saves. Their instructors
+        are unassigned and released, and an activity event is recorded for
+        each. Returns the number of subscriptions expired.
+        """
+        now = now or timezone.now()
+        expired = 0
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    self.filter(is_active=True, end_date__lt=now)
+                    .select_for_update(skip_locked=True, of=('self',))
+                    .order_by('end_date', 'id')
+                    .values_list('id', 'user_id', 'user__email', 'trainer_id', 'nutritionist_id')[:batch_size]
+                )
+                if not rows:
+                    return expired
+                self.filter(pk__in=[row[0] for row in rows]).update(
+                    is_active=False, trainer=None, nutritionist=None
+                )
+                release_instructor_loads(Counter(
+                    instructor_id for row in rows for instructor_id in row[3:] if instructor_id
+                ))
+                ActivityEvent.objects.bulk_create([
+                    ActivityEvent(
+                        event_type=ActivityEvent.SUBSCRIPTION_EXPIRED,
+                        user_id=user_id,
+                        description=f"{email}'s subscription expired",
+                        target_id=pk,
+                        created_at=now,
+                    )
+                    for pk, user_id, email, _, _ in rows
+                ])
+            expired += len(rows)
+            if len(rows) < batch_size:
+                return expired
+
+
 class SubscriptionPlan(models.Model):
     PLAN_CHOICES = (
         ('premium', 'Premium'),
@@ -37,9 +132,14 @@ class SubscriptionPlan(models.Model):
         related_name='nutritionist_subscriptions'
     )
 
+    objects = SubscriptionPlanQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Subscription Plan"
         verbose_name_plural = "Subscription Plans"
+        indexes = [
+            models.Index(fields=['is_active', 'end_date'], name='subscription_expiry_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.start_date:
@@ -74,22 +174,19 @@ class SubscriptionPlan(models.Model):
             return True
         return False
 
+    @property
+    def counted_instructor_ids(self):
+        """Instructors whose active-client count includes this subscription."""
+        if not self.is_active:
+            return set()
+        return {pk for pk in (self.trainer_id, self.nutritionist_id) if pk}
+
+    @transaction.atomic
     def assign_instructors(self):
-        """Automatically assign instructors for premium plans"""
+        """Assign the least-loaded trainer and nutritionist to premium plans"""
         if self.plan == 'premium' and not (self.trainer and self.nutritionist):
-            trainers = User.objects.filter(
-                is_instructor=True, 
-                specialization='trainer'
-            )
-            nutritionists = User.objects.filter(
-                is_instructor=True, 
-                specialization='nutritionist'
-            )
-            
-            if trainers.exists():
-                self.trainer = trainers.order_by('?').first()
-            
-            if nutritionists.exists():
-                self.nutritionist = nutritionists.order_by('?').first()
-            
+            if not self.trainer:
+                self.trainer = pick_instructor('trainer')
+            if not self.nutritionist:
+                self.nutritionist = pick_instructor('nutritionist')
             self.save()
\ No newline at end of file
@@ -14,13 +14,68 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
+from django.db.models import Case, Count, OuterRef, Prefetch, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from ..models.media import AtomicSaveMixin
 
-class CustomUser(AbstractUser):
+class CustomUserQuerySet(models.QuerySet):
+    def with_client_summaries(self):
+        """
+        Annotates each instructor's client count and prefetches the clients'
+        summaries, so listing instructors costs a fixed number of queries.
+        """
+        from .subscription import SubscriptionPlan
+
+        def client_count(field):
+            return Subquery(
+                SubscriptionPlan.objects.filter(**{field: OuterRef('pk')}).order_by()
+                .values(field).annotate(total=Count('pk')).values('total'),
+                output_field=models.IntegerField()
+            )
+
+        def client_summaries(field):
+            return Prefetch(
+                f'{field}_subscriptions',
+                queryset=SubscriptionPlan.objects.select_related('user').only(
+                    'id', field, 'user__id', 'user__username', 'user__email', 'user__age'
+                ).order_by('user__username'),
+                to_attr=f'{field}_client_subscriptions'
+            )
+
+        return self.annotate(assigned_clients_total=Case(
+            When(specialization='trainer', then=Coalesce(client_count('trainer'), 0)),
+            When(specialization='nutritionist', then=Coalesce(client_count('nutritionist'), 0)),
+            default=Value(0)
+        )).prefetch_related(client_summaries('trainer'), client_summaries('nutritionist'))
+
+
+    def with_client_overview(self):
+        """
+        Loads a client's goal, subscription, joined plans and challenges in a
+        fixed number of queries, for the instructor's client overview.
+        """
+        from .challenge import ChallengeParticipant
+        from .fitness import FitnessPlanUser
+        from .meal import MealPlanUser
+
+        return self.select_related('goal', 'subscription').prefetch_related(
+            Prefetch('fitness_plan_users', queryset=FitnessPlanUser.objects.select_related('fitness_plan')),
+            Prefetch('meal_plan_users', queryset=MealPlanUser.objects.select_related('meal_plan')),
+            Prefetch('challengeparticipant_set', queryset=ChallengeParticipant.objects.select_related('challenge')),
+        )
+
+
+class CustomUserManager(UserManager.from_queryset(CustomUserQuerySet)):
+    pass
+
+
+class CustomUser(AtomicSaveMixin, AbstractUser):
     email = models.EmailField(max_length=100, unique=True)
     age = models.IntegerField(null=True, blank=True)
     height = models.FloatField(null=True, blank=True)
     weight = models.FloatField(null=True, blank=True)
     profile_picture = models.ImageField(upload_to='profile_pics/', blank=True, null=True)
+    profile_picture_variants = models.JSONField(default=dict, blank=True, editable=False)
     birthday = models.DateField(null=True, blank=True)
 
     # Instructor-specific fields
@@ -34,10 +89,21 @@ class CustomUser(AbstractUser):
         ('nutritionist', 'Nutritionist'),
     ]
     specialization = models.CharField(max_length=30, choices=SPECIALIZATION_CHOICES, null=True, blank=True)
+    active_client_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Active subscriptions assigned to this instructor, maintained by signals"
+    )
+
+    objects = CustomUserManager()
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['is_instructor', 'specialization', 'active_client_count'], name='instructor_load_idx'),
+        ]
+
     def __str__(self):
         return self.email
       
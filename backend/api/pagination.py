@@ -0,0 +1,165 @@
+import base64
+from datetime import datetime
+from urllib import parse
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class MessageCursorPagination(BasePagination):
+    """
+    Keyset pagination over (timestamp, id) for chat messages.
+
+    Without a cursor the latest page of the conversation is returned. `before`
+    walks back through older history and `after` fetches messages newer than a
+    page, so every request is a bounded index range scan. Results are always
+    returned oldest first. `before` and `after` cannot be combined.
+    """
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = 'limit'
+    before_query_param = 'before'
+    after_query_param = 'after'
+    invalid_cursor_message = 'Invalid cursor'
+    conflicting_cursors_message = 'Pass either before or after, not both.'
+    ordering_field = 'timestamp'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        before = self.decode_cursor(request.query_params.get(self.before_query_param))
+        after = self.decode_cursor(request.query_params.get(self.after_query_param))
+        if before is not None and after is not None:
+            raise ValidationError({self.before_query_param: [self.conflicting_cursors_message]})
+        self.cursor = after
+
+        if after is not None:
+            rows = list(self._after(queryset, after).order_by(self.ordering_field, 'id')[:self.page_size + 1])
+            self.has_newer = len(rows) > self.page_size
+            self.page = rows[:self.page_size]
+            self.has_older = True
+        else:
+            if before is not None:
+                queryset = self._before(queryset, before)
+            rows = list(queryset.order_by(f'-{self.ordering_field}', '-id')[:self.page_size + 1])
+            self.has_older = len(rows) > self.page_size
+            self.page = rows[:self.page_size][::-1]
+            self.has_newer = before is not None
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'previous': self.get_previous_link(),
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_previous_link(self):
+        """Link to older messages, or None at the start of the history."""
+        if not self.has_older or not self.page:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.after_query_param)
+        return replace_query_param(url, self.before_query_param, self.encode_cursor(self.page[0]))
+
+    def get_next_link(self):
+        """
+        Link to newer messages. It stays available on the latest page so
+        clients can poll it for messages that arrive later.
+        """
+        if self.page:
+            cursor = self.encode_cursor(self.page[-1])
+        elif self.cursor is not None:
+            cursor = self.encode_cursor_values(*self.cursor)
+        else:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.before_query_param)
+        return replace_query_param(url, self.after_query_param, cursor)
+
+    def _before(self, queryset, cursor):
+        timestamp, pk = cursor
+        field = self.ordering_field
+        return queryset.filter(Q(**{f'{field}__lt': timestamp}) | Q(**{field: timestamp, 'id__lt': pk}))
+
+    def _after(self, queryset, cursor):
+        timestamp, pk = cursor
+        field = self.ordering_field
+        return queryset.filter(Q(**{f'{field}__gt': timestamp}) | Q(**{field: timestamp, 'id__gt': pk}))
+
+    def encode_cursor(self, item):
+        return self.encode_cursor_values(getattr(item, self.ordering_field), item.pk)
+
+    def encode_cursor_values(self, timestamp, pk):
+        raw = parse.urlencode({'t': timestamp.isoformat(), 'i': pk})
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, encoded):
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            values = parse.parse_qs(raw, keep_blank_values=True)
+            return datetime.fromisoformat(values['t'][0]), int(values['i'][0])
+        except (TypeError, ValueError, KeyError, IndexError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class ActivityCursorPagination(MessageCursorPagination):
+    """
+    Newest-first keyset pagination over (created_at, id) for the activity
+    feed. `next` links to older events through the `before` cursor.
+    """
+    page_size = 20
+    max_page_size = 100
+    ordering_field = 'created_at'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        before = self.decode_cursor(request.query_params.get(self.before_query_param))
+        if before is not None:
+            queryset = self._before(queryset, before)
+        rows = list(queryset.order_by(f'-{self.ordering_field}', '-id')[:self.page_size + 1])
+        self.has_older = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        """Link to older events, or None once the log is exhausted."""
+        if not self.has_older:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.before_query_param, self.encode_cursor(self.page[-1]))
+
+
+class CataloguePagination(PageNumberPagination):
+    """
+    Page-number pagination for catalogue lists, so a response holds at most
+    `max_page_size` rows however large the catalogue grows. Clients page with
+    `?page=` and `?limit=` and narrow the list with `?search=`.
+    """
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+
+class InstructorClientPagination(PageNumberPagination):
+    """Pages the client list of the instructor dashboard."""
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
@@ -0,0 +1,66 @@
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+from django_rest_passwordreset.models import ResetPasswordToken, get_password_reset_token_expiry_time
+from knox.models import AuthToken
+
+from .models import ActivityEvent
+
+
+class RetentionPolicy:
+    """
+    Describes one kind of aged data: `get_queryset()` returns the rows that
+    may be deleted now. `purge()` removes them in primary-key batches, each
+    its own short DELETE, so large backlogs never hold long locks.
+    """
+
+    def __init__(self, name, description, get_queryset):
+        self.name = name
+        self.description = description
+        self.get_queryset = get_queryset
+
+    def purge(self, batch_size=1000, pause=0, dry_run=False):
+        queryset = self.get_queryset()
+        if dry_run:
+            return queryset.count()
+        model = queryset.model
+        deleted = 0
+        while True:
+            pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return deleted
+            # Delete through the model so signals (e.g. token cache eviction) still fire
+            deleted += model._default_manager.filter(pk__in=pks).delete()[1].get(model._meta.label, 0)
+            if len(pks) < batch_size:
+                return deleted
+            if pause:
+                time.sleep(pause)
+
+
+def expired_auth_tokens():
+    return AuthToken.objects.filter(expiry__lt=timezone.now())
+
+
+def expired_reset_tokens():
+    expiry = timezone.now() - timedelta(hours=get_password_reset_token_expiry_time())
+    return ResetPasswordToken.objects.filter(created_at__lte=expiry)
+
+
+def old_activity_events():
+    # Subscription rollups are rebuilt from SUBSCRIBE events (see DailyMetric.sources), so those stay
+    return ActivityEvent.objects.filter(created_at__lt=ActivityEvent.retention_cutoff()).exclude(
+        event_type=ActivityEvent.SUBSCRIBE
+    )
+
+
+POLICIES = {
+    policy.name: policy for policy in [
+        RetentionPolicy('auth_tokens', "Expired Knox authentication tokens", expired_auth_tokens),
+        RetentionPolicy('reset_tokens', "Password reset tokens past their expiry time", expired_reset_tokens),
+        RetentionPolicy(
+            'activity_events', "Activity events older than the retention period, except subscriptions",
+            old_activity_events,
+        ),
+    ]
+}
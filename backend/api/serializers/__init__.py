@@ -1,27 +1,35 @@
 from .auth import RegisterSerializer, LoginSerializer
 from .challenge import ChallengeSerializer, ChallengeParticipantSerializer, TickDaySerializer
 from .content import EducationalContentSerializer
-from .exercise import ExerciseSerializer
-from .food import FoodSerializer
+from .exercise import ExerciseSerializer, ExerciseReadSerializer
+from .food import FoodSerializer, FoodReadSerializer
 from .goal import SetupGoalSerializer
-from .fitness_plan import FitnessPlanSerializer, FitnessPlanExerciseSerializer, FitnessPlanUserSerializer, FitnessPlanTickDaySerializer
-from .meal_plan import MealPlanSerializer, MealFoodSerializer, MealPlanUserSerializer
+from .fitness_plan import FitnessPlanSerializer, FitnessPlanExerciseSerializer, FitnessPlanExerciseItemSerializer, FitnessPlanUserSerializer, FitnessPlanTickDaySerializer, FitnessPlanReadSerializer, FitnessPlanExerciseReadSerializer
+from .meal_plan import MealPlanSerializer, MealFoodSerializer, MealFoodItemSerializer, MealPlanUserSerializer, MealPlanDayNutritionSerializer, MealPlanReadSerializer, MealFoodReadSerializer
 from .subscription import SubscriptionSerializer
-from .user import UserSerializer, CustomUserSerializer
+from .user import UserSerializer, CustomUserSerializer, ClientOverviewSerializer
 from .dashboard import DashboardSerializer
-from .chat import ChatMessageSerializer
+from .chat import ChatMessageSerializer, ConversationSerializer, MarkConversationReadSerializer
+from .activity import ActivityEventSerializer
+from .analytics import AnalyticsQuerySerializer
+from .exports import ExportQuerySerializer
 
 __all__ = [
     'RegisterSerializer', 'LoginSerializer',
     'ChallengeSerializer', 'ChallengeParticipantSerializer', 'TickDaySerializer',
     'EducationalContentSerializer',
-    'ExerciseSerializer',
-    'FoodSerializer',
+    'ExerciseSerializer', 'ExerciseReadSerializer',
+    'FoodSerializer', 'FoodReadSerializer',
     'SetupGoalSerializer',
-    'FitnessPlanSerializer', 'FitnessPlanExerciseSerializer', 'FitnessPlanUserSerializer', 'FitnessPlanTickDaySerializer',
-    'MealPlanSerializer', 'MealFoodSerializer', 'MealPlanUserSerializer',
+    'FitnessPlanSerializer', 'FitnessPlanExerciseSerializer', 'FitnessPlanExerciseItemSerializer', 'FitnessPlanUserSerializer', 'FitnessPlanTickDaySerializer',
+    'FitnessPlanReadSerializer', 'FitnessPlanExerciseReadSerializer',
+    'MealPlanSerializer', 'MealFoodSerializer', 'MealFoodItemSerializer', 'MealPlanUserSerializer', 'MealPlanDayNutritionSerializer',
+    'MealPlanReadSerializer', 'MealFoodReadSerializer',
     'SubscriptionSerializer',
-    'UserSerializer', 'CustomUserSerializer',
-    'ChatMessageSerializer',
-    'DashboardSerializer'
+    'UserSerializer', 'CustomUserSerializer', 'ClientOverviewSerializer',
+    'ChatMessageSerializer', 'ConversationSerializer', 'MarkConversationReadSerializer',
+    'DashboardSerializer',
+    'ActivityEventSerializer',
+    'AnalyticsQuerySerializer',
+    'ExportQuerySerializer',
 ]
\ No newline at end of file
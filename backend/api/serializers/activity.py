@@ -0,0 +1,11 @@
+from rest_framework import serializers
+from ..models import ActivityEvent
+
+
+class ActivityEventSerializer(serializers.ModelSerializer):
+    event_type_display = serializers.CharField(source='get_event_type_display', read_only=True)
+
+    class Meta:
+        model = ActivityEvent
+        fields = ['id', 'event_type', 'event_type_display', 'user', 'description', 'target_id', 'created_at']
+        read_only_fields = fields
@@ -0,0 +1,34 @@
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework import serializers
+from ..models import DailyMetric
+
+MAX_RANGE_DAYS = 5 * 366
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of the analytics endpoint."""
+    metrics = serializers.CharField(required=False, help_text="Comma separated metric names, all when omitted")
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    granularity = serializers.ChoiceField(choices=['day', 'week', 'month'], default='day')
+
+    def validate_metrics(self, value):
+        metrics = [metric.strip() for metric in value.split(',') if metric.strip()]
+        valid = {key for key, _ in DailyMetric.METRIC_CHOICES}
+        invalid = [metric for metric in metrics if metric not in valid]
+        if invalid:
+            raise serializers.ValidationError(
+                f"Invalid metric(s): {', '.join(invalid)}. Valid metrics are: {', '.join(sorted(valid))}."
+            )
+        return metrics
+
+    def validate(self, attrs):
+        attrs.setdefault('metrics', [key for key, _ in DailyMetric.METRIC_CHOICES])
+        attrs.setdefault('end', timezone.localdate())
+        attrs.setdefault('start', attrs['end'] - timedelta(days=29))
+        if attrs['start'] > attrs['end']:
+            raise serializers.ValidationError("start must be on or before end.")
+        if (attrs['end'] - attrs['start']).days > MAX_RANGE_DAYS:
+            raise serializers.ValidationError(f"The range cannot exceed {MAX_RANGE_DAYS} days.")
+        return attrs
@@ -53,11 +53,12 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField(write_only=True)
     
     def validate(self, data):
-        user = authenticate(email=data['email'], password=data['password'])
+        user = authenticate(self.context.get('request'), email=data['email'], password=data['password'])
         if user is None:
-            raise serializers.ValidationError("Invalid credentials")
-        if not user.is_active:
-            raise serializers.ValidationError("User account is disabled")
+            # Inactive accounts are rejected by the backend as well
+            raise serializers.ValidationError(
+                "Invalid credentials - email or password incorrect", code='authorization'
+            )
         data['user'] = user
         return data
 
@@ -2,9 +2,11 @@ from rest_framework import serializers
 from rest_framework.fields import CurrentUserDefault
 from datetime import datetime, timedelta
 from ..models import Challenge, ChallengeParticipant
+from ..images import image_srcset
 
 class ChallengeSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Challenge
@@ -12,7 +14,7 @@ class ChallengeSerializer(serializers.ModelSerializer):
             'id', 'title', 'description',
             'duration', 'start_date', 'end_date',
             'difficulty', 'muscle_group', 'workout_type','image',
-            'image_url', 'created_at'
+            'image_url', 'image_srcset', 'created_at'
         ]
 
     def get_image_url(self, obj):
@@ -21,6 +23,9 @@ class ChallengeSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_image_srcset(self, obj):
+        return image_srcset(obj.image, obj.image_variants, self.context.get('request'))
+
 class ChallengeParticipantSerializer(serializers.ModelSerializer):
     challenge_id = serializers.IntegerField(write_only=True)
     challenge = ChallengeSerializer(read_only=True)
@@ -76,7 +81,7 @@ class TickDaySerializer(serializers.Serializer):
         if today < start_date or today > end_date:
             raise serializers.ValidationError("Challenge is not active.")
 
-        if day in instance.progress:
+        if instance.has_ticked(day):
             raise serializers.ValidationError("Day is already ticked.")
 
         return attrs
\ No newline at end of file
@@ -1,4 +1,4 @@
-from ..models import ChatMessage
+from ..models import ChatMessage, Conversation
 from rest_framework import serializers
 from ..serializers.user import UserSerializer
 from django.contrib.auth import get_user_model
@@ -19,4 +19,18 @@ class ChatMessageSerializer(serializers.ModelSerializer):
     def validate(self, data):
         if data.get('recipient') == self.context['request'].user:
             raise serializers.ValidationError("Cannot message yourself")
-        return data
\ No newline at end of file
+        return data
+
+
+class ConversationSerializer(serializers.ModelSerializer):
+    user = UserSerializer(source='counterpart', read_only=True)
+    last_message = ChatMessageSerializer(read_only=True)
+
+    class Meta:
+        model = Conversation
+        fields = ['user', 'last_message', 'last_message_at', 'unread_count']
+
+
+
+class MarkConversationReadSerializer(serializers.Serializer):
+    up_to = serializers.IntegerField(min_value=1, required=False)
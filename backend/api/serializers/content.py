@@ -1,14 +1,16 @@
 from rest_framework import serializers
 from ..models import EducationalContent
+from ..images import image_srcset
 
 class EducationalContentSerializer(serializers.ModelSerializer):
     thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = EducationalContent
         fields = [
             'id', 'title', 'description', 'content_type', 'category',
-            'upload_date', 'thumbnail_url', 'video_url', 'blog_content', 
+            'upload_date', 'thumbnail_url', 'thumbnail_srcset', 'video_url', 'blog_content', 
             'views', 'rating'
         ]
 
@@ -16,6 +18,9 @@ class EducationalContentSerializer(serializers.ModelSerializer):
         if obj.thumbnail:
             return self.context['request'].build_absolute_uri(obj.thumbnail.url)
         return None
+
+    def get_thumbnail_srcset(self, obj):
+        return image_srcset(obj.thumbnail, obj.thumbnail_variants, self.context.get('request'))
     
     def validate(self, data):
         content_type = data.get('content_type', self.instance.content_type if self.instance else None)
@@ -30,4 +30,5 @@ class DashboardSerializer(serializers.Serializer):
         child=serializers.DictField(
             child=serializers.CharField(allow_blank=True)
         )
-    )
\ No newline at end of file
+    )
+    computed_at = serializers.DateTimeField()
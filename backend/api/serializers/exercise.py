@@ -1,7 +1,12 @@
 from rest_framework import serializers
 from ..models import Exercise
+from ..images import image_srcset
+from .fields import ChoiceLabelField, choice_labels, datetime_representation, file_url, optional_float
 
 class ExerciseSerializer(serializers.ModelSerializer):
+    serializer_choice_field = ChoiceLabelField
+    image_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Exercise
         fields = [
@@ -9,6 +14,7 @@ class ExerciseSerializer(serializers.ModelSerializer):
             'name',
             'description',
             'image',
+            'image_srcset',
             'calories_burned',
             'muscle_group',
             'difficulty',
@@ -16,10 +22,27 @@ class ExerciseSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['id', 'created_at']
-        
+
+    def get_image_srcset(self, obj):
+        return image_srcset(obj.image, obj.image_variants, self.context.get('request'))
+
+
+class ExerciseReadSerializer(serializers.BaseSerializer):
+    """
+    Read-only counterpart of ExerciseSerializer for list responses. Builds the
+    same output as a plain dict instead of going through per-field machinery.
+    """
+
     def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['muscle_group'] = dict(Exercise.MUSCLE_GROUP).get(instance.muscle_group)
-        representation['difficulty'] = dict(Exercise.DIFFICULTY_LEVEL).get(instance.difficulty)
-        representation['equipment'] = dict(Exercise.EQUIPMENT_REQUIRED).get(instance.equipment)
-        return representation
\ No newline at end of file
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'description': instance.description,
+            'image': file_url(instance.image, self.context.get('request')),
+            'image_srcset': image_srcset(instance.image, instance.image_variants, self.context.get('request')),
+            'calories_burned': optional_float(instance.calories_burned),
+            'muscle_group': choice_labels(Exercise, 'muscle_group').get(instance.muscle_group),
+            'difficulty': choice_labels(Exercise, 'difficulty').get(instance.difficulty),
+            'equipment': choice_labels(Exercise, 'equipment').get(instance.equipment),
+            'created_at': datetime_representation(instance.created_at),
+        }
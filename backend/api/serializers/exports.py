@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from ..exports import FORMATS
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of an export against the `export` in the context."""
+    columns = serializers.CharField(required=False, help_text="Comma separated column names, all when omitted")
+    output = serializers.ChoiceField(choices=list(FORMATS), default='csv')
+    compress = serializers.ChoiceField(choices=['gzip'], required=False)
+
+    def validate_columns(self, value):
+        try:
+            return self.context['export'].select([name.strip() for name in value.split(',') if name.strip()])
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc))
+
+    def validate(self, attrs):
+        attrs.setdefault('columns', self.context['export'].select())
+        return attrs
@@ -0,0 +1,46 @@
+from functools import lru_cache
+from rest_framework import serializers
+
+
+@lru_cache(maxsize=None)
+def choice_labels(model, field_name):
+    """Value -> label mapping for a model choice field, built once per process."""
+    return dict(model._meta.get_field(field_name).flatchoices)
+
+
+class ChoiceLabelField(serializers.ChoiceField):
+    """
+    Accepts the stored choice value on input and renders its human readable
+    label on output. Set as `serializer_choice_field` on a ModelSerializer so
+    every model choice field gets it without a `to_representation` override.
+    """
+
+    def to_representation(self, value):
+        return self.choices.get(value)
+
+
+_datetime_field = serializers.DateTimeField()
+
+
+def datetime_representation(value):
+    """Renders a datetime exactly like DRF's DateTimeField would."""
+    if value is None:
+        return None
+    return _datetime_field.to_representation(value)
+
+
+def file_url(file, request=None):
+    """Renders a file/image field exactly like DRF's FileField would."""
+    if not file:
+        return None
+    try:
+        url = file.url
+    except AttributeError:
+        return None
+    if request is not None:
+        return request.build_absolute_uri(url)
+    return url
+
+
+def optional_float(value):
+    return None if value is None else float(value)
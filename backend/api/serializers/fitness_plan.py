@@ -1,13 +1,20 @@
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
 from ..models import FitnessPlan, FitnessPlanExercise, FitnessPlanUser
 from django.contrib.auth import get_user_model
-from .exercise import ExerciseSerializer
+from .exercise import ExerciseSerializer, ExerciseReadSerializer
 from .exercise import Exercise
+from .fields import ChoiceLabelField, choice_labels, datetime_representation, file_url
+from ..images import image_srcset
+from .nested import NestedRowsListSerializer, PreloadedPrimaryKeyRelatedField
 from datetime import datetime, timedelta
+from functools import cached_property
 
 User = get_user_model()
 
 class FitnessPlanExerciseSerializer(serializers.ModelSerializer):
+    serializer_choice_field = ChoiceLabelField
     exercise = ExerciseSerializer(read_only=True)
     exercise_id = serializers.PrimaryKeyRelatedField(
         queryset=Exercise.objects.all(),
@@ -30,40 +37,108 @@ class FitnessPlanExerciseSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'day': {'help_text': "Day of the week for this exercise"}
         }
-    
+
+class FitnessPlanExerciseItemSerializer(FitnessPlanExerciseSerializer):
+    """An exercise of a plan as written through FitnessPlanSerializer; `id` names the row to update."""
+    id = serializers.IntegerField(required=False)
+    exercise_id = PreloadedPrimaryKeyRelatedField(
+        queryset=Exercise.objects.all(),
+        source='exercise',
+        write_only=True
+    )
+
+    class Meta(FitnessPlanExerciseSerializer.Meta):
+        list_serializer_class = NestedRowsListSerializer
+        parent_field = 'fitness_plan'
+        natural_key = ('exercise', 'day')
+
+class FitnessPlanExerciseReadSerializer(serializers.BaseSerializer):
+    """Read-only, plain dict counterpart of FitnessPlanExerciseSerializer."""
+
+    @cached_property
+    def exercise_serializer(self):
+        return ExerciseReadSerializer(context=self.context)
+
     def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['day'] = dict(FitnessPlanExercise.DAYS_OF_WEEK).get(instance.day)
-        return representation
+        return {
+            'id': instance.id,
+            'exercise': self.exercise_serializer.to_representation(instance.exercise),
+            'day': choice_labels(FitnessPlanExercise, 'day').get(instance.day),
+            'sets': instance.sets,
+            'reps': instance.reps,
+            'duration_minutes': instance.duration_minutes,
+            'order': instance.order,
+        }
 
 class FitnessPlanSerializer(serializers.ModelSerializer):
-    exercises = FitnessPlanExerciseSerializer(many=True, required=False)
+    exercises = FitnessPlanExerciseItemSerializer(many=True, required=False)
     picture_url = serializers.SerializerMethodField()
+    picture_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = FitnessPlan
-        fields = '__all__'
+        exclude = ['picture_variants']
     
     def get_picture_url(self, obj):
         if obj.picture:
             return self.context['request'].build_absolute_uri(obj.picture.url)
         return None
 
+    def get_picture_srcset(self, obj):
+        return image_srcset(obj.picture, obj.picture_variants, self.context.get('request'))
+
+    def to_representation(self, instance):
+        # Plans just written have no prefetched exercises
+        if 'exercises' not in getattr(instance, '_prefetched_objects_cache', {}):
+            prefetch_related_objects([instance], 'exercises__exercise')
+        return super().to_representation(instance)
+
     def create(self, validated_data):
-        exercises_data = validated_data.pop('exercises', [])
-        fitness_plan = FitnessPlan.objects.create(**validated_data)
-        for exercise_data in exercises_data:
-            FitnessPlanExercise.objects.create(
-                fitness_plan=fitness_plan,
-                exercise_id=exercise_data['exercise'],
-                day=exercise_data['day'],
-                sets=exercise_data['sets'],
-                reps=exercise_data['reps'],
-                duration_minutes=exercise_data.get('duration_minutes'),
-                order=exercise_data.get('order', 0)
-            )
+        exercises = validated_data.pop('exercises', [])
+        with transaction.atomic():
+            fitness_plan = super().create(validated_data)
+            self.fields['exercises'].save_rows(fitness_plan, exercises)
+        return fitness_plan
+
+    def update(self, instance, validated_data):
+        """
+        Updates the plan and, when `exercises` is given, makes its exercises
+        match the list: see NestedRowsListSerializer.
+        """
+        exercises = validated_data.pop('exercises', None)
+        with transaction.atomic():
+            fitness_plan = super().update(instance, validated_data)
+            if exercises is not None:
+                self.fields['exercises'].save_rows(fitness_plan, exercises)
         return fitness_plan
 
+class FitnessPlanReadSerializer(serializers.BaseSerializer):
+    """
+    Read-only counterpart of FitnessPlanSerializer for list responses, with
+    the nested exercises rendered as plain dicts.
+    """
+
+    @cached_property
+    def exercise_serializer(self):
+        return FitnessPlanExerciseReadSerializer(context=self.context)
+
+    def to_representation(self, instance):
+        request = self.context.get('request')
+        return {
+            'id': instance.id,
+            'exercises': [self.exercise_serializer.to_representation(item) for item in instance.exercises.all()],
+            'picture_url': file_url(instance.picture, request),
+            'picture_srcset': image_srcset(instance.picture, instance.picture_variants, request),
+            'name': instance.name,
+            'description': instance.description,
+            'plan_type': instance.plan_type,
+            'duration_weeks': instance.duration_weeks,
+            'difficulty': instance.difficulty,
+            'picture': file_url(instance.picture, request),
+            'created_at': datetime_representation(instance.created_at),
+            'updated_at': datetime_representation(instance.updated_at),
+        }
+
 class FitnessPlanUserSerializer(serializers.ModelSerializer):
     fitness_plan = serializers.PrimaryKeyRelatedField(queryset=FitnessPlan.objects.all())
     user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), default=serializers.CurrentUserDefault())
@@ -102,7 +177,7 @@ class FitnessPlanTickDaySerializer(serializers.Serializer):
         if target_date < joined_at:
             raise serializers.ValidationError("Day is before plan start.")
 
-        if day in instance.progress:
+        if instance.has_ticked(day):
             raise serializers.ValidationError("Day is already ticked.")
 
         return attrs
\ No newline at end of file
@@ -1,7 +1,12 @@
 from rest_framework import serializers
 from ..models import Food
+from ..images import image_srcset
+from .fields import ChoiceLabelField, choice_labels, datetime_representation, file_url, optional_float
 
 class FoodSerializer(serializers.ModelSerializer):
+    serializer_choice_field = ChoiceLabelField
+    image_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Food
         fields= [
@@ -9,6 +14,7 @@ class FoodSerializer(serializers.ModelSerializer):
             'name',
             'description',
             'image',
+            'image_srcset',
             'carbs',
             'protein',
             'food_type',
@@ -20,8 +26,25 @@ class FoodSerializer(serializers.ModelSerializer):
         
     def get_calories(self, obj):
         return round(obj.calories, 2)
-    
+
+    def get_image_srcset(self, obj):
+        return image_srcset(obj.image, obj.image_variants, self.context.get('request'))
+
+
+class FoodReadSerializer(serializers.BaseSerializer):
+    """Read-only, plain dict counterpart of FoodSerializer for list responses."""
+
     def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['food_type'] = dict(Food.FOOD_TYPE_CHOICES).get(instance.food_type)
-        return representation
\ No newline at end of file
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'description': instance.description,
+            'image': file_url(instance.image, self.context.get('request')),
+            'image_srcset': image_srcset(instance.image, instance.image_variants, self.context.get('request')),
+            'carbs': optional_float(instance.carbs),
+            'protein': optional_float(instance.protein),
+            'food_type': choice_labels(Food, 'food_type').get(instance.food_type),
+            'fat': optional_float(instance.fat),
+            'calories': instance.calories,
+            'created_at': datetime_representation(instance.created_at),
+        }
@@ -1,12 +1,18 @@
 from rest_framework import serializers
-from ..models import MealPlan, MealFood, MealPlanUser
+from ..models import MealPlan, MealFood, MealPlanUser, MealPlanDayNutrition
+from ..models.meal import MACRO_FIELDS, schedule_nutrition_rebuild
 from django.contrib.auth import get_user_model
-from .food import FoodSerializer
+from .food import FoodSerializer, FoodReadSerializer
 from .food import Food
+from .fields import ChoiceLabelField, choice_labels, datetime_representation, file_url
+from ..images import image_srcset
+from .nested import NestedRowsListSerializer, PreloadedPrimaryKeyRelatedField
+from functools import cached_property
 
 User = get_user_model()
 
 class MealFoodSerializer(serializers.ModelSerializer):
+    serializer_choice_field = ChoiceLabelField
     food = FoodSerializer(read_only=True)
     food_id = serializers.PrimaryKeyRelatedField(
         queryset=Food.objects.all(),
@@ -45,16 +51,51 @@ class MealFoodSerializer(serializers.ModelSerializer):
     
     def get_total_fat(self, obj):
         return round(obj.total_fat, 2)
-    
+
+class MealFoodItemSerializer(MealFoodSerializer):
+    """A meal food as written in bulk to a plan; `id` names the row to update."""
+    id = serializers.IntegerField(required=False)
+    food_id = PreloadedPrimaryKeyRelatedField(
+        queryset=Food.objects.all(),
+        source='food',
+        write_only=True
+    )
+
+    class Meta(MealFoodSerializer.Meta):
+        list_serializer_class = NestedRowsListSerializer
+        parent_field = 'meal_plan'
+        natural_key = ('food', 'day', 'meal_time')
+
+    def rows_saved(self, parent):
+        schedule_nutrition_rebuild([parent.pk])
+
+class MealFoodReadSerializer(serializers.BaseSerializer):
+    """Read-only, plain dict counterpart of MealFoodSerializer."""
+
+    @cached_property
+    def food_serializer(self):
+        return FoodReadSerializer(context=self.context)
+
     def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['meal_time'] = dict(MealFood.MEAL_TIME_CHOICES).get(instance.meal_time)
-        return representation
+        return {
+            'id': instance.id,
+            'food': self.food_serializer.to_representation(instance.food),
+            'meal_time': choice_labels(MealFood, 'meal_time').get(instance.meal_time),
+            'quantity_grams': instance.quantity_grams,
+            'day': instance.day,
+            'order': instance.order,
+            'total_calories': round(instance.total_calories, 2),
+            'total_carbs': round(instance.total_carbs, 2),
+            'total_protein': round(instance.total_protein, 2),
+            'total_fat': round(instance.total_fat, 2),
+        }
 
 class MealPlanSerializer(serializers.ModelSerializer):
     meal_foods = MealFoodSerializer(many=True, read_only=True)
     plan_type_display = serializers.CharField(source='get_plan_type_display', read_only=True)
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+    nutrition_totals = serializers.SerializerMethodField()
     
     class Meta:
         model = MealPlan
@@ -68,17 +109,55 @@ class MealPlanSerializer(serializers.ModelSerializer):
             'duration_weeks',
             'image',
             'image_url',
+            'image_srcset',
             'created_at',
             'updated_at',
-            'meal_foods'
+            'meal_foods',
+            'nutrition_totals'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at', 'image_url']
+        read_only_fields = ['id', 'created_at', 'updated_at', 'image_url', 'image_srcset']
     
     def get_image_url(self, obj):
         if obj.image:
             return self.context['request'].build_absolute_uri(obj.image.url)
         return None
 
+    def get_image_srcset(self, obj):
+        return image_srcset(obj.image, obj.image_variants, self.context.get('request'))
+
+    def get_nutrition_totals(self, obj):
+        return {macro: round(value, 2) for macro, value in obj.nutrition_totals().items()}
+
+class MealPlanReadSerializer(serializers.BaseSerializer):
+    """
+    Read-only counterpart of MealPlanSerializer for list responses, with the
+    nested meal foods rendered as plain dicts.
+    """
+
+    @cached_property
+    def meal_food_serializer(self):
+        return MealFoodReadSerializer(context=self.context)
+
+    def to_representation(self, instance):
+        request = self.context.get('request')
+        image_url = file_url(instance.image, request)
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'description': instance.description,
+            'plan_type': instance.plan_type,
+            'plan_type_display': choice_labels(MealPlan, 'plan_type').get(instance.plan_type),
+            'daily_calorie_target': instance.daily_calorie_target,
+            'duration_weeks': instance.duration_weeks,
+            'image': image_url,
+            'image_url': image_url,
+            'image_srcset': image_srcset(instance.image, instance.image_variants, request),
+            'created_at': datetime_representation(instance.created_at),
+            'updated_at': datetime_representation(instance.updated_at),
+            'meal_foods': [self.meal_food_serializer.to_representation(item) for item in instance.meal_foods.all()],
+            'nutrition_totals': {macro: round(value, 2) for macro, value in instance.nutrition_totals().items()},
+        }
+
 class MealPlanUserSerializer(serializers.ModelSerializer):
     meal_plan = serializers.PrimaryKeyRelatedField(queryset=MealPlan.objects.all())
     user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), default=serializers.CurrentUserDefault())
@@ -94,4 +173,17 @@ class MealPlanUserSerializer(serializers.ModelSerializer):
             meal_plan=data['meal_plan']
         ).exists():
             raise serializers.ValidationError("You have already joined this meal plan.")
-        return data
\ No newline at end of file
+        return data
+
+class MealPlanDayNutritionSerializer(serializers.ModelSerializer):
+    meal_time_display = serializers.CharField(source='get_meal_time_display', read_only=True)
+
+    class Meta:
+        model = MealPlanDayNutrition
+        fields = ['day', 'meal_time', 'meal_time_display', 'calories', 'carbs', 'protein', 'fat']
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        for macro in MACRO_FIELDS:
+            representation[macro] = round(representation[macro], 2)
+        return representation
@@ -0,0 +1,165 @@
+import json
+from collections import Counter
+
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.utils import html
+
+from .. import cache
+from ..cache import CACHE_NAMESPACES
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that first looks ids up among the objects
+    NestedRowsListSerializer preloads, so a list of rows resolves each related
+    column with one query instead of one per row.
+    """
+    preloaded = None
+
+    def to_internal_value(self, data):
+        if self.preloaded is not None and str(data) in self.preloaded:
+            return self.preloaded[str(data)]
+        return super().to_internal_value(data)
+
+
+def _integer_ids(values):
+    return {
+        int(value) for value in values
+        if (isinstance(value, int) and not isinstance(value, bool)) or (isinstance(value, str) and value.isdigit())
+    }
+
+
+class NestedRowsListSerializer(serializers.ListSerializer):
+    """
+    List serializer for the rows of a parent object, such as a fitness plan's
+    exercises or a meal plan's foods, that saves a submitted list by diffing
+    it against the stored rows.
+
+    The child serializer's Meta names the `parent_field` (FK to the parent)
+    and the `natural_key` fields that are unique per parent. An item with an
+    `id` updates that row, an item without one updates the row with the same
+    natural key or is inserted, and with `delete_missing` stored rows left out
+    of the list are deleted. A row moved onto a natural key that another row
+    only gives up in the same save is re-inserted, so its id changes. Each
+    kind of change is one bulk query, all in one transaction.
+    bulk_create/bulk_update send no save signals, so the cache namespaces of
+    the model are invalidated here and an optional `rows_saved(parent)`
+    method of the child covers anything else.
+    """
+
+    def get_value(self, dictionary):
+        # Multipart forms (e.g. with an image upload) send the list as a JSON string
+        if html.is_html_input(dictionary) and isinstance(dictionary.get(self.field_name), str):
+            try:
+                return json.loads(dictionary[self.field_name])
+            except ValueError:
+                return dictionary[self.field_name]
+        return super().get_value(dictionary)
+
+    def to_internal_value(self, data):
+        related = [
+            (name, field) for name, field in self.child.fields.items()
+            if isinstance(field, PreloadedPrimaryKeyRelatedField)
+        ] if isinstance(data, list) else []
+        for name, field in related:
+            ids = _integer_ids(item.get(name) for item in data if isinstance(item, dict))
+            field.preloaded = {str(pk): obj for pk, obj in field.get_queryset().in_bulk(ids).items()}
+        try:
+            return super().to_internal_value(data)
+        finally:
+            for name, field in related:
+                field.preloaded = None
+
+    def validate(self, items):
+        keys, ids = set(), set()
+        for item in items:
+            key = self._item_key(item)
+            if key in keys:
+                raise serializers.ValidationError(
+                    f"Duplicate rows for {', '.join(self.child.Meta.natural_key)}: {key}."
+                )
+            if item.get('id') in ids:
+                raise serializers.ValidationError(f"Duplicate row id: {item['id']}.")
+            keys.add(key)
+            if 'id' in item:
+                ids.add(item['id'])
+        return items
+
+    def _item_key(self, item):
+        return tuple(
+            getattr(item.get(name), 'pk', item.get(name)) for name in self.child.Meta.natural_key
+        )
+
+    def _row_key(self, row):
+        model = self.child.Meta.model
+        return tuple(getattr(row, model._meta.get_field(name).attname) for name in self.child.Meta.natural_key)
+
+    def save_rows(self, parent, items, delete_missing=True):
+        """Makes the rows of `parent` match the validated `items`. Returns (created, updated, deleted) counts."""
+        model = self.child.Meta.model
+        parent_field = self.child.Meta.parent_field
+
+        with transaction.atomic():
+            existing = {row.pk: row for row in model.objects.select_for_update().filter(**{parent_field: parent})}
+            unknown = [item['id'] for item in items if 'id' in item and item['id'] not in existing]
+            if unknown:
+                errors = {'id': [f"Not a row of this {parent._meta.verbose_name}: {', '.join(map(str, unknown))}."]}
+                raise serializers.ValidationError({self.field_name: errors} if self.field_name else errors)
+            by_key = {self._row_key(row): row for row in existing.values()}
+
+            to_create, to_update, updated_fields, kept = [], [], set(), set()
+            # Items naming their row claim it before others are matched by natural key
+            for item in sorted(items, key=lambda item: 'id' not in item):
+                values = {name: value for name, value in item.items() if name != 'id'}
+                row = existing[item['id']] if 'id' in item else by_key.get(self._item_key(values))
+                if row is None or row.pk in kept:
+                    to_create.append(model(**{parent_field: parent}, **values))
+                    continue
+                kept.add(row.pk)
+                changed = [
+                    name for name, value in values.items()
+                    if getattr(row, model._meta.get_field(name).attname) != getattr(value, 'pk', value)
+                ]
+                for name in changed:
+                    setattr(row, name, values[name])
+                if changed:
+                    to_update.append(row)
+                    updated_fields.update(changed)
+
+            deleted = [pk for pk in existing if pk not in kept] if delete_missing else []
+            final_keys = Counter(self._row_key(row) for pk, row in existing.items() if pk not in deleted)
+            final_keys.update(self._row_key(row) for row in to_create)
+            clashes = [key for key, count in final_keys.items() if count > 1]
+            if clashes:
+                errors = [
+                    f"A row for {', '.join(self.child.Meta.natural_key)} {key} already exists." for key in clashes
+                ]
+                raise serializers.ValidationError({self.field_name: errors} if self.field_name else errors)
+            # A row moving onto the key another kept row holds until the UPDATE
+            # runs (e.g. two rows swapping keys) would break the unique
+            # constraint halfway, so it is deleted and inserted again instead
+            # Holders are compared by their stored pk, as re-inserted rows lose theirs
+            holder_pks = {key: holder.pk for key, holder in by_key.items()}
+            for row in list(to_update):
+                holder_pk = holder_pks.get(self._row_key(row))
+                if holder_pk is not None and holder_pk != row.pk and holder_pk not in deleted:
+                    to_update.remove(row)
+                    deleted.append(row.pk)
+                    row.pk = None
+                    row._state.adding = True
+                    to_create.append(row)
+            # Deleted first, so a row can take over the natural key of one that goes
+            if deleted:
+                model.objects.filter(pk__in=deleted).delete()
+            if to_update:
+                model.objects.bulk_update(to_update, sorted(updated_fields))
+            if to_create:
+                model.objects.bulk_create(to_create)
+
+            if to_create or to_update or deleted:
+                namespaces = CACHE_NAMESPACES.get(model, [])
+                transaction.on_commit(lambda: cache.invalidate(*namespaces))
+                if hasattr(self.child, 'rows_saved'):
+                    self.child.rows_saved(parent)
+        return len(to_create), len(to_update), len(deleted)
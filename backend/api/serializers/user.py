@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils import timezone
 from ..models import SubscriptionPlan
+from .fields import datetime_representation, file_url
+from ..images import image_srcset
 
 User = get_user_model()
 
@@ -13,22 +17,26 @@ class CustomUserSerializer(serializers.ModelSerializer):
     assigned_clients_count = serializers.SerializerMethodField()
     clients = serializers.SerializerMethodField()
     profile_picture = serializers.ImageField(max_length=None, use_url=True, allow_null=True, required=False)
+    profile_picture_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name', 'weight', 'height',
             'is_instructor', 'specialization', 'experience', 'bio', 'contact', 'birthday', 'age',
-            'assigned_clients_count', 'clients', 'profile_picture'
+            'assigned_clients_count', 'clients', 'profile_picture', 'profile_picture_srcset'
         ]
         extra_kwargs = {
             'password': {'write_only': True},  # Ensure password is write-only
         }
 
+    def get_profile_picture_srcset(self, obj):
+        return image_srcset(obj.profile_picture, obj.profile_picture_variants, self.context.get('request'))
+
     def get_assigned_clients_count(self, obj):
-        if 'clients' in self.context:
-            return self.context['clients'].count()
-        
+        if hasattr(obj, 'assigned_clients_total'):
+            return obj.assigned_clients_total
+
         if obj.specialization == 'trainer':
             return SubscriptionPlan.objects.filter(trainer=obj).count()
         elif obj.specialization == 'nutritionist':
@@ -38,6 +46,14 @@ class CustomUserSerializer(serializers.ModelSerializer):
     def get_clients(self, obj):
         if 'clients' in self.context:
             clients = self.context['clients']
+        elif hasattr(obj, 'trainer_client_subscriptions'):
+            # Prefetched by CustomUserQuerySet.with_client_summaries()
+            if obj.specialization == 'trainer':
+                clients = [subscription.user for subscription in obj.trainer_client_subscriptions]
+            elif obj.specialization == 'nutritionist':
+                clients = [subscription.user for subscription in obj.nutritionist_client_subscriptions]
+            else:
+                return []
         else:
             if obj.specialization == 'trainer':
                 clients = User.objects.filter(subscription__trainer=obj)
@@ -86,4 +102,107 @@ class CustomUserSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+
+class ClientOverviewSerializer(serializers.BaseSerializer):
+    """
+    Read-only overview of a client for their instructor: profile, goal,
+    subscription, joined plans and challenges with adherence, and the recent
+    messages between the two (passed as context['recent_messages']).
+    Expects a user loaded with CustomUserQuerySet.with_client_overview().
+    """
+
+    def to_representation(self, instance):
+        request = self.context.get('request')
+        today = timezone.localdate()
+        return {
+            'profile': {
+                'id': instance.id,
+                'username': instance.username,
+                'email': instance.email,
+                'first_name': instance.first_name,
+                'last_name': instance.last_name,
+                'age': instance.age,
+                'height': instance.height,
+                'weight': instance.weight,
+                'profile_picture': file_url(instance.profile_picture, request),
+                'profile_picture_srcset': image_srcset(instance.profile_picture, instance.profile_picture_variants, request),
+                'date_joined': datetime_representation(instance.date_joined),
+            },
+            'goal': self.goal_representation(instance),
+            'subscription': self.subscription_representation(instance),
+            'fitness_plans': [
+                {
+                    'id': joined.id,
+                    'fitness_plan': {
+                        'id': joined.fitness_plan.id,
+                        'name': joined.fitness_plan.name,
+                        'duration_weeks': joined.fitness_plan.duration_weeks,
+                    },
+                    'joined_at': datetime_representation(joined.joined_at),
+                    'progress': joined.progress,
+                    'adherence': joined.adherence(today),
+                }
+                for joined in instance.fitness_plan_users.all()
+            ],
+            'meal_plans': [
+                {
+                    'id': joined.id,
+                    'meal_plan': {'id': joined.meal_plan.id, 'name': joined.meal_plan.name},
+                    'joined_at': datetime_representation(joined.joined_at),
+                }
+                for joined in instance.meal_plan_users.all()
+            ],
+            'challenges': [
+                {
+                    'participate_id': participant.participate_id,
+                    'challenge': {
+                        'id': participant.challenge.id,
+                        'title': participant.challenge.title,
+                        'start_date': participant.challenge.start_date.isoformat(),
+                        'end_date': participant.challenge.end_date.isoformat(),
+                    },
+                    'date_joined': participant.date_joined.isoformat(),
+                    'progress': participant.progress,
+                    'adherence': participant.adherence(today),
+                }
+                for participant in instance.challengeparticipant_set.all()
+            ],
+            'recent_messages': [
+                {
+                    'id': message.id,
+                    'sender': message.sender_id,
+                    'recipient': message.recipient_id,
+                    'message': message.message,
+                    'timestamp': datetime_representation(message.timestamp),
+                    'is_read': message.is_read,
+                }
+                for message in self.context.get('recent_messages', [])
+            ],
+        }
+
+    def goal_representation(self, instance):
+        try:
+            goal = instance.goal
+        except ObjectDoesNotExist:
+            return None
+        return {
+            'goal_type': goal.goal_type,
+            'start_date': goal.start_date.isoformat(),
+            'target_date': goal.target_date.isoformat(),
+            'target_weight': goal.target_weight,
+            'activity_level': goal.activity_level,
+        }
+
+    def subscription_representation(self, instance):
+        try:
+            subscription = instance.subscription
+        except ObjectDoesNotExist:
+            return None
+        return {
+            'plan': subscription.plan,
+            'is_active': subscription.is_active,
+            'start_date': datetime_representation(subscription.start_date),
+            'end_date': datetime_representation(subscription.end_date),
+        }
@@ -0,0 +1,287 @@
+import threading
+from django.db import transaction
+from django.db.models.signals import post_init, pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from .models import (
+    Food, MealPlan, MealFood, ChatMessage, Conversation,
+    FitnessPlan, Challenge, EducationalContent,
+    CustomUser, FitnessPlanUser, MealPlanUser, ChallengeParticipant, DashboardSnapshot,
+    ActivityEvent, SubscriptionPlan, DailyMetric,
+)
+from .models.meal import schedule_nutrition_rebuild
+from .models.progress import day_ticked
+from .models.subscription import adjust_instructor_loads
+from knox.models import AuthToken
+from .consumers import broadcast_message, broadcast_read
+from .authentication import token_cache
+from . import cache
+from .cache import CACHE_NAMESPACES
+from .images import IMAGE_FIELDS, delete_variants, is_stale, refresh_variants, variants_field
+
+FOOD_MACRO_FIELDS = {'carbs', 'protein', 'fat'}
+
+_pending = threading.local()
+
+
+@receiver(post_save, sender=MealFood)
+@receiver(post_delete, sender=MealFood)
+def refresh_meal_plan_nutrition(sender, instance, **kwargs):
+    origin = kwargs.get('origin')
+    if isinstance(origin, MealPlan) or getattr(origin, 'model', None) is MealPlan:
+        # The rollup rows are removed by the same cascade.
+        return
+    schedule_nutrition_rebuild([instance.meal_plan_id])
+
+
+@receiver(post_save, sender=Food)
+def refresh_food_nutrition(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and not FOOD_MACRO_FIELDS & set(update_fields):
+        return
+    schedule_nutrition_rebuild(
+        MealFood.objects.filter(food=instance).values_list('meal_plan_id', flat=True).distinct()
+    )
+
+
+@receiver(post_save, sender=ChatMessage)
+def push_chat_message(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        Conversation.objects.record_message(instance)
+        transaction.on_commit(lambda: broadcast_message(instance))
+    elif instance.is_read and (update_fields is None or 'is_read' in update_fields):
+        Conversation.objects.refresh_unread(instance.recipient_id, instance.sender_id)
+        transaction.on_commit(
+            lambda: broadcast_read(instance.sender_id, instance.recipient_id, [instance.id])
+        )
+
+
+
+def invalidate_catalogue_cache(sender, **kwargs):
+    namespaces = CACHE_NAMESPACES[sender]
+    transaction.on_commit(lambda: cache.invalidate(*namespaces))
+
+
+for model in CACHE_NAMESPACES:
+    post_save.connect(invalidate_catalogue_cache, sender=model, dispatch_uid=f'catalogue-cache-save-{model.__name__}')
+    post_delete.connect(invalidate_catalogue_cache, sender=model, dispatch_uid=f'catalogue-cache-delete-{model.__name__}')
+
+
+def _flush_dashboard_refresh():
+    if getattr(_pending, 'dashboard', False):
+        _pending.dashboard = False
+        DashboardSnapshot.objects.mark_stale()
+
+
+def schedule_dashboard_refresh():
+    """Mark the admin dashboard snapshot stale once the transaction commits."""
+    _pending.dashboard = True
+    transaction.on_commit(_flush_dashboard_refresh)
+
+
+# Models whose rows are counted on the admin dashboard, and for the ones
+# listed by name, the field shown in its "most joined/viewed" tables
+DASHBOARD_MODELS = {
+    CustomUser: None,
+    FitnessPlanUser: None,
+    MealPlanUser: None,
+    ChallengeParticipant: None,
+    FitnessPlan: 'name',
+    MealPlan: 'name',
+    Challenge: 'title',
+    EducationalContent: 'title',
+}
+
+
+def refresh_dashboard_on_save(sender, created, update_fields=None, **kwargs):
+    label_field = DASHBOARD_MODELS[sender]
+    if created or (label_field and (update_fields is None or label_field in update_fields)):
+        schedule_dashboard_refresh()
+
+
+def refresh_dashboard_on_delete(sender, **kwargs):
+    schedule_dashboard_refresh()
+
+
+for model in DASHBOARD_MODELS:
+    post_save.connect(refresh_dashboard_on_save, sender=model, dispatch_uid=f'dashboard-save-{model.__name__}')
+    post_delete.connect(refresh_dashboard_on_delete, sender=model, dispatch_uid=f'dashboard-delete-{model.__name__}')
+
+
+@receiver(post_save, sender=CustomUser)
+def record_registration(sender, instance, created, **kwargs):
+    if created:
+        ActivityEvent.objects.create(
+            event_type=ActivityEvent.REGISTER,
+            user=instance,
+            description=f"New user registered: {instance.email}",
+            created_at=instance.date_joined,
+        )
+
+
+@receiver(post_save, sender=FitnessPlanUser)
+def record_fitness_plan_join(sender, instance, created, **kwargs):
+    if created:
+        ActivityEvent.objects.create(
+            event_type=ActivityEvent.JOIN_FITNESS_PLAN,
+            user=instance.user,
+            description=f"{instance.user.email} joined fitness plan: {instance.fitness_plan.name}",
+            target_id=instance.fitness_plan_id,
+        )
+
+
+@receiver(post_save, sender=MealPlanUser)
+def record_meal_plan_join(sender, instance, created, **kwargs):
+    if created:
+        ActivityEvent.objects.create(
+            event_type=ActivityEvent.JOIN_MEAL_PLAN,
+            user=instance.user,
+            description=f"{instance.user.email} joined meal plan: {instance.meal_plan.name}",
+            target_id=instance.meal_plan_id,
+        )
+
+
+@receiver(post_save, sender=ChallengeParticipant)
+def record_challenge_join(sender, instance, created, **kwargs):
+    if created:
+        ActivityEvent.objects.create(
+            event_type=ActivityEvent.JOIN_CHALLENGE,
+            user=instance.user,
+            description=f"{instance.user.email} joined challenge: {instance.challenge.title}",
+            target_id=instance.challenge_id,
+        )
+
+
+@receiver(day_ticked, sender=FitnessPlanUser)
+def record_fitness_plan_tick(sender, instance, day, **kwargs):
+    ActivityEvent.objects.create(
+        event_type=ActivityEvent.TICK_FITNESS_PLAN,
+        user=instance.user,
+        description=f"{instance.user.email} completed day {day} of fitness plan: {instance.fitness_plan.name}",
+        target_id=instance.fitness_plan_id,
+    )
+
+
+@receiver(day_ticked, sender=ChallengeParticipant)
+def record_challenge_tick(sender, instance, day, **kwargs):
+    ActivityEvent.objects.create(
+        event_type=ActivityEvent.TICK_CHALLENGE,
+        user=instance.user,
+        description=f"{instance.user.email} completed day {day} of challenge: {instance.challenge.title}",
+        target_id=instance.challenge_id,
+    )
+
+
+@receiver(pre_save, sender=SubscriptionPlan)
+def remember_subscription_state(sender, instance, **kwargs):
+    # Renewals and reassignments reuse the row, so compare against the stored one
+    previous = sender.objects.filter(pk=instance.pk).first() if instance.pk else None
+    instance._previous_start_date = previous.start_date if previous else None
+    instance._previous_instructor_ids = previous.counted_instructor_ids if previous else set()
+
+
+@receiver(post_save, sender=SubscriptionPlan)
+def update_instructor_loads(sender, instance, **kwargs):
+    adjust_instructor_loads(getattr(instance, '_previous_instructor_ids', set()), instance.counted_instructor_ids)
+    instance._previous_instructor_ids = instance.counted_instructor_ids
+
+
+@receiver(post_delete, sender=SubscriptionPlan)
+def release_instructor_loads(sender, instance, **kwargs):
+    adjust_instructor_loads(instance.counted_instructor_ids, set())
+
+
+@receiver(post_save, sender=SubscriptionPlan)
+def record_subscription(sender, instance, created, **kwargs):
+    if not instance.is_active:
+        return
+    if created or instance.start_date != getattr(instance, '_previous_start_date', instance.start_date):
+        ActivityEvent.objects.create(
+            event_type=ActivityEvent.SUBSCRIBE,
+            user=instance.user,
+            description=f"{instance.user.email} subscribed to {instance.get_plan_display()}",
+            target_id=instance.pk,
+        )
+
+
+# Analytics rollup each activity type counts towards
+EVENT_METRICS = {
+    ActivityEvent.REGISTER: DailyMetric.SIGNUPS,
+    ActivityEvent.JOIN_FITNESS_PLAN: DailyMetric.FITNESS_PLAN_JOINS,
+    ActivityEvent.JOIN_MEAL_PLAN: DailyMetric.MEAL_PLAN_JOINS,
+    ActivityEvent.JOIN_CHALLENGE: DailyMetric.CHALLENGE_JOINS,
+    ActivityEvent.SUBSCRIBE: DailyMetric.SUBSCRIPTIONS,
+}
+
+
+@receiver(post_save, sender=ActivityEvent)
+def update_daily_metrics(sender, instance, created, **kwargs):
+    metric = EVENT_METRICS.get(instance.event_type)
+    if created and metric:
+        DailyMetric.objects.increment(metric, timezone.localdate(instance.created_at))
+
+
+@receiver(post_delete, sender=AuthToken)
+def evict_deleted_token(sender, instance, **kwargs):
+    # Covers knox logout, logout-all and expired token cleanup
+    token_cache.evict(instance.digest)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def evict_user_tokens(sender, instance, **kwargs):
+    # Drops the cached user row so deactivation and profile edits apply at once
+    token_cache.evict_user(instance.pk)
+
+
+def _refresh_image_variants(sender, instance, field_name):
+    if refresh_variants(instance, field_name):
+        # The variants are saved with an UPDATE, so no save signal clears these
+        if sender in CACHE_NAMESPACES:
+            cache.invalidate(*CACHE_NAMESPACES[sender])
+        if sender is CustomUser:
+            token_cache.evict_user(instance.pk)
+
+
+def remember_stored_image(sender, instance, **kwargs):
+    # Read from __dict__ so rows loaded with the image deferred stay deferred
+    name = instance.__dict__.get(IMAGE_FIELDS[sender])
+    instance._stored_image_name = name if isinstance(name, str) else None
+
+
+def note_image_upload(sender, instance, **kwargs):
+    field_name = IMAGE_FIELDS[sender]
+    instance._image_uploaded = (
+        field_name not in instance.get_deferred_fields() and not getattr(instance, field_name)._committed
+    )
+
+
+def update_stored_image(sender, instance, **kwargs):
+    field_name = IMAGE_FIELDS[sender]
+    if {field_name, variants_field(field_name)} & instance.get_deferred_fields():
+        return
+    file = getattr(instance, field_name)
+    previous = getattr(instance, '_stored_image_name', None)
+    # A re-upload of identical content keeps the name but took another reference
+    if previous and (previous != file.name or getattr(instance, '_image_uploaded', False)):
+        transaction.on_commit(lambda: file.storage.delete(previous))
+    instance._stored_image_name = file.name or None
+    if is_stale(file, getattr(instance, variants_field(field_name))):
+        transaction.on_commit(lambda: _refresh_image_variants(sender, instance, field_name))
+
+
+def release_stored_image(sender, instance, **kwargs):
+    file = getattr(instance, IMAGE_FIELDS[sender])
+    variants = getattr(instance, variants_field(IMAGE_FIELDS[sender]))
+    if file:
+        transaction.on_commit(lambda: file.storage.delete(file.name))
+    if variants:
+        transaction.on_commit(lambda: delete_variants(file.storage, variants))
+
+
+for model in IMAGE_FIELDS:
+    post_init.connect(remember_stored_image, sender=model, dispatch_uid=f'stored-image-init-{model.__name__}')
+    pre_save.connect(note_image_upload, sender=model, dispatch_uid=f'stored-image-upload-{model.__name__}')
+    post_save.connect(update_stored_image, sender=model, dispatch_uid=f'stored-image-save-{model.__name__}')
+    post_delete.connect(release_stored_image, sender=model, dispatch_uid=f'stored-image-delete-{model.__name__}')
@@ -0,0 +1,90 @@
+"""
+Content-addressed media storage.
+
+Uploads are named after the SHA-256 of their content, e.g.
+`3f/a9/3fa9…c1.jpg`, whatever the client called them or which field they
+were uploaded to. Identical uploads therefore share one file, counted by a
+StoredFile row and removed when the last reference is deleted, and a URL
+always names the same bytes so it can be cached forever (see
+api/views/media.py).
+"""
+import hashlib
+import os
+import posixpath
+import re
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+
+CONTENT_ADDRESSED_NAME = re.compile(r'^[0-9a-f]{2}/[0-9a-f]{2}/(?P<digest>[0-9a-f]{64})(\.[0-9a-z]+)?$')
+
+
+def content_digest(name):
+    """The content hash a stored name was derived from, or None for other names."""
+    match = CONTENT_ADDRESSED_NAME.match(name)
+    return match.group('digest') if match else None
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    def save(self, name, content, max_length=None):
+        from .models import StoredFile
+
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks():
+            digest.update(chunk)
+            size += len(chunk)
+        name = self.hashed_name(name, digest.hexdigest())
+
+        # Counted in the transaction saving the owning row (see
+        # AtomicSaveMixin), so a rolled back save takes its reference back.
+        # The StoredFile row stays locked meanwhile, so a concurrent delete
+        # of the last reference cannot remove the file this relies on.
+        with transaction.atomic():
+            StoredFile.objects.acquire(name, size)
+            return self._save(name, content)
+
+    def hashed_name(self, name, digest):
+        extension = posixpath.splitext(name)[1].lower()
+        return f'{digest[:2]}/{digest[2:4]}/{digest}{extension}'
+
+    def _save(self, name, content):
+        # A file with this name already has exactly this content.
+        if self.exists(name):
+            return name
+
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+        # Written aside and renamed into place, so concurrent identical
+        # uploads never see a partial file.
+        fd, temporary_path = tempfile.mkstemp(dir=directory, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as temporary:
+                for chunk in content.chunks():
+                    temporary.write(chunk if isinstance(chunk, bytes) else chunk.encode())
+            if self.file_permissions_mode is not None:
+                os.chmod(temporary_path, self.file_permissions_mode)
+            os.replace(temporary_path, full_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return name
+
+    def delete(self, name):
+        """Drops one reference to `name`, removing the file with the last one."""
+        from .models import StoredFile
+
+        # Removed while the StoredFile row is locked, so a concurrent save
+        # of the same content waits and then writes the file again
+        with transaction.atomic():
+            if StoredFile.objects.release(name):
+                super().delete(name)
@@ -0,0 +1,50 @@
+"""
+Helpers for streaming responses that stay in constant memory.
+
+Under ASGI (daphne), Django consumes a synchronous StreamingHttpResponse
+iterator to the end before sending the first byte, so a large export or file
+would be held in memory whole. streaming_content() hands ASGI requests an
+async iterator instead that pulls one chunk at a time from the synchronous
+one, on the thread that owns the request's database connection.
+"""
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+CHUNK_SIZE = 64 * 1024
+
+_DONE = object()
+
+
+async def _iterate_async(iterator):
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(iterator, _DONE)) is not _DONE:
+            yield chunk
+    finally:
+        if hasattr(iterator, 'close'):
+            await sync_to_async(iterator.close, thread_sensitive=True)()
+
+
+def is_asgi(request):
+    """True when `request` (an HttpRequest or DRF Request) is served over ASGI."""
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+def streaming_content(request, iterable):
+    """`iterable` in the form StreamingHttpResponse can stream for `request`."""
+    if is_asgi(request):
+        return _iterate_async(iter(iterable))
+    return iterable
+
+
+def buffered(pieces, size=CHUNK_SIZE):
+    """Joins small str or bytes pieces into chunks of about `size`, so each write carries a useful amount."""
+    buffer, length = [], 0
+    for piece in pieces:
+        buffer.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield buffer[0][:0].join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield buffer[0][:0].join(buffer)
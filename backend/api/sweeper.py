@@ -0,0 +1,50 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .models import DashboardSnapshot, SubscriptionPlan
+
+logger = logging.getLogger(__name__)
+
+_started = threading.Event()
+
+
+def sweep_expired_subscriptions(batch_size=1000):
+    """Expires every overdue subscription and marks the dashboard stale if any were."""
+    expired = SubscriptionPlan.objects.expire_due(batch_size=batch_size)
+    if expired:
+        DashboardSnapshot.objects.mark_stale()
+    return expired
+
+
+def _run_periodically(interval):
+    while True:
+        close_old_connections()
+        try:
+            expired = sweep_expired_subscriptions()
+            if expired:
+                logger.info("Expired %d subscriptions", expired)
+        except Exception:
+            logger.exception("Subscription expiry sweep failed")
+        finally:
+            close_old_connections()
+        time.sleep(interval)
+
+
+def start_subscription_sweeper():
+    """
+    Starts a daemon thread that runs the expiry sweep every
+    SUBSCRIPTION_SWEEP_INTERVAL seconds (disabled when None). Called from the
+    ASGI/WSGI entry points so only server processes run it; concurrent
+    sweeps from several workers skip each other's locked rows.
+    """
+    interval = getattr(settings, 'SUBSCRIPTION_SWEEP_INTERVAL', None)
+    if not interval or _started.is_set():
+        return
+    _started.set()
+    threading.Thread(
+        target=_run_periodically, args=(interval,), name='subscription-sweeper', daemon=True
+    ).start()
@@ -1,3 +1,472 @@
-from django.test import TestCase
+import gzip
+import io
+import shutil
+import tempfile
+import time
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from knox.models import AuthToken
+from rest_framework.test import APIClient
+
+from . import cache
+from .authentication import CachedTokenAuthentication, token_cache
+from .exports import EXPORTS
+from .models import (
+    ActivityEvent, ChatMessage, Conversation, DailyMetric, DashboardSnapshot, FitnessPlan, FitnessPlanUser,
+    Exercise, Food, MealFood, MealPlan, StoredFile, SubscriptionPlan,
+)
+from .models.progress import DayProgressModel
+from .models.subscription import pick_instructor
+from .pagination import MessageCursorPagination
+from .retention import POLICIES
+
+User = get_user_model()
+
+
+class MessageCursorPaginationTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        self.bob = User.objects.create_user(username='bob', email='bob@example.com', password='x')
+        self.messages = [
+            ChatMessage.objects.create(sender=self.alice, recipient=self.bob, message=f'message {i}')
+            for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.alice)
+
+    def test_before_and_after_together_are_rejected(self):
+        cursor = MessageCursorPagination().encode_cursor(self.messages[1])
+        response = self.client.get('/api/chat/messages/', {
+            'other_user': self.bob.pk, 'before': cursor, 'after': cursor,
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('before', response.json())
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+        self.user = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        self.auth_token, self.token = AuthToken.objects.create(self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        # Warms the cache
+        self.assertEqual(self.client.get('/api/user/profile/').status_code, 200)
+
+    def test_cached_hit_runs_no_queries(self):
+        with self.assertNumQueries(0):
+            user, auth_token = CachedTokenAuthentication().authenticate_credentials(self.token.encode())
+        self.assertEqual((user, auth_token), (self.user, self.auth_token))
+
+    def test_logout_evicts_the_token(self):
+        self.assertEqual(self.client.post('/logout/').status_code, 204)
+        self.assertEqual(self.client.get('/api/user/profile/').status_code, 401)
+
+    def test_logout_all_evicts_every_token_of_the_user(self):
+        _, other = AuthToken.objects.create(self.user)
+        other_client = APIClient()
+        other_client.credentials(HTTP_AUTHORIZATION=f'Token {other}')
+        self.assertEqual(other_client.get('/api/user/profile/').status_code, 200)
+
+        self.assertEqual(self.client.post('/logoutall/').status_code, 204)
+        self.assertEqual(self.client.get('/api/user/profile/').status_code, 401)
+        self.assertEqual(other_client.get('/api/user/profile/').status_code, 401)
+
+    def test_deactivation_evicts_the_user(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/user/profile/').status_code, 401)
+
+    @override_settings(AUTH_TOKEN_CACHE_TTL=60)
+    def test_entries_never_outlive_the_token(self):
+        auth_token, token = AuthToken.objects.create(self.user, expiry=timedelta(seconds=5))
+        CachedTokenAuthentication().authenticate_credentials(token.encode())
+        deadline = token_cache._entries[auth_token.digest][0]
+        self.assertLessEqual(deadline - time.monotonic(), 5)
+
+
+class MarkConversationReadTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        self.bob = User.objects.create_user(username='bob', email='bob@example.com', password='x')
+        for i in range(3):
+            ChatMessage.objects.create(sender=self.bob, recipient=self.alice, message=f'message {i}')
+
+    def test_whole_thread_is_marked_with_one_update(self):
+        # The message UPDATE and the inbox unread recount
+        with self.assertNumQueries(2):
+            updated, up_to = ChatMessage.mark_conversation_read(self.alice, self.bob.pk)
+        self.assertEqual((updated, up_to), (3, None))
+        self.assertFalse(ChatMessage.objects.filter(recipient=self.alice, is_read=False).exists())
+        self.assertEqual(Conversation.objects.get(owner=self.alice, counterpart=self.bob).unread_count, 0)
+
+    def test_nothing_unread_is_a_single_statement(self):
+        ChatMessage.mark_conversation_read(self.alice, self.bob.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(ChatMessage.mark_conversation_read(self.alice, self.bob.pk), (0, None))
+
+
+class DashboardSnapshotTests(TestCase):
+    def setUp(self):
+        self.snapshot = DashboardSnapshot.objects.refresh()
+
+    def test_writes_mark_the_snapshot_stale_without_recomputing(self):
+        # The INSERT and one UPDATE of the snapshot, none of the dashboard aggregates
+        with self.assertNumQueries(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                FitnessPlan.objects.create(name='Plan', description='', duration_weeks=4)
+        self.snapshot.refresh_from_db()
+        self.assertTrue(self.snapshot.is_stale)
+        self.assertEqual(self.snapshot.data['total_fitness_plans'], 0)
+
+    @override_settings(DASHBOARD_REFRESH_INTERVAL=60)
+    def test_stale_snapshot_is_recomputed_at_most_once_per_interval(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            FitnessPlan.objects.create(name='Plan', description='', duration_weeks=4)
+        self.assertEqual(DashboardSnapshot.objects.current().data['total_fitness_plans'], 0)
+
+        DashboardSnapshot.objects.filter(pk=self.snapshot.pk).update(
+            computed_at=self.snapshot.computed_at - timedelta(minutes=2),
+        )
+        snapshot = DashboardSnapshot.objects.current()
+        self.assertEqual(snapshot.data['total_fitness_plans'], 1)
+        self.assertFalse(snapshot.is_stale)
+
+    def test_activity_events_do_not_touch_the_snapshot(self):
+        admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='x')
+        DashboardSnapshot.objects.refresh()
+        with self.assertNumQueries(1):
+            with self.captureOnCommitCallbacks(execute=True):
+                ActivityEvent.objects.create(
+                    event_type=ActivityEvent.TICK_CHALLENGE, user=admin, description='admin ticked a day',
+                )
+        self.assertFalse(DashboardSnapshot.objects.get().is_stale)
+
+        client = APIClient()
+        client.force_authenticate(admin)
+        activities = client.get('/api/admin/dashboard/').json()['recent_activities']
+        self.assertEqual(activities[0]['description'], 'admin ticked a day')
+
+
+class DailyMetricRebuildTests(TestCase):
+    def test_rebuilt_subscriptions_match_the_live_counter(self):
+        user = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        # A subscription and its renewal, no longer active
+        for _ in range(2):
+            ActivityEvent.objects.create(event_type=ActivityEvent.SUBSCRIBE, user=user, description='alice subscribed')
+        live = dict(DailyMetric.objects.filter(metric=DailyMetric.SUBSCRIPTIONS).values_list('date', 'count'))
+
+        DailyMetric.objects.rebuild()
+        rebuilt = dict(DailyMetric.objects.filter(metric=DailyMetric.SUBSCRIPTIONS).values_list('date', 'count'))
+        self.assertEqual(rebuilt, live)
+        self.assertEqual(sum(rebuilt.values()), 2)
+
+    def test_purge_then_backfill_keeps_subscription_counts(self):
+        user = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        for event_type in (ActivityEvent.SUBSCRIBE, ActivityEvent.REGISTER):
+            ActivityEvent.objects.create(
+                event_type=event_type, user=user, description='alice',
+                created_at=ActivityEvent.retention_cutoff() - timedelta(days=30),
+            )
+        before = list(DailyMetric.objects.filter(metric=DailyMetric.SUBSCRIPTIONS).values_list('date', 'count'))
+
+        self.assertEqual(POLICIES['activity_events'].purge(), 1)
+        call_command('backfill_metrics', stdout=io.StringIO())
+        after = list(DailyMetric.objects.filter(metric=DailyMetric.SUBSCRIPTIONS).values_list('date', 'count'))
+        self.assertEqual(after, before)
+        self.assertTrue(ActivityEvent.objects.filter(event_type=ActivityEvent.SUBSCRIBE).exists())
+
+    def test_rebuild_keeps_counters_older_than_the_retained_events(self):
+        user = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        old = ActivityEvent.objects.create(
+            event_type=ActivityEvent.SUBSCRIBE, user=user, description='alice subscribed',
+            created_at=ActivityEvent.retention_cutoff() - timedelta(days=30),
+        )
+        # Purged, as the activity_events retention policy would
+        ActivityEvent.objects.filter(pk=old.pk).delete()
+
+        DailyMetric.objects.rebuild()
+        self.assertEqual(
+            DailyMetric.objects.get(metric=DailyMetric.SUBSCRIPTIONS, date=timezone.localdate(old.created_at)).count, 1,
+        )
+
+
+class InstructorLoadTests(TestCase):
+    def setUp(self):
+        self.trainers = [
+            User.objects.create_user(
+                username=name, email=f'{name}@example.com', password='x', is_instructor=True, specialization='trainer',
+            )
+            for name in ('tom', 'tim')
+        ]
+        self.client_user = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+
+    def loads(self):
+        return [User.objects.get(pk=trainer.pk).active_client_count for trainer in self.trainers]
+
+    @override_settings(INSTRUCTOR_CLIENT_CAPACITY={'trainer': 1})
+    def test_capacity_is_checked_on_the_locked_row(self):
+        User.objects.filter(pk=self.trainers[0].pk).update(active_client_count=1)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(pick_instructor('trainer'), self.trainers[1])
+        # One locking read, no second read of the chosen row
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('SELECT')]), 1)
+
+    def test_delete_and_expiry_release_through_the_same_clamped_update(self):
+        subscription = SubscriptionPlan.objects.create(
+            user=self.client_user, plan='premium', is_active=True, trainer=self.trainers[0],
+        )
+        self.assertEqual(self.loads(), [1, 0])
+        subscription.delete()
+        self.assertEqual(self.loads(), [0, 0])
+
+        SubscriptionPlan.objects.create(
+            user=self.client_user, plan='premium', is_active=True, trainer=self.trainers[1],
+            end_date=timezone.now() - timedelta(days=1),
+        )
+        # A counter already out of step is not taken below zero
+        User.objects.filter(pk=self.trainers[1].pk).update(active_client_count=0)
+        self.assertEqual(SubscriptionPlan.objects.expire_due(), 1)
+        self.assertEqual(self.loads(), [0, 0])
+
+
+class InstructorClientQueryTests(TestCase):
+    """The instructor's client lists cost the same number of queries however many clients there are."""
+
+    def setUp(self):
+        self.trainer = self.add_trainer()
+        self.plan = FitnessPlan.objects.create(name='Plan', description='', duration_weeks=4)
+        self.clients = []
+        self.client = APIClient()
+        self.client.force_authenticate(self.trainer)
+
+    def add_trainer(self):
+        n = User.objects.filter(is_instructor=True).count()
+        return User.objects.create_user(
+            username=f'trainer{n}', email=f'trainer{n}@example.com', password='x',
+            is_instructor=True, specialization='trainer',
+        )
+
+    def add_clients(self, count, trainer=None):
+        for _ in range(count):
+            n = len(self.clients)
+            user = User.objects.create_user(username=f'client{n}', email=f'client{n}@example.com', password='x')
+            SubscriptionPlan.objects.create(user=user, plan='premium', is_active=True, trainer=trainer or self.trainer)
+            FitnessPlanUser.objects.create(user=user, fitness_plan=self.plan)
+            self.clients.append(user)
+
+    def assertConstantQueries(self, url, grow):
+        self.add_clients(2)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        grow()
+        with self.assertNumQueries(len(queries)):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_instructor_list(self):
+        # with_client_summaries, with more instructors and more clients each
+        def grow():
+            self.add_clients(3)
+            for _ in range(2):
+                self.add_clients(2, self.add_trainer())
+        self.assertConstantQueries('/instructors/', grow)
+
+    def test_instructor_dashboard(self):
+        self.assertConstantQueries('/api/instructor/dashboard/', lambda: self.add_clients(5))
+
+    def test_client_overview(self):
+        # with_client_overview, with more plans joined by the client
+        def grow():
+            for i in range(3):
+                FitnessPlanUser.objects.create(
+                    user=self.clients[0],
+                    fitness_plan=FitnessPlan.objects.create(name=f'Plan {i}', description='', duration_weeks=4),
+                )
+        self.add_clients(1)
+        self.assertConstantQueries(f'/api/clients/{self.clients[0].pk}/overview/', grow)
+
+
+class DayProgressModelTests(TestCase):
+    def test_every_progress_model_defines_its_progress_window(self):
+        models = [model for model in apps.get_models() if issubclass(model, DayProgressModel)]
+        self.assertTrue(models)
+        for model in models:
+            with self.subTest(model=model.__name__):
+                self.assertEqual(model.check(), [])
+
+    def test_elapsed_days_is_capped_at_the_plan_duration(self):
+        user = User.objects.create_user(username='alice', email='alice@example.com', password='x')
+        plan = FitnessPlan.objects.create(name='Plan', duration_weeks=1)
+        joined = FitnessPlanUser.objects.create(user=user, fitness_plan=plan)
+        today = timezone.localdate(joined.joined_at)
+        self.assertEqual(joined.elapsed_days(today - timedelta(days=1)), 0)
+        self.assertEqual(joined.elapsed_days(today + timedelta(days=2)), 3)
+        self.assertEqual(joined.elapsed_days(today + timedelta(days=30)), 7)
+
+
+class StoredFileTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def create_plan(self):
+        return FitnessPlan.objects.create(
+            name='Plan', duration_weeks=4, picture=ContentFile(b'picture', name='plan.png'),
+        )
+
+    def test_rolled_back_save_takes_its_reference_back(self):
+        with self.assertRaises(ZeroDivisionError), transaction.atomic():
+            self.create_plan()
+            1 / 0
+        self.assertFalse(StoredFile.objects.exists())
+
+    def test_failed_insert_takes_its_reference_back(self):
+        with self.assertRaises(IntegrityError):
+            FitnessPlan.objects.create(name='Plan', duration_weeks=None, picture=ContentFile(b'x', name='plan.png'))
+        self.assertFalse(StoredFile.objects.exists())
+
+    def test_file_is_removed_with_the_last_reference(self):
+        first, second = self.create_plan(), self.create_plan()
+        name = first.picture.name
+        self.assertEqual(second.picture.name, name)
+        self.assertEqual(StoredFile.objects.get(name=name).references, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(default_storage.exists(name))
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(default_storage.exists(name))
+        self.assertFalse(StoredFile.objects.exists())
+
+    def test_media_matches_etag_lists_and_weak_etags(self):
+        name = self.create_plan().picture.name
+        url = f'/media/{name}'
+        etag = self.client.get(url)['ETag']
+        for if_none_match in [etag, f'W/{etag}', f'"other", {etag}', '*']:
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(url, headers={'If-None-Match': if_none_match})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': '"other"'}).status_code, 200)
+
+
+class NestedRowsTests(TestCase):
+    def setUp(self):
+        self.plan = MealPlan.objects.create(name='Plan', daily_calorie_target=2000, duration_weeks=1)
+        self.oats, self.eggs = [Food.objects.create(name=name, protein=10, fat=5) for name in ('Oats', 'Eggs')]
+        self.first = MealFood.objects.create(
+            meal_plan=self.plan, food=self.oats, day=1, meal_time='breakfast', quantity_grams=100,
+        )
+        self.second = MealFood.objects.create(
+            meal_plan=self.plan, food=self.eggs, day=1, meal_time='breakfast', quantity_grams=200,
+        )
+        self.url = f'/api/meal-plans/{self.plan.pk}/meal-foods/'
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user(username='alice', email='alice@example.com', password='x'))
+
+    def item(self, row, food):
+        return {'id': row.pk, 'food_id': food.pk, 'day': 1, 'meal_time': 'breakfast', 'quantity_grams': row.quantity_grams}
+
+    def test_rows_can_swap_natural_keys(self):
+        response = self.client.put(self.url, [
+            self.item(self.first, self.eggs), self.item(self.second, self.oats),
+        ], format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            dict(self.plan.meal_foods.values_list('food__name', 'quantity_grams')),
+            {'Eggs': 100, 'Oats': 200},
+        )
+        # Only one of the two rows has to be inserted again
+        kept = set(self.plan.meal_foods.values_list('pk', flat=True)) & {self.first.pk, self.second.pk}
+        self.assertEqual(len(kept), 1)
+
+    def test_moving_onto_a_kept_rows_key_is_rejected(self):
+        response = self.client.patch(self.url, [self.item(self.first, self.eggs)], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.plan.meal_foods.get(pk=self.first.pk).food, self.oats)
+
+
+class CataloguePaginationTests(TestCase):
+    def setUp(self):
+        # bulk_create sends no signals to invalidate cached lists
+        cache.get_cache().clear()
+        Exercise.objects.bulk_create(Exercise(name=f'Move{i:03}') for i in range(130))
+        self.client = APIClient()
+
+    def test_lists_are_paged_by_default(self):
+        data = self.client.get('/api/exercises/').json()
+        self.assertEqual(data['count'], 130)
+        self.assertEqual(len(data['results']), 20)
+        self.assertIsNotNone(data['next'])
+
+    def test_page_size_is_capped(self):
+        self.assertEqual(len(self.client.get('/api/exercises/', {'limit': 1000}).json()['results']), 100)
+
+    def test_search_narrows_the_page(self):
+        data = self.client.get('/api/exercises/', {'search': 'Move12'}).json()
+        self.assertEqual([row['name'] for row in data['results']], [f'Move{i}' for i in range(120, 130)])
+
+    def test_cached_lists_match_etag_lists_and_weak_etags(self):
+        etag = self.client.get('/api/exercises/')['ETag']
+        for if_none_match in [etag, f'W/{etag}', f'"other", {etag}', '*']:
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get('/api/exercises/', headers={'If-None-Match': if_none_match})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get('/api/exercises/', headers={'If-None-Match': '"other"'}).status_code, 200)
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='x')
+        for i in range(4):
+            User.objects.create_user(username=f'user{i}', email=f'user{i}@example.com', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def download(self, **params):
+        response = self.client.get('/api/admin/exports/users/', params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content)
+
+    def test_batches_return_every_row_once(self):
+        export = EXPORTS['users']
+        ids = [row[0] for row in export.rows(export.select(['id']), batch_size=2)]
+        self.assertEqual(ids, list(User.objects.order_by('pk').values_list('pk', flat=True)))
+
+    def test_batches_by_day_return_every_day_once(self):
+        for days_ago in range(3):
+            for _ in range(2):
+                message = ChatMessage.objects.create(sender=self.admin, recipient=self.admin, message='hi')
+                ChatMessage.objects.filter(pk=message.pk).update(
+                    timestamp=timezone.now() - timedelta(days=days_ago),
+                )
+        export = EXPORTS['chat_volume']
+        rows = list(export.rows(export.select(['day', 'messages']), batch_size=1))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(len({day for day, _ in rows}), 3)
+        self.assertEqual(sum(messages for _, messages in rows), 6)
+
+    def test_unknown_columns_are_rejected(self):
+        response = self.client.get('/api/admin/exports/users/', {'columns': 'id,nope'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('nope', str(response.json()['columns']))
+
+    def test_gzip_decompresses_to_the_same_csv(self):
+        csv = self.download()
+        self.assertIn(b'user3@example.com', csv)
+        self.assertEqual(gzip.decompress(self.download(compress='gzip')), csv)
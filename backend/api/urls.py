@@ -23,15 +23,20 @@ from api.views.user import (
     user_profile,
     instructor_dashboard,
     client_details,
+    client_overview,
     assigned_instructors
 )
 
 from api.views.dashboard import dashboard
+from api.views.activity import ActivityEventListView
+from api.views.analytics import analytics
+from api.views.exports import export_list, export
 
 from api.views.chat import (
     MessageListCreateView,
     MessageMarkAsReadView,
-    ConversationListView
+    ConversationListView,
+    ConversationMarkAsReadView
 )
 
 router = DefaultRouter()
@@ -84,11 +89,13 @@ urlpatterns = [
     # Instructor routes
     path('api/instructor/dashboard/', instructor_dashboard, name='instructor-dashboard'),
     path('api/clients/<int:client_id>/', client_details, name='client-details'),
+    path('api/clients/<int:client_id>/overview/', client_overview, name='client-overview'),
     
     # Chat routes
     path('api/chat/messages/', MessageListCreateView.as_view(), name='message-list'),
     path('api/chat/messages/<int:pk>/read/', MessageMarkAsReadView.as_view(), name='message-read'),
     path('api/chat/conversations/', ConversationListView.as_view(), name='conversation-list'),
+    path('api/chat/conversations/<int:user_id>/read/', ConversationMarkAsReadView.as_view(), name='conversation-read'),
 
     
     # Instructor assignment routes
@@ -96,4 +103,8 @@ urlpatterns = [
     
     #Admin Dashboard
     path('api/admin/dashboard/', dashboard, name='dashboard'),
+    path('api/admin/activity/', ActivityEventListView.as_view(), name='activity-feed'),
+    path('api/admin/analytics/', analytics, name='analytics'),
+    path('api/admin/exports/', export_list, name='export-list'),
+    path('api/admin/exports/<str:name>/', export, name='export'),
 ]
\ No newline at end of file
@@ -7,9 +7,13 @@ from .goal import GoalViewSet
 from .fitness_plan import FitnessPlanViewSet, FitnessPlanUserViewSet, FitnessPlanExerciseViewSet 
 from .meal_plan import MealPlanViewSet, MealPlanUserViewSet, MealFoodViewSet
 from .subscription import SubscriptionViewSet
-from .user import UserViewSet, InstructorViewSet, user_profile, instructor_dashboard, client_details, assigned_instructors
+from .user import UserViewSet, InstructorViewSet, user_profile, instructor_dashboard, client_details, client_overview, assigned_instructors
 from .dashboard import dashboard
-from .chat import MessageListCreateView, MessageMarkAsReadView, ConversationListView
+from .activity import ActivityEventListView
+from .analytics import analytics
+from .chat import MessageListCreateView, MessageMarkAsReadView, ConversationListView, ConversationMarkAsReadView
+from .media import serve_media
+from .exports import export_list, export
 
 
 __all__ = [
@@ -23,7 +27,9 @@ __all__ = [
     'MealPlanViewSet', 'MealPlanUserViewSet', 'MealFoodViewSet',
     'SubscriptionViewSet',
     'UserViewSet', 'InstructorViewSet', 'user_profile', 
-    'instructor_dashboard', 'client_details', 'assigned_instructors',
-    'MessageListCreateView', 'MessageMarkAsReadView', 'ConversationListView',
-    'dashboard',
+    'instructor_dashboard', 'client_details', 'client_overview', 'assigned_instructors',
+    'MessageListCreateView', 'MessageMarkAsReadView', 'ConversationListView', 'ConversationMarkAsReadView',
+    'dashboard', 'ActivityEventListView', 'analytics',
+    'serve_media',
+    'export_list', 'export',
 ]
\ No newline at end of file
@@ -0,0 +1,19 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from ..models import ActivityEvent
+from ..serializers import ActivityEventSerializer
+from ..filters import ChoiceFilterBackend
+from ..pagination import ActivityCursorPagination
+
+
+class ActivityEventListView(generics.ListAPIView):
+    """
+    Admin activity feed, newest first. Filter with `?event_type=` (comma
+    separated) and page back with the `next` link.
+    """
+    queryset = ActivityEvent.objects.all()
+    serializer_class = ActivityEventSerializer
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    pagination_class = ActivityCursorPagination
+    filter_backends = [ChoiceFilterBackend]
+    choice_filter_fields = ['event_type']
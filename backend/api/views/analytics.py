@@ -0,0 +1,60 @@
+from datetime import timedelta
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+from api.models import DailyMetric
+from api.serializers import AnalyticsQuerySerializer
+
+
+def period_start(date, granularity):
+    if granularity == 'week':
+        return date - timedelta(days=date.weekday())
+    if granularity == 'month':
+        return date.replace(day=1)
+    return date
+
+
+def next_period(date, granularity):
+    if granularity == 'week':
+        return date + timedelta(weeks=1)
+    if granularity == 'month':
+        return (date.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return date + timedelta(days=1)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminUser])
+def analytics(request):
+    """
+    Time series of the daily rollups between `start` and `end`, bucketed by
+    `granularity` (day, week or month). Periods without activity are zero.
+    """
+    params = AnalyticsQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    metrics = params.validated_data['metrics']
+    start = params.validated_data['start']
+    end = params.validated_data['end']
+    granularity = params.validated_data['granularity']
+
+    periods = []
+    period = period_start(start, granularity)
+    while period <= end:
+        periods.append(period)
+        period = next_period(period, granularity)
+
+    totals = {metric: dict.fromkeys(periods, 0) for metric in metrics}
+    rows = DailyMetric.objects.filter(
+        metric__in=metrics, date__gte=start, date__lte=end
+    ).values_list('metric', 'date', 'count')
+    for metric, date, count in rows:
+        totals[metric][period_start(date, granularity)] += count
+
+    return Response({
+        'start': start,
+        'end': end,
+        'granularity': granularity,
+        'series': {
+            metric: [{'period': period, 'count': count} for period, count in series.items()]
+            for metric, series in totals.items()
+        }
+    })
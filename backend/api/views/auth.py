@@ -1,12 +1,16 @@
+import logging
+import time
 from rest_framework import viewsets, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.db import transaction
-from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth import get_user_model
 from knox.models import AuthToken
 from ..serializers import RegisterSerializer, LoginSerializer
-from django.contrib.auth import authenticate
+from ..authentication import trim_user_tokens
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 class RegisterView(viewsets.ViewSet):
     permission_classes = [permissions.AllowAny]
@@ -30,26 +34,24 @@ class LoginView(viewsets.ViewSet):
     serializer_class = LoginSerializer
 
     def create(self, request):
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(
-                {"error": "Invalid input", "details": serializer.errors},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        email = serializer.validated_data.get('email')
-        password = serializer.validated_data.get('password')
-        user = authenticate(request, email=email, password=password)
-
-        if not user:
-            return Response(
-                {"error": "Invalid credentials - email or password incorrect"},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        started = time.perf_counter()
+        serializer = self.serializer_class(data=request.data, context={'request': request})
+        try:
+            serializer.is_valid(raise_exception=True)
+        except ValidationError as exc:
+            if exc.get_codes() == {'non_field_errors': ['authorization']}:
+                return self.login_response(started, {
+                    "error": "Invalid credentials - email or password incorrect"
+                }, status.HTTP_401_UNAUTHORIZED)
+            return self.login_response(started, {
+                "error": "Invalid input", "details": serializer.errors
+            }, status.HTTP_400_BAD_REQUEST)
 
+        user = serializer.validated_data['user']
         try:
             _, token = AuthToken.objects.create(user)
-            return Response({
+            trim_user_tokens(user)
+            return self.login_response(started, {
                 "user": {
                     "id": user.id,
                     "email": user.email,
@@ -58,9 +60,15 @@ class LoginView(viewsets.ViewSet):
                     "is_superuser": bool(user.is_superuser)
                 },
                 "token": token
-            }, status=status.HTTP_200_OK)
+            }, status.HTTP_200_OK)
         except Exception as e:
             return Response(
                 {"error": "Could not create authentication token"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+    def login_response(self, started, data, status_code):
+        """Response with the login latency logged and exposed as Server-Timing."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info("Login %s in %.1f ms", status_code, elapsed_ms)
+        return Response(data, status=status_code, headers={'Server-Timing': f'login;dur={elapsed_ms:.1f}'})
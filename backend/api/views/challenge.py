@@ -2,19 +2,21 @@ from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.authentication import SessionAuthentication
-from knox.auth import TokenAuthentication
+from ..authentication import CachedTokenAuthentication
 from rest_framework.decorators import action
 from ..models import Challenge, ChallengeParticipant
 from ..serializers import ChallengeSerializer, ChallengeParticipantSerializer, TickDaySerializer
+from ..cache import CachedResponseMixin
 
-class ChallengeView(viewsets.ModelViewSet):
+class ChallengeView(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = Challenge.objects.all().order_by('-created_at')
     serializer_class = ChallengeSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_namespace = 'challenges'
 
 class ChallengeParticipantViewSet(viewsets.ModelViewSet):
     serializer_class = ChallengeParticipantSerializer
-    authentication_classes = [TokenAuthentication, SessionAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SessionAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -29,7 +31,6 @@ class ChallengeParticipantViewSet(viewsets.ModelViewSet):
         serializer = TickDaySerializer(data=request.data, context={'instance': participant})
         if serializer.is_valid():
             day = serializer.validated_data['day']
-            participant.progress.append(day)
-            participant.save()
+            participant.tick_day(day)
             return Response({'progress': participant.progress})
         return Response(serializer.errors, status=400)
\ No newline at end of file
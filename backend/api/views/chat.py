@@ -1,10 +1,13 @@
+from django.db import transaction
 from django.db.models import Q
 from rest_framework import generics
-from ..models import ChatMessage
-from ..serializers.chat import ChatMessageSerializer
+from ..models import ChatMessage, Conversation
+from ..serializers.chat import ChatMessageSerializer, ConversationSerializer, MarkConversationReadSerializer
+from ..consumers import broadcast_read
 from knox.auth import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from ..serializers.user import UserSerializer
+from ..pagination import MessageCursorPagination
 from django.contrib.auth import get_user_model
 User = get_user_model()
 
@@ -14,6 +17,7 @@ from rest_framework.response import Response
 class MessageListCreateView(generics.ListCreateAPIView):
     serializer_class = ChatMessageSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = MessageCursorPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -69,20 +73,28 @@ class MessageMarkAsReadView(generics.UpdateAPIView):
     def perform_update(self, serializer):
         serializer.save(is_read=True)
 
+class ConversationMarkAsReadView(generics.GenericAPIView):
+    """Mark a whole thread as read (optionally up to a message id) with one UPDATE."""
+    serializer_class = MarkConversationReadSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, user_id):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        up_to = serializer.validated_data.get('up_to')
+
+        updated, up_to = ChatMessage.mark_conversation_read(request.user, user_id, up_to=up_to)
+        if updated:
+            transaction.on_commit(
+                lambda: broadcast_read(user_id, request.user.id, up_to=up_to)
+            )
+        return Response({'updated': updated, 'up_to': up_to})
+
 class ConversationListView(generics.ListAPIView):
-    serializer_class = UserSerializer
+    serializer_class = ConversationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user = self.request.user
-        # Get all users this user has chatted with
-        senders = ChatMessage.objects.filter(
-            recipient=user
-        ).values_list('sender', flat=True).distinct()
-        
-        recipients = ChatMessage.objects.filter(
-            sender=user
-        ).values_list('recipient', flat=True).distinct()
-        
-        user_ids = set(list(senders) + list(recipients))
-        return User.objects.filter(id__in=user_ids)
\ No newline at end of file
+        return Conversation.objects.filter(
+            owner=self.request.user
+        ).select_related('counterpart', 'last_message').order_by('-last_message_at')
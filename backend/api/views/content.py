@@ -5,12 +5,15 @@ from ..models import EducationalContent
 from ..serializers import EducationalContentSerializer
 from rest_framework.decorators import action
 from rest_framework.authentication import SessionAuthentication
+from django.db.models import F
+from ..cache import CachedResponseMixin
 
 
-class EducationalContentViewSet(viewsets.ModelViewSet):
+class EducationalContentViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = EducationalContent.objects.all().order_by('-upload_date')
     serializer_class = EducationalContentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_namespace = 'content'
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -20,8 +23,8 @@ class EducationalContentViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def increment_views(self, request, pk=None):
         content = self.get_object()
-        content.views += 1
-        content.save()
+        # Counted in SQL without a model save so views don't invalidate the content cache
+        EducationalContent.objects.filter(pk=content.pk).update(views=F('views') + 1)
         return Response({'status': 'views incremented'})
     
     @action(detail=True, methods=['post'])
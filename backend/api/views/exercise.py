@@ -1,7 +1,22 @@
-from rest_framework import viewsets
+from rest_framework import viewsets, filters
 from ..models import Exercise
-from ..serializers import ExerciseSerializer
+from ..serializers import ExerciseSerializer, ExerciseReadSerializer
+from ..cache import CachedResponseMixin
+from ..filters import ChoiceFilterBackend
+from ..pagination import CataloguePagination
 
-class ExerciseViewSet(viewsets.ModelViewSet):
+class ExerciseViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = Exercise.objects.all()
-    serializer_class = ExerciseSerializer
\ No newline at end of file
+    serializer_class = ExerciseSerializer
+    cache_namespace = 'exercises'
+    pagination_class = CataloguePagination
+    filter_backends = [ChoiceFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    choice_filter_fields = ['muscle_group', 'difficulty', 'equipment']
+    search_fields = ['^name']
+    ordering_fields = ['name', 'created_at', 'calories_burned']
+    ordering = ['id']
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ExerciseReadSerializer
+        return super().get_serializer_class()
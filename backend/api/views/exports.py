@@ -0,0 +1,41 @@
+from django.http import Http404
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+
+from ..exports import EXPORTS, FORMATS, export_response
+from ..serializers import ExportQuerySerializer
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminUser])
+def export_list(request):
+    """The available exports, their columns and formats."""
+    return Response([
+        {
+            'name': export.name,
+            'description': export.description,
+            'columns': [column.name for column in export.columns],
+            'formats': list(FORMATS),
+        }
+        for export in EXPORTS.values()
+    ])
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminUser])
+def export(request, name):
+    """
+    Streams every row of export `name` as CSV or NDJSON (`output`), limited
+    to the comma separated `columns` and gzipped with `compress=gzip`.
+    """
+    export = EXPORTS.get(name)
+    if export is None:
+        raise Http404
+    params = ExportQuerySerializer(data=request.query_params, context={'export': export})
+    params.is_valid(raise_exception=True)
+    return export_response(
+        request, export, params.validated_data['columns'],
+        format=params.validated_data['output'],
+        compress='compress' in params.validated_data,
+    )
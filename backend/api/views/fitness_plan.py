@@ -1,35 +1,28 @@
-import json
 from rest_framework import viewsets, mixins, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.decorators import action
 from ..models import FitnessPlan, FitnessPlanExercise, FitnessPlanUser
-from ..serializers import FitnessPlanSerializer, FitnessPlanExerciseSerializer, FitnessPlanUserSerializer, FitnessPlanTickDaySerializer
+from ..serializers import FitnessPlanSerializer, FitnessPlanReadSerializer, FitnessPlanExerciseSerializer, FitnessPlanUserSerializer, FitnessPlanTickDaySerializer
+from ..cache import CachedResponseMixin
 from rest_framework import serializers
 
-class FitnessPlanViewSet(viewsets.ModelViewSet):
+class FitnessPlanViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = FitnessPlan.objects.all().prefetch_related('exercises__exercise')
     serializer_class = FitnessPlanSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_namespace = 'fitness-plans'
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return FitnessPlanReadSerializer
+        return super().get_serializer_class()
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['request'] = self.request
         return context
     
-    def create(self, request, *args, **kwargs):
-        if 'exercises' in request.data and isinstance(request.data['exercises'], str):
-            try:
-                request.data._mutable = True
-                request.data['exercises'] = json.loads(request.data['exercises'])
-                request.data._mutable = False
-            except json.JSONDecodeError:
-                return Response(
-                    {'exercises': 'Invalid JSON format'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        return super().create(request, *args, **kwargs)
-
 class FitnessPlanUserViewSet(viewsets.ModelViewSet):
     queryset = FitnessPlanUser.objects.all()
     serializer_class = FitnessPlanUserSerializer
@@ -49,8 +42,7 @@ class FitnessPlanUserViewSet(viewsets.ModelViewSet):
         serializer = FitnessPlanTickDaySerializer(data=request.data, context={'instance': participant})
         if serializer.is_valid():
             day = serializer.validated_data['day']
-            participant.progress.append(day)
-            participant.save()
+            participant.tick_day(day)
             return Response({'progress': participant.progress})
         return Response(serializer.errors, status=400)
 
@@ -1,7 +1,22 @@
-from rest_framework import viewsets
+from rest_framework import viewsets, filters
 from ..models import Food
-from ..serializers import FoodSerializer
+from ..serializers import FoodSerializer, FoodReadSerializer
+from ..cache import CachedResponseMixin
+from ..filters import ChoiceFilterBackend
+from ..pagination import CataloguePagination
 
-class FoodViewSet(viewsets.ModelViewSet):
+class FoodViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = Food.objects.all()
-    serializer_class = FoodSerializer
\ No newline at end of file
+    serializer_class = FoodSerializer
+    cache_namespace = 'foods'
+    pagination_class = CataloguePagination
+    filter_backends = [ChoiceFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    choice_filter_fields = ['food_type']
+    search_fields = ['^name']
+    ordering_fields = ['name', 'created_at', 'carbs', 'protein', 'fat']
+    ordering = ['id']
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return FoodReadSerializer
+        return super().get_serializer_class()
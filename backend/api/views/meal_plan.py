@@ -1,21 +1,74 @@
 from rest_framework import viewsets, mixins
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from ..models import MealPlan, MealFood, MealPlanUser
-from ..serializers import MealPlanSerializer, MealFoodSerializer, MealPlanUserSerializer
+from ..models.meal import MACRO_FIELDS
+from ..serializers import MealPlanSerializer, MealPlanReadSerializer, MealFoodSerializer, MealFoodItemSerializer, MealPlanUserSerializer, MealPlanDayNutritionSerializer
+from ..cache import CachedResponseMixin
 from rest_framework import serializers
 
 
-class MealPlanViewSet(viewsets.ModelViewSet):
+class MealPlanViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = MealPlan.objects.all()
     serializer_class = MealPlanSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_namespace = 'meal-plans'
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return MealPlanReadSerializer
+        return super().get_serializer_class()
     
     def get_queryset(self):
         queryset = super().get_queryset()
+        if self.action in ('daily_nutrition', 'meal_foods'):
+            return queryset
         plan_type = self.request.query_params.get('type')
         if plan_type:
             queryset = queryset.filter(plan_type=plan_type)
-        return queryset.prefetch_related('meal_foods')
+        return queryset.with_totals().with_meal_foods()
+
+    @action(detail=True, methods=['get'], url_path='daily-nutrition')
+    def daily_nutrition(self, request, pk=None):
+        meal_plan = self.get_object()
+        target = meal_plan.daily_calorie_target
+        days = {}
+        for row in MealPlanDayNutritionSerializer(meal_plan.day_nutrition.all(), many=True).data:
+            day = days.setdefault(row['day'], {
+                'day': row['day'],
+                'calories': 0, 'carbs': 0, 'protein': 0, 'fat': 0,
+                'meals': []
+            })
+            for macro in MACRO_FIELDS:
+                day[macro] += row[macro]
+            day['meals'].append(row)
+
+        for day in days.values():
+            for macro in MACRO_FIELDS:
+                day[macro] = round(day[macro], 2)
+            day['calorie_difference'] = round(day['calories'] - target, 2)
+
+        return Response({
+            'meal_plan': meal_plan.id,
+            'daily_calorie_target': target,
+            'days': [days[day] for day in sorted(days)]
+        })
+
+    @action(detail=True, methods=['get', 'put', 'patch'], url_path='meal-foods')
+    def meal_foods(self, request, pk=None):
+        """
+        The plan's meal foods. PUT makes them match the submitted list and
+        PATCH only adds or updates the listed rows; either way the changes are
+        written in bulk in one transaction (see NestedRowsListSerializer).
+        """
+        meal_plan = self.get_object()
+        if request.method != 'GET':
+            serializer = MealFoodItemSerializer(data=request.data, many=True, context=self.get_serializer_context())
+            serializer.is_valid(raise_exception=True)
+            serializer.save_rows(meal_plan, serializer.validated_data, delete_missing=request.method == 'PUT')
+        rows = meal_plan.meal_foods.select_related('food').with_totals()
+        return Response(MealFoodSerializer(rows, many=True, context=self.get_serializer_context()).data)
 
 class MealPlanUserViewSet(viewsets.ModelViewSet):
     queryset = MealPlanUser.objects.all()
@@ -36,7 +89,7 @@ class MealFoodViewSet(
     mixins.DestroyModelMixin,
     viewsets.GenericViewSet
 ):
-    queryset = MealFood.objects.all()
+    queryset = MealFood.objects.select_related('food')
     serializer_class = MealFoodSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     
@@ -52,4 +105,4 @@ class MealFoodViewSet(
             queryset = queryset.filter(day=day)
         if meal_time:
             queryset = queryset.filter(meal_time=meal_time)
-        return queryset
\ No newline at end of file
+        return queryset
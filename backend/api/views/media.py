@@ -0,0 +1,105 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from ..storage import content_digest
+from ..streaming import CHUNK_SIZE, is_asgi, streaming_content
+
+RANGE_HEADER = re.compile(r'^bytes=(\d*)-(\d*)$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def _byte_range(header, size):
+    """(start, end) of a single `Range: bytes=` request, None to send it all, or False if unsatisfiable."""
+    match = RANGE_HEADER.match(header.strip()) if header else None
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+    if start > end or start >= size:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+@require_safe
+def serve_media(request, path):
+    """
+    Serves uploaded media. Content-addressed files never change, so they are
+    sent with far-future immutable caching; range requests are supported and
+    full files go through the WSGI server's file wrapper (sendfile), are
+    streamed in chunks under ASGI or, with MEDIA_SENDFILE_HEADER set, are
+    handed off to the front web server.
+    """
+    try:
+        full_path = default_storage.path(path)
+    except (SuspiciousFileOperation, NotImplementedError):
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    stat = os.stat(full_path)
+    digest = content_digest(path)
+    headers = {
+        'ETag': f'"{digest}"' if digest else f'"{int(stat.st_mtime):x}-{stat.st_size:x}"',
+        'Last-Modified': http_date(stat.st_mtime),
+        'Cache-Control': IMMUTABLE_CACHE_CONTROL if digest else f"public, max-age={getattr(settings, 'MEDIA_CACHE_MAX_AGE', 3600)}",
+        'Accept-Ranges': 'bytes',
+    }
+
+    # Handles ETag lists, * and weak validators, If-Modified-Since and If-Match
+    response = get_conditional_response(request, etag=headers['ETag'], last_modified=int(stat.st_mtime))
+    if response is not None:
+        if response.status_code == 304:
+            for header, value in headers.items():
+                response[header] = value
+        return response
+
+    sendfile_header = getattr(settings, 'MEDIA_SENDFILE_HEADER', None)
+    if sendfile_header:
+        # e.g. X-Accel-Redirect (nginx) or X-Sendfile (Apache), which serve ranges themselves
+        response = HttpResponse(headers=headers, content_type='')
+        response[sendfile_header] = getattr(settings, 'MEDIA_SENDFILE_PREFIX', settings.MEDIA_URL) + path
+        return response
+
+    byte_range = _byte_range(request.headers.get('Range'), stat.st_size)
+    if byte_range is False:
+        return HttpResponse(status=416, headers={'Content-Range': f'bytes */{stat.st_size}'})
+    partial = bool(byte_range) and byte_range != (0, stat.st_size - 1)
+    if not (partial or is_asgi(request)):
+        return FileResponse(open(full_path, 'rb'), headers=headers)
+
+    # Under ASGI a FileResponse would be read whole before sending, so the
+    # file is streamed chunk by chunk like a range.
+    start, end = byte_range if partial else (0, stat.st_size - 1)
+    response = StreamingHttpResponse(
+        streaming_content(request, _read_range(full_path, start, end - start + 1)),
+        status=206 if partial else 200,
+        content_type=mimetypes.guess_type(path)[0] or 'application/octet-stream',
+        headers=headers,
+    )
+    if partial:
+        response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+    response['Content-Length'] = end - start + 1
+    return response
@@ -2,10 +2,10 @@ from rest_framework import viewsets
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.authentication import SessionAuthentication
-from knox.auth import TokenAuthentication
+from ..authentication import CachedTokenAuthentication
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
-from random import choice
 from django.contrib.auth import get_user_model
 from ..models import SubscriptionPlan
 from ..serializers import SubscriptionSerializer
@@ -15,9 +15,10 @@ User = get_user_model()
 class SubscriptionViewSet(viewsets.ModelViewSet):
     queryset = SubscriptionPlan.objects.all()
     serializer_class = SubscriptionSerializer
-    authentication_classes = [TokenAuthentication, SessionAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SessionAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @transaction.atomic
     def perform_create(self, serializer):
         user = self.request.user
         plan = self.request.data.get('plan')
@@ -25,35 +26,14 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
         if not plan:
             raise ValidationError("Plan is required.")
 
-        trainer = None
-        nutritionist = None
-        
-        if plan == 'premium':
-            trainers = User.objects.filter(
-                is_instructor=True, 
-                specialization='trainer'
-            )
-            nutritionists = User.objects.filter(
-                is_instructor=True, 
-                specialization='nutritionist'
-            )
-
-            if trainers.exists():
-                trainer = choice(trainers)
-            if nutritionists.exists():
-                nutritionist = choice(nutritionists)
-
         try:
-            subscription = SubscriptionPlan.objects.get(user=user)
+            subscription = SubscriptionPlan.objects.select_for_update().get(user=user)
             subscription.plan = plan
             subscription.is_active = True
             subscription.start_date = timezone.now()
             subscription.end_date = timezone.now() + timedelta(days=30)
-            
-            if plan == 'premium':
-                subscription.trainer = trainer
-                subscription.nutritionist = nutritionist
-            else:
+
+            if plan != 'premium':
                 subscription.trainer = None
                 subscription.nutritionist = None
 
@@ -65,9 +45,6 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
                 is_active=True
             )
 
-            if plan == 'premium':
-                subscription.trainer = trainer
-                subscription.nutritionist = nutritionist
-                subscription.save()
-
-        return subscription
\ No newline at end of file
+        # Keeps instructors already assigned, fills the rest with the least loaded
+        subscription.assign_instructors()
+        return subscription
@@ -5,11 +5,17 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from rest_framework.authentication import SessionAuthentication
-from knox.auth import TokenAuthentication
-from ..serializers import UserSerializer, CustomUserSerializer
+from ..authentication import CachedTokenAuthentication
+from django.db.models import Q
+from ..models import ChatMessage
+from ..serializers import UserSerializer, CustomUserSerializer, ClientOverviewSerializer
+from ..pagination import InstructorClientPagination
 
 User = get_user_model()
 
+# Most recent messages between instructor and client shown in the overview
+CLIENT_OVERVIEW_MESSAGES = 20
+
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.filter(
         is_superuser=False,
@@ -20,8 +26,8 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
 
 class InstructorViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.filter(is_instructor=True)
-    authentication_classes = [TokenAuthentication, SessionAuthentication]
+    queryset = User.objects.filter(is_instructor=True).with_client_summaries()
+    authentication_classes = [CachedTokenAuthentication, SessionAuthentication]
     serializer_class = CustomUserSerializer
     permission_classes = [AllowAny]
 
@@ -48,6 +54,14 @@ def user_profile(request):
             return Response(serializer.data)
         return Response(serializer.errors, status=400)
 
+def assigned_clients(instructor):
+    """The users subscribed to `instructor`, or None for an unknown specialization."""
+    if instructor.specialization == 'trainer':
+        return User.objects.filter(subscription__trainer=instructor)
+    elif instructor.specialization == 'nutritionist':
+        return User.objects.filter(subscription__nutritionist=instructor)
+    return None
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def instructor_dashboard(request):
@@ -57,19 +71,35 @@ def instructor_dashboard(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    if request.user.specialization == 'trainer':
-        clients = User.objects.filter(subscription__trainer=request.user)
-    elif request.user.specialization == 'nutritionist':
-        clients = User.objects.filter(subscription__nutritionist=request.user)
-    else:
+    clients = assigned_clients(request.user)
+    if clients is None:
         clients = User.objects.none()
-    
-    serializer = CustomUserSerializer(request.user, context={
-        'clients': clients,
+
+    # Clients are paged and searchable with ?search=, ?page= and ?limit=
+    search = request.query_params.get('search', '').strip()
+    if search:
+        clients = clients.filter(
+            Q(username__icontains=search) | Q(email__icontains=search) |
+            Q(first_name__icontains=search) | Q(last_name__icontains=search)
+        )
+    paginator = InstructorClientPagination()
+    page = paginator.paginate_queryset(
+        clients.only('id', 'username', 'email', 'age').order_by('username', 'id'), request
+    )
+
+    instructor = User.objects.filter(pk=request.user.pk).with_client_summaries().prefetch_related(None).get()
+    serializer = CustomUserSerializer(instructor, context={
+        'clients': page,
         'request': request
     })
-    
-    return Response(serializer.data)
+    data = serializer.data
+    data['clients'] = {
+        'count': paginator.page.paginator.count,
+        'next': paginator.get_next_link(),
+        'previous': paginator.get_previous_link(),
+        'results': data['clients'],
+    }
+    return Response(data)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -80,32 +110,62 @@ def client_details(request, client_id):
             status=status.HTTP_403_FORBIDDEN
         )
     
+    clients = assigned_clients(request.user)
+    if clients is None:
+        return Response(
+            {"error": "Invalid instructor specialization"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
     try:
-        if request.user.specialization == 'trainer':
-            client = User.objects.get(
-                id=client_id,
-                subscription__trainer=request.user
-            )
-        elif request.user.specialization == 'nutritionist':
-            client = User.objects.get(
-                id=client_id,
-                subscription__nutritionist=request.user
-            )
-        else:
-            return Response(
-                {"error": "Invalid instructor specialization"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-        serializer = CustomUserSerializer(client)
-        return Response(serializer.data)
-        
+        client = clients.get(id=client_id)
     except User.DoesNotExist:
         return Response(
             {"error": "Client not found or not assigned to you"},
             status=status.HTTP_404_NOT_FOUND
         )
 
+    serializer = CustomUserSerializer(client)
+    return Response(serializer.data)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def client_overview(request, client_id):
+    """
+    Everything an instructor's client screen needs in one response, loaded
+    with a fixed number of queries however many plans or messages exist.
+    """
+    if not request.user.is_instructor:
+        return Response(
+            {"error": "Only instructors can access client details"},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    clients = assigned_clients(request.user)
+    if clients is None:
+        return Response(
+            {"error": "Invalid instructor specialization"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        client = clients.with_client_overview().get(id=client_id)
+    except User.DoesNotExist:
+        return Response(
+            {"error": "Client not found or not assigned to you"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    recent_messages = ChatMessage.objects.filter(
+        Q(sender=request.user, recipient=client) | Q(sender=client, recipient=request.user)
+    ).order_by('-timestamp', '-id')[:CLIENT_OVERVIEW_MESSAGES]
+
+    serializer = ClientOverviewSerializer(client, context={
+        'request': request,
+        'recent_messages': reversed(list(recent_messages)),
+    })
+    return Response(serializer.data)
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def assigned_instructors(request):
@@ -114,10 +174,8 @@ def assigned_instructors(request):
     
     try:
         subscription = user.subscription
-        if subscription.trainer:
-            instructors.append(subscription.trainer)
-        if subscription.nutritionist:
-            instructors.append(subscription.nutritionist)
+        instructor_ids = [pk for pk in (subscription.trainer_id, subscription.nutritionist_id) if pk]
+        instructors = User.objects.filter(pk__in=instructor_ids).with_client_summaries().order_by('-specialization')
     except AttributeError:
         pass
     
@@ -2,6 +2,8 @@
 ASGI config for fitlife project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests are served by Django, websocket connections are routed to the
+chat consumers in ``api.routing``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -13,4 +15,19 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fitlife.settings')
 
-application = get_asgi_application()
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
+from api.middleware import KnoxTokenAuthMiddleware  # noqa: E402
+from api.routing import websocket_urlpatterns  # noqa: E402
+from api.sweeper import start_subscription_sweeper  # noqa: E402
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': AllowedHostsOriginValidator(
+        KnoxTokenAuthMiddleware(URLRouter(websocket_urlpatterns))
+    ),
+})
+
+start_subscription_sweeper()
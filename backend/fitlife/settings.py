@@ -33,6 +33,7 @@ ALLOWED_HOSTS = []
 # Application definition
 
 INSTALLED_APPS = [
+    'daphne',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -45,6 +46,7 @@ INSTALLED_APPS = [
     'knox',
     'django_rest_passwordreset',
     'rest_framework.authtoken',
+    'channels',
     
 ]
 
@@ -78,9 +80,20 @@ CORS_ALLOWED_ORIGINS = [
 AUTH_USER_MODEL = 'api.CustomUser'
 
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
     'api.auth_backend.EmailAuthBackend'
 ]
+
+# The first hasher is used for new passwords; existing hashes are upgraded to
+# it on the user's next successful login. ScryptPasswordHasher is memory-hard
+# and much cheaper in CPU per login than PBKDF2 at Django's iteration count;
+# move it to the top to switch.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
 ROOT_URLCONF = 'fitlife.urls'
 
 TEMPLATES = [
@@ -99,10 +112,20 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'fitlife.wsgi.application'
+ASGI_APPLICATION = 'fitlife.asgi.application'
+
+# Channel layer used to push chat events to websocket clients.
+# The in-memory layer only reaches consumers in the same process; point this
+# at channels_redis.core.RedisChannelLayer when running several workers.
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+    },
+}
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'knox.auth.TokenAuthentication',  # Use Knox specifically
+        'api.authentication.CachedTokenAuthentication',  # Knox tokens, cached in-process
         'rest_framework.authentication.TokenAuthentication',
     ),
     
@@ -130,6 +153,57 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory by default; point 'default' at Redis/Memcached to share the
+# cache between workers.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'fitlife',
+    }
+}
+
+# Response cache of the read-mostly catalogue endpoints (see api/cache.py)
+CATALOGUE_CACHE_ALIAS = 'default'
+CATALOGUE_CACHE_TIMEOUT = 300
+
+# In-process cache of validated Knox tokens (see api/authentication.py). The
+# TTL bounds how long another worker may accept a token revoked elsewhere.
+AUTH_TOKEN_CACHE_TTL = 60
+AUTH_TOKEN_CACHE_MAX_ENTRIES = 10000
+
+# Most active clients an instructor is assigned automatically, per
+# specialization; None means unlimited (see api/models/subscription.py)
+INSTRUCTOR_CLIENT_CAPACITY = {
+    'trainer': None,
+    'nutritionist': None,
+}
+
+# Seconds between in-process subscription expiry sweeps (see api/sweeper.py);
+# None disables them, e.g. when `manage.py expire_subscriptions` runs from cron
+SUBSCRIPTION_SWEEP_INTERVAL = 300
+
+# Least seconds between recomputes of a stale admin dashboard snapshot when it
+# is read (see api/models/dashboard.py); writes only mark it stale
+DASHBOARD_REFRESH_INTERVAL = 60
+
+# Widths of the WebP variants built for uploaded images (see api/images.py)
+IMAGE_VARIANT_WIDTHS = (160, 320, 640, 1280)
+IMAGE_VARIANT_QUALITY = 80
+
+# Logins beyond this many active tokens per user revoke the oldest ones
+AUTH_TOKEN_LIMIT_PER_USER = 10
+
+# Days to keep aged rows before `manage.py purge_expired_data` removes them
+# (see api/retention.py). Expired auth and password reset tokens always go;
+# subscription events are kept, as the subscription rollups are rebuilt from them.
+DATA_RETENTION_DAYS = {
+    'activity_events': 365,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -185,4 +259,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 CSRF_TRUSTED_ORIGINS = ['http://localhost:5173']
 
 MEDIA_URL  = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# Uploads are named by content hash and shared between identical files
+# (see api/storage.py)
+STORAGES = {
+    'default': {'BACKEND': 'api.storage.ContentAddressedStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# Browser cache lifetime of media stored before content addressing; hashed
+# files are cached forever. Set MEDIA_SENDFILE_HEADER (e.g. 'X-Accel-Redirect')
+# to let the front web server send the files from MEDIA_SENDFILE_PREFIX.
+MEDIA_CACHE_MAX_AGE = 3600
+MEDIA_SENDFILE_HEADER = None
+MEDIA_SENDFILE_PREFIX = '/protected-media/'
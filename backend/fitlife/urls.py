@@ -15,10 +15,10 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from knox import views as knox_views
 from django.conf import settings
-from django.conf.urls.static import static
+from api.views import serve_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -28,6 +28,7 @@ urlpatterns = [
     path('logoutall/', knox_views.LogoutAllView.as_view(), name= 'knox_logoutall'),
     path('api/password_reset/', include('django_rest_passwordreset.urls', namespace='password_reset')),
 ]
-# serve media in development
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+# Uploaded media, with immutable caching and range support (see api/views/media.py)
+urlpatterns += [
+    re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+]
\ No newline at end of file
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fitlife.settings')
 
 application = get_wsgi_application()
+
+from api.sweeper import start_subscription_sweeper  # noqa: E402
+
+start_subscription_sweeper()
@@ -5,6 +5,8 @@ import AxiosInstance from "../../components/Axiosinstance";
 
 const ExerciseManagement = () => {
   const [exercises, setExercises] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [search, setSearch] = useState("");
   const [newExercise, setNewExercise] = useState({ 
     name: "", 
     description: "",
@@ -23,11 +25,13 @@ const ExerciseManagement = () => {
     fetchExercises();
   }, []);
 
-  const fetchExercises = async () => {
+  // The list is paged: { count, next, previous, results }
+  const fetchExercises = async (url = 'api/exercises/', append = false) => {
     try {
       setIsLoading(true);
-      const response = await AxiosInstance.get('api/exercises/');
-      setExercises(response.data);
+      const response = await AxiosInstance.get(url);
+      setExercises(previous => (append ? [...previous, ...response.data.results] : response.data.results));
+      setNextPage(response.data.next);
       setIsLoading(false);
     } catch (error) {
       console.error("Error fetching exercises:", error);
@@ -36,6 +40,12 @@ const ExerciseManagement = () => {
     }
   };
 
+  const handleSearch = (e) => {
+    e.preventDefault();
+    const query = search.trim();
+    fetchExercises(query ? `api/exercises/?search=${encodeURIComponent(query)}` : 'api/exercises/');
+  };
+
   const showNotification = (message, type) => {
     setNotification({ show: true, message, type });
     setTimeout(() => setNotification({ show: false, message: "", type: "" }), 3000);
@@ -447,6 +457,16 @@ const ExerciseManagement = () => {
         </div>
       )}
 
+      <form className="catalogue-search" onSubmit={handleSearch}>
+        <input
+          type="search"
+          placeholder="Search exercises by name"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+        />
+        <button type="submit" className="submit-btn">Search</button>
+      </form>
+
       <div className="exercises-table-container">
         {isLoading ? (
           <div className="loading-message">Loading exercises...</div>
@@ -504,6 +524,12 @@ const ExerciseManagement = () => {
           </table>
         )}
       </div>
+
+      {nextPage && (
+        <button className="submit-btn load-more" onClick={() => fetchExercises(nextPage, true)}>
+          Load more exercises
+        </button>
+      )}
     </div>
   );
 };
@@ -5,6 +5,8 @@ import AxiosInstance from "../../components/Axiosinstance";
 
 const FoodManagement = () => {
   const [foodItems, setFoodItems] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [search, setSearch] = useState("");
   const [newItem, setNewItem] = useState({ 
     name: "", 
     food_type: "", 
@@ -23,11 +25,13 @@ const FoodManagement = () => {
     fetchFoodItems();
   }, []);
 
-  const fetchFoodItems = async () => {
+  // The list is paged: { count, next, previous, results }
+  const fetchFoodItems = async (url = 'api/foods/', append = false) => {
     try {
       setIsLoading(true);
-      const response = await AxiosInstance.get('api/foods/');
-      setFoodItems(response.data);
+      const response = await AxiosInstance.get(url);
+      setFoodItems(previous => (append ? [...previous, ...response.data.results] : response.data.results));
+      setNextPage(response.data.next);
       setIsLoading(false);
     } catch (error) {
       console.error("Error fetching food items:", error);
@@ -36,6 +40,12 @@ const FoodManagement = () => {
     }
   };
 
+  const handleSearch = (e) => {
+    e.preventDefault();
+    const query = search.trim();
+    fetchFoodItems(query ? `api/foods/?search=${encodeURIComponent(query)}` : 'api/foods/');
+  };
+
   const showNotification = (message, type) => {
     setNotification({ show: true, message, type });
     setTimeout(() => setNotification({ show: false, message: "", type: "" }), 3000);
@@ -416,6 +426,16 @@ const FoodManagement = () => {
         </div>
       )}
 
+      <form className="catalogue-search" onSubmit={handleSearch}>
+        <input
+          type="search"
+          placeholder="Search foods by name"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+        />
+        <button type="submit" className="submit-btn">Search</button>
+      </form>
+
       <div className="food-table-container">
         {isLoading ? (
           <div className="loading-message">Loading food items...</div>
@@ -477,6 +497,12 @@ const FoodManagement = () => {
           </table>
         )}
       </div>
+
+      {nextPage && (
+        <button className="submit-btn load-more" onClick={() => fetchFoodItems(nextPage, true)}>
+          Load more foods
+        </button>
+      )}
     </div>
   );
 };
@@ -1,11 +1,11 @@
 import React, { useState, useEffect } from "react";
 import { FaEdit, FaTrash, FaPlus, FaMinus } from "react-icons/fa";
 import AxiosInstance from "../../components/Axiosinstance";
+import CatalogueSelect from "../../components/CatalogueSelect";
 import "../../CSS/MealManagement.css";
 
 const MealManagement = () => {
   const [mealPlans, setMealPlans] = useState([]);
-  const [foods, setFoods] = useState([]);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
 
@@ -71,20 +71,9 @@ const MealManagement = () => {
     }
   };
 
-  const fetchFoods = async () => {
-    try {
-      const response = await AxiosInstance.get("api/foods/");
-      setFoods(response.data);
-    } catch (err) {
-      setError("Failed to fetch foods.");
-      showNotification("Failed to fetch foods.", "error");
-    }
-  };
-
   // Fetch data on component mount
   useEffect(() => {
     fetchMealPlans();
-    fetchFoods();
   }, []);
 
   // Handle input changes
@@ -318,19 +307,14 @@ const MealManagement = () => {
                   <div className="form-grid">
                     <div className="form-group">
                       <label>Food *</label>
-                      <select
+                      <CatalogueSelect
+                        endpoint="api/foods/"
                         name="food_id"
                         value={mealFood.food_id}
                         onChange={(e) => handleMealFoodChange(index, e)}
+                        placeholder="Select Food"
                         required
-                      >
-                        <option value="">Select Food</option>
-                        {foods.map((food) => (
-                          <option key={food.id} value={food.id}>
-                            {food.name}
-                          </option>
-                        ))}
-                      </select>
+                      />
                     </div>
                     <div className="form-group">
                       <label>Meal Time *</label>
@@ -1,11 +1,11 @@
 import React, { useState, useEffect } from "react";
 import { FaEdit, FaTrash, FaPlus, FaMinus } from "react-icons/fa";
 import AxiosInstance from "../../components/Axiosinstance";
+import CatalogueSelect from "../../components/CatalogueSelect";
 import "../../CSS/PlanManagement.css";
 
 const PlanManagement = () => {
   const [fitnessPlans, setFitnessPlans] = useState([]);
-  const [exercises, setExercises] = useState([]);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
 
@@ -68,20 +68,9 @@ const PlanManagement = () => {
     }
   };
 
-  const fetchExercises = async () => {
-    try {
-      const response = await AxiosInstance.get("api/exercises/");
-      setExercises(response.data);
-    } catch (err) {
-      setError("Failed to fetch exercises.");
-      showNotification("Failed to fetch exercises.", "error");
-    }
-  };
-
   // Fetch data on component mount
   useEffect(() => {
     fetchFitnessPlans();
-    fetchExercises();
   }, []);
 
   // Handle input changes
@@ -154,7 +143,7 @@ const PlanManagement = () => {
       
       // Append exercises as JSON string
       const exercisesData = newFitnessPlan.exercises.map(ex => ({
-        exercise: Number(ex.exercise_id),
+        exercise_id: Number(ex.exercise_id),
         day: ex.day,
         sets: ex.sets === "" ? 0 : Number(ex.sets),
         reps: ex.reps === "" ? 0 : Number(ex.reps),
@@ -320,19 +309,14 @@ const PlanManagement = () => {
                   <div className="form-grid">
                     <div className="form-group">
                       <label>Exercise *</label>
-                      <select
+                      <CatalogueSelect
+                        endpoint="api/exercises/"
                         name="exercise_id"
                         value={exercise.exercise_id}
                         onChange={(e) => handleExerciseChange(index, e)}
+                        placeholder="Select Exercise"
                         required
-                      >
-                        <option value="">Select Exercise</option>
-                        {exercises.map((ex) => (
-                          <option key={ex.id} value={ex.id}>
-                            {ex.name}
-                          </option>
-                        ))}
-                      </select>
+                      />
                     </div>
                     <div className="form-group">
                       <label>Day *</label>
@@ -8,6 +8,7 @@ import {
   FaTrophy,
 } from "react-icons/fa";
 import AxiosInstance from "../components/Axiosinstance";
+import ResponsiveImage from "../components/ResponsiveImage";
 import "../CSS/Challenge.css";
 import { useNavigate } from "react-router-dom"; 
 
@@ -192,8 +193,9 @@ const Challenge = () => {
                 >
                   <div className="card-header">
                     {challenge.image_url && (
-                      <img
+                      <ResponsiveImage
                         src={challenge.image_url}
+                        srcset={challenge.image_srcset}
                         alt={challenge.title}
                         className="challenge-image"
                       />
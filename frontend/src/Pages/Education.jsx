@@ -10,6 +10,7 @@ import {
   FaSpinner
 } from "react-icons/fa";
 import AxiosInstance from "../components/Axiosinstance";
+import ResponsiveImage from "../components/ResponsiveImage";
 import { useNavigate } from "react-router-dom";
 import "../CSS/Education.css";
 
@@ -97,11 +98,13 @@ const Education = () => {
     <div className="content-card">
       <div className="card-image">
         {item.thumbnail_url ? (
-          <img 
-            src={item.thumbnail_url} 
+          <ResponsiveImage
+            src={item.thumbnail_url}
+            srcset={item.thumbnail_srcset}
             alt={item.title}
             onError={(e) => {
               e.target.onerror = null;
+              e.target.srcset = "";
               e.target.src = "https://via.placeholder.com/300x200?text=No+Thumbnail";
             }}
           />
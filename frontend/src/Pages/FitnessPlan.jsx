@@ -1,6 +1,7 @@
 import { useState, useEffect } from "react";
 import { FaDumbbell, FaCalendarAlt, FaHeartbeat, FaRunning } from "react-icons/fa";
 import AxiosInstance from "../components/Axiosinstance";
+import ResponsiveImage from "../components/ResponsiveImage";
 import { useNavigate } from "react-router-dom";
 import "../CSS/FitnessPlan.css";
 
@@ -217,8 +218,9 @@ const FitnessPlan = () => {
               >
                 {plan.imageUrl && (
                   <div className="card-image-container">
-                    <img
+                    <ResponsiveImage
                       src={plan.imageUrl}
+                      srcset={plan.picture_srcset}
                       alt={plan.name || plan.title || "Fitness plan"}
                       className="fitness-image"
                       onError={(e) => {
@@ -16,9 +16,43 @@ import "../CSS/Instructor.css";
 const Instructor = () => {
   const navigate = useNavigate();
   const [instructorData, setInstructorData] = useState(null);
+  const [clients, setClients] = useState([]);
+  const [clientsNext, setClientsNext] = useState(null);
+  const [clientSearch, setClientSearch] = useState("");
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
 
+  const normalizeClients = (results = []) =>
+    results.map(client => ({
+      ...client,
+      username: client.username || '',
+      email: client.email || '',
+      age: client.age || null
+    }));
+
+  // The dashboard pages its client list: { count, next, previous, results }
+  const loadClients = async (url, append = false) => {
+    try {
+      const response = await AxiosInstance.get(url);
+      const page = response.data.clients || {};
+      const results = normalizeClients(page.results);
+      setClients(previous => (append ? [...previous, ...results] : results));
+      setClientsNext(page.next || null);
+    } catch (err) {
+      setError(err.response?.data?.error || err.message || "Failed to fetch clients");
+    }
+  };
+
+  const handleClientSearch = (e) => {
+    e.preventDefault();
+    const query = clientSearch.trim();
+    loadClients(
+      query
+        ? `/api/instructor/dashboard/?search=${encodeURIComponent(query)}`
+        : '/api/instructor/dashboard/'
+    );
+  };
+
   useEffect(() => {
     const fetchInstructorData = async () => {
       try {
@@ -32,15 +66,10 @@ const Instructor = () => {
 
         const response = await AxiosInstance.get('/api/instructor/dashboard/');
         
-        setInstructorData({
-          ...response.data,
-          clients: (response.data.clients || []).map(client => ({
-            ...client,
-            username: client.username || '',
-            email: client.email || '',
-            age: client.age || null
-          }))
-        });
+        const { clients: clientPage = {}, ...profile } = response.data;
+        setInstructorData(profile);
+        setClients(normalizeClients(clientPage.results));
+        setClientsNext(clientPage.next || null);
       } catch (err) {
         const errorMessage = err.response?.data?.error || 
                            err.message || 
@@ -190,11 +219,20 @@ const Instructor = () => {
         </button>
       </div>
 
-      {instructorData.clients?.length > 0 && (
+      {instructorData.assigned_clients_count > 0 && (
         <div className="clients-section">
           <h3>Your Clients</h3>
+          <form className="clients-search" onSubmit={handleClientSearch}>
+            <input
+              type="search"
+              placeholder="Search clients by name or email"
+              value={clientSearch}
+              onChange={(e) => setClientSearch(e.target.value)}
+            />
+            <button type="submit" className="btn">Search</button>
+          </form>
           <div className="clients-list">
-            {instructorData.clients.map((client) => (
+            {clients.map((client) => (
               <div key={client.id} className="client-card">
                 <div className="client-info">
                   <h4>{client.username}</h4>
@@ -202,7 +240,13 @@ const Instructor = () => {
                 </div>
               </div>
             ))}
+            {clients.length === 0 && <p>No clients match your search.</p>}
           </div>
+          {clientsNext && (
+            <button className="btn" onClick={() => loadClients(clientsNext, true)}>
+              Load more clients
+            </button>
+          )}
         </div>
       )}
     </div>
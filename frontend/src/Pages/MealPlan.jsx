@@ -1,6 +1,7 @@
 import { useState, useEffect } from "react";
 import { FaUtensils, FaCalendarAlt, FaFire, FaLeaf, FaHamburger } from "react-icons/fa";
 import AxiosInstance from "../components/Axiosinstance";
+import ResponsiveImage from "../components/ResponsiveImage";
 import { useNavigate } from "react-router-dom";
 import "../CSS/MealPlan.css";
 
@@ -164,8 +165,9 @@ const MealPlan = () => {
               >
                 {plan.imageUrl && (
                   <div className="card-image-container">
-                    <img
+                    <ResponsiveImage
                       src={plan.imageUrl}
+                      srcset={plan.image_srcset}
                       alt={plan.name || "Meal plan"}
                       className="fitness-image"
                       onError={(e) => {
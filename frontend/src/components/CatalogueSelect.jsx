@@ -0,0 +1,54 @@
+import React, { useState, useEffect } from 'react';
+import AxiosInstance from './Axiosinstance';
+import '../CSS/CatalogueSelect.css';
+
+// Catalogue lists are paged, so the picker searches them by name instead of
+// loading every row: the select offers the first matches of what is typed.
+const CatalogueSelect = ({ endpoint, name, value, onChange, placeholder, required }) => {
+  const [search, setSearch] = useState('');
+  const [options, setOptions] = useState([]);
+  const [selected, setSelected] = useState(null);
+
+  useEffect(() => {
+    const timer = setTimeout(async () => {
+      try {
+        const response = await AxiosInstance.get(endpoint, { params: { search, limit: 20 } });
+        setOptions(response.data.results);
+      } catch (err) {
+        console.error(`Failed to search ${endpoint}:`, err);
+      }
+    }, 300);
+    return () => clearTimeout(timer);
+  }, [endpoint, search]);
+
+  const handleChange = (e) => {
+    setSelected(options.find((option) => String(option.id) === e.target.value) || null);
+    onChange(e);
+  };
+
+  // Keep the chosen row listed when a later search no longer matches it
+  const shown = selected && String(selected.id) === String(value) && !options.some((option) => option.id === selected.id)
+    ? [selected, ...options]
+    : options;
+
+  return (
+    <div className="catalogue-select">
+      <input
+        type="search"
+        placeholder="Search by name"
+        value={search}
+        onChange={(e) => setSearch(e.target.value)}
+      />
+      <select name={name} value={value} onChange={handleChange} required={required}>
+        <option value="">{placeholder}</option>
+        {shown.map((option) => (
+          <option key={option.id} value={option.id}>
+            {option.name}
+          </option>
+        ))}
+      </select>
+    </div>
+  );
+};
+
+export default CatalogueSelect;
@@ -16,11 +16,43 @@ const Chat = ({ selectedUser, currentUser }) => {
     }
   }, [selectedUser]);
 
+  // New messages and read receipts are pushed over the chat websocket.
+  useEffect(() => {
+    if (!selectedUser) return;
+
+    const token = localStorage.getItem('authToken');
+    const socket = new WebSocket(`ws://127.0.0.1:8000/ws/chat/?token=${token}`);
+
+    socket.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      if (data.type === 'message') {
+        const msg = data.message;
+        if (msg.sender === selectedUser.id || msg.recipient === selectedUser.id) {
+          addMessage(msg);
+        }
+      } else if (data.type === 'read') {
+        setMessages((prev) => prev.map((msg) => (
+          data.message_ids.includes(msg.id) ||
+          (!data.message_ids.length && msg.sender === data.sender && msg.recipient === data.reader &&
+            (data.up_to == null || msg.id <= data.up_to))
+            ? { ...msg, is_read: true }
+            : msg
+        )));
+      }
+    };
+
+    return () => socket.close();
+  }, [selectedUser]);
+
+  const addMessage = (msg) => {
+    setMessages((prev) => (prev.some((m) => m.id === msg.id) ? prev : [...prev, msg]));
+  };
+
   const fetchMessages = async () => {
     try {
       setLoading(true);
       const response = await AxiosInstance.get(`/api/chat/messages/?other_user=${selectedUser.id}`);
-      setMessages(response.data);
+      setMessages(response.data.results);
       markMessagesAsRead();
     } catch (err) {
       setError(err.response?.data?.message || 'Failed to load messages');
@@ -30,16 +62,10 @@ const Chat = ({ selectedUser, currentUser }) => {
   };
 
   const markMessagesAsRead = async () => {
-    const unreadMessages = messages.filter(
-      msg => msg.recipient.id === currentUser.id && !msg.is_read
-    );
-    
-    for (const msg of unreadMessages) {
-      try {
-        await AxiosInstance.patch(`/api/chat/messages/${msg.id}/read/`);
-      } catch (err) {
-        console.error('Failed to mark message as read:', err);
-      }
+    try {
+      await AxiosInstance.post(`/api/chat/conversations/${selectedUser.id}/read/`);
+    } catch (err) {
+      console.error('Failed to mark messages as read:', err);
     }
   };
 
@@ -53,7 +79,7 @@ const Chat = ({ selectedUser, currentUser }) => {
         message: newMessage
       });
       
-      setMessages([...messages, response.data]);
+      addMessage(response.data);
       setNewMessage('');
       scrollToBottom();
     } catch (err) {
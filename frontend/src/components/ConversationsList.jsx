@@ -45,7 +45,7 @@ const ConversationsList = ({ onSelectUser, currentUser }) => {
         </div>
       ) : (
         <ul>
-          {conversations.map((user) => (
+          {conversations.map(({ user, last_message: lastMessage, unread_count: unreadCount }) => (
             <li key={user.id} onClick={() => onSelectUser(user)}>
               <div className="user-avatar">
                 {user.profile_picture ? (
@@ -58,8 +58,9 @@ const ConversationsList = ({ onSelectUser, currentUser }) => {
               </div>
               <div className="user-info">
                 <h4>{user.username}</h4>
-                <p>{user.specialization || 'Client'}</p>
+                <p>{lastMessage ? lastMessage.message : (user.specialization || 'Client')}</p>
               </div>
+              {unreadCount > 0 && <span className="unread-badge">{unreadCount}</span>}
             </li>
           ))}
         </ul>
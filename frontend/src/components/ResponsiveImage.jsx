@@ -0,0 +1,22 @@
+import React from "react";
+
+// Renders an <img> that lets the browser pick the smallest fitting WebP
+// variant from an API `*_srcset` map ({ "160w": url, "320w": url, ... }).
+const ResponsiveImage = ({ src, srcset, sizes = "(max-width: 600px) 100vw, 320px", ...props }) => {
+  const srcSet = srcset
+    ? Object.entries(srcset).map(([width, url]) => `${url} ${width}`).join(", ")
+    : undefined;
+
+  return (
+    <img
+      src={src}
+      srcSet={srcSet}
+      sizes={srcSet ? sizes : undefined}
+      loading="lazy"
+      decoding="async"
+      {...props}
+    />
+  );
+};
+
+export default ResponsiveImage;